@@ -0,0 +1,266 @@
+"""
+Експорт геометрії фракталів "Дерево Піфагора" у файли.
+
+Сегменти (task2a, масив (N, 2, 2)) та квадрати (task2b, масив дерева)
+записуються у SVG, у двійкові формати NumPy (.npy/.npz із завантаженням
+через numpy.memmap) та в текстові таблиці. Дані форматуються великими
+порціями однією операцією форматування рядка на порцію, а не по одному
+елементу, і пишуться через буферизований файл, тож дерево з мільйоном
+примітивів експортується за секунди.
+
+Замість масиву можна передати ітератор порцій (наприклад, task2a.iter_tree_segments),
+тоді файл записується потоково без побудови всього дерева в пам'яті.
+"""
+import struct
+from typing import Dict, Iterable, Iterator, Optional, Sequence, Union
+import zipfile
+
+import matplotlib
+from matplotlib.colors import to_hex
+import numpy as np
+from numpy.lib import recfunctions
+
+import raster
+
+# Кількість примітивів, що форматуються за один крок
+EXPORT_CHUNK = 65536
+# Розмір буфера запису у файл
+BUFFER_SIZE = 1 << 20
+
+Data = Union[np.ndarray, Iterable[np.ndarray]]
+
+def _chunks(data: Data, chunk_size: int) -> Iterator[np.ndarray]:
+    """Розбиває масив (або потік порцій) на порції не більше chunk_size рядків."""
+    if chunk_size < 1:
+        raise ValueError("Розмір порції має бути більше нуля")
+    parts = (data,) if isinstance(data, np.ndarray) else data
+    for part in parts:
+        for start in range(0, len(part), chunk_size):
+            yield part[start:start + chunk_size]
+
+def _rows(chunk: np.ndarray) -> np.ndarray:
+    """Подає порцію як двовимірну таблицю чисел (структуровані поля стають колонками)."""
+    if chunk.dtype.names:
+        chunk = recfunctions.structured_to_unstructured(chunk, dtype=float)
+    return chunk.reshape(len(chunk), -1)
+
+def _format_rows(rows: np.ndarray, row_format: str) -> str:
+    """Форматує всю порцію одним зверненням до оператора % замість циклу по рядках."""
+    return (row_format * len(rows)) % tuple(rows.ravel().tolist())
+
+def _svg_header(bounds: raster.Bounds, margin: float) -> str:
+    """Початок SVG-документа з viewBox, що охоплює межі сцени з відступом."""
+    xmin, ymin, xmax, ymax = bounds
+    pad = max(xmax - xmin, ymax - ymin, 1e-12) * margin
+    width = xmax - xmin + 2 * pad
+    height = ymax - ymin + 2 * pad
+    # Вісь Y в SVG спрямована вниз, тому геометрія віддзеркалюється через scale(1, -1)
+    return ('<?xml version="1.0" encoding="UTF-8"?>\n'
+            f'<svg xmlns="http://www.w3.org/2000/svg" viewBox="{xmin - pad:g} {-ymax - pad:g} '
+            f'{width:g} {height:g}">\n')
+
+def save_segments_svg(segments: Data, filename: str, bounds: Optional[raster.Bounds] = None,
+                      color: str = "#a52a2a", stroke_width: float = 1.0, precision: int = 3,
+                      margin: float = 0.02, chunk_size: int = EXPORT_CHUNK) -> None:
+    """
+    Записує сегменти у SVG: один елемент <path> на порцію сегментів.
+
+    Args:
+        segments (Data): Масив сегментів (N, 2, 2) або ітератор таких порцій.
+        filename (str): Шлях до вихідного SVG-файлу.
+        bounds (Optional[raster.Bounds]): Межі сцени; для масиву обчислюються за даними,
+            для ітератора обов'язкові.
+        color (str): Колір ліній.
+        stroke_width (float): Товщина ліній у пікселях (не залежить від масштабу).
+        precision (int): Кількість знаків після коми в координатах.
+        margin (float): Відступ від країв у частках розміру сцени.
+        chunk_size (int): Кількість сегментів в одному елементі <path>.
+    """
+    if bounds is None:
+        if not isinstance(segments, np.ndarray):
+            raise ValueError("Для потоку порцій межі сцени мають бути задані явно")
+        bounds = raster.segments_bounds(segments) if len(segments) else (0.0, 0.0, 1.0, 1.0)
+    row_format = f"M%.{precision}f %.{precision}fL%.{precision}f %.{precision}f"
+    with open(filename, "w", encoding="utf-8", buffering=BUFFER_SIZE) as file:
+        file.write(_svg_header(bounds, margin))
+        file.write(f'<g transform="scale(1,-1)" fill="none" stroke="{color}" '
+                   f'stroke-width="{stroke_width:g}">\n')
+        for chunk in _chunks(segments, chunk_size):
+            # vector-effect не успадковується, тому задається для кожного елемента
+            file.write('<path vector-effect="non-scaling-stroke" d="')
+            file.write(_format_rows(_rows(chunk), row_format))
+            file.write('"/>\n')
+        file.write("</g>\n</svg>\n")
+
+def save_squares_svg(pt_array: np.ndarray, filename: str, colormap_name: str = "summer",
+                     precision: int = 4, margin: float = 0.02,
+                     max_level: Optional[int] = None, chunk_size: int = EXPORT_CHUNK) -> None:
+    """
+    Записує квадрати дерева Піфагора у SVG.
+
+    Квадрати порції одного рівня мають однаковий колір, тож записуються
+    одним елементом <path> з підконтурами "M ... Z". Рівні йдуть за зростанням,
+    як і в масиві дерева, тому глибші квадрати малюються поверх.
+
+    Args:
+        pt_array (np.ndarray): Масив дерева (матриця (N, 5) або структурований, зокрема memmap).
+        filename (str): Шлях до вихідного SVG-файлу.
+        colormap_name (str): Назва колірної схеми matplotlib.
+        precision (int): Кількість знаків після коми в координатах.
+        margin (float): Відступ від країв у частках розміру сцени.
+        max_level (Optional[int]): Найглибший рівень для шкали кольорів; за замовчуванням
+            береться з даних.
+        chunk_size (int): Кількість квадратів, що форматуються за один крок.
+    """
+    levels = raster.tree_columns(pt_array)[4]
+    if max_level is None:
+        max_level = int(levels.max()) if len(levels) else 0
+    bounds = (raster.segments_bounds(raster.square_corners(pt_array)) if len(pt_array)
+              else (0.0, 0.0, 1.0, 1.0))
+    colormap = matplotlib.colormaps[colormap_name]
+    row_format = "M" + "L".join([f"%.{precision}f %.{precision}f"] * 4) + "Z"
+
+    with open(filename, "w", encoding="utf-8", buffering=BUFFER_SIZE) as file:
+        file.write(_svg_header(bounds, margin))
+        file.write('<g transform="scale(1,-1)" stroke="none">\n')
+        for chunk in _chunks(pt_array, chunk_size):
+            corners = raster.square_corners(chunk)
+            chunk_levels = raster.tree_columns(chunk)[4]
+            for level in np.unique(chunk_levels):
+                color = to_hex(colormap(1.0 - float(level) / (max_level + 1)))
+                file.write(f'<path fill="{color}" d="')
+                file.write(_format_rows(corners[chunk_levels == level].reshape(-1, 8), row_format))
+                file.write('"/>\n')
+        file.write("</g>\n</svg>\n")
+
+def save_text(data: Data, filename: str, fmt: str = "%.6g", delimiter: str = " ",
+              header: Optional[Sequence[str]] = None, chunk_size: int = EXPORT_CHUNK) -> None:
+    """
+    Записує масив (або потік порцій) у текстову таблицю, рядок на примітив.
+
+    Сегмент (2, 2) стає рядком "x0 y0 x1 y1", рядок дерева - "x y кут розмір рівень".
+
+    Args:
+        data (Data): Масив або ітератор порцій.
+        filename (str): Шлях до вихідного файлу.
+        fmt (str): Формат одного числа.
+        delimiter (str): Роздільник колонок (наприклад, "," для CSV).
+        header (Optional[Sequence[str]]): Назви колонок для першого рядка.
+        chunk_size (int): Кількість рядків, що форматуються за один крок.
+    """
+    row_format = None
+    with open(filename, "w", encoding="utf-8", buffering=BUFFER_SIZE) as file:
+        if header is not None:
+            file.write(delimiter.join(header) + "\n")
+        for chunk in _chunks(data, chunk_size):
+            rows = _rows(chunk)
+            if row_format is None:
+                row_format = delimiter.join([fmt] * rows.shape[1]) + "\n"
+            file.write(_format_rows(rows, row_format))
+
+def save_npy(data: Data, filename: str, count: Optional[int] = None) -> None:
+    """
+    Записує масив у файл .npy, придатний для завантаження через numpy.memmap.
+
+    Потік порцій записується в заздалегідь створений файл (np.lib.format.open_memmap)
+    без побудови всього масиву в пам'яті; для цього потрібна загальна кількість рядків.
+
+    Args:
+        data (Data): Масив або ітератор порцій однакового типу та форми рядка.
+        filename (str): Шлях до вихідного .npy-файлу.
+        count (Optional[int]): Загальна кількість рядків потоку.
+    """
+    if isinstance(data, np.ndarray):
+        np.save(filename, data)
+        return
+    if count is None:
+        raise ValueError("Для потоку порцій потрібна загальна кількість рядків")
+
+    target = None
+    offset = 0
+    for chunk in data:
+        if target is None:
+            target = np.lib.format.open_memmap(filename, mode="w+", dtype=chunk.dtype,
+                                               shape=(count,) + chunk.shape[1:])
+        if offset + len(chunk) > count:
+            raise ValueError("Потік містить більше рядків, ніж вказано в count")
+        target[offset:offset + len(chunk)] = chunk
+        offset += len(chunk)
+    if target is None:
+        raise ValueError("Потік порцій порожній")
+    if offset != count:
+        raise ValueError(f"Потік містить {offset} рядків замість {count}")
+    target.flush()
+
+def load_npy(filename: str, mmap: bool = True) -> np.ndarray:
+    """
+    Завантажує масив з файлу .npy; за замовчуванням як numpy.memmap лише для читання.
+
+    Args:
+        filename (str): Шлях до .npy-файлу.
+        mmap (bool): Відобразити файл у пам'ять замість читання повністю.
+
+    Returns:
+        np.ndarray: Масив.
+    """
+    return np.load(filename, mmap_mode="r" if mmap else None)
+
+def save_npz(filename: str, compressed: bool = False, **arrays: np.ndarray) -> None:
+    """
+    Записує кілька масивів (наприклад, сегменти та параметри побудови) в архів .npz.
+
+    Нестиснений архів можна завантажити через load_npz з відображенням у пам'ять.
+
+    Args:
+        filename (str): Шлях до вихідного .npz-файлу.
+        compressed (bool): Стиснути архів (менший файл, але без memmap при читанні).
+        **arrays (np.ndarray): Іменовані масиви.
+    """
+    (np.savez_compressed if compressed else np.savez)(filename, **arrays)
+
+def _member_memmap(filename: str, info: zipfile.ZipInfo) -> Optional[np.ndarray]:
+    """Відображає нестиснений член архіву .npz у пам'ять або повертає None, якщо це неможливо."""
+    if info.compress_type != zipfile.ZIP_STORED:
+        return None
+    with open(filename, "rb") as file:
+        file.seek(info.header_offset)
+        local_header = file.read(30)
+        name_length, extra_length = struct.unpack("<HH", local_header[26:30])
+        file.seek(info.header_offset + 30 + name_length + extra_length)
+        version = np.lib.format.read_magic(file)
+        if version == (1, 0):
+            shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(file)
+        elif version == (2, 0):
+            shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(file)
+        else:
+            return None
+        offset = file.tell()
+    if dtype.hasobject:
+        return None
+    return np.memmap(filename, dtype=dtype, mode="r", shape=shape,
+                     order="F" if fortran_order else "C", offset=offset)
+
+def load_npz(filename: str, mmap: bool = True) -> Dict[str, np.ndarray]:
+    """
+    Завантажує масиви з архіву .npz.
+
+    На відміну від np.load, нестиснені члени архіву відображаються в пам'ять
+    (numpy.memmap) напряму з файлу, тож великі масиви не читаються повністю.
+    Стиснені члени читаються звичайним способом.
+
+    Args:
+        filename (str): Шлях до .npz-файлу.
+        mmap (bool): Відображати нестиснені масиви в пам'ять.
+
+    Returns:
+        Dict[str, np.ndarray]: Масиви за іменами.
+    """
+    result = {}
+    with zipfile.ZipFile(filename) as archive:
+        members = archive.infolist()
+    with np.load(filename) as npz:
+        for info in members:
+            name = info.filename[:-4] if info.filename.endswith(".npy") else info.filename
+            array = _member_memmap(filename, info) if mmap else None
+            result[name] = npz[name] if array is None else array
+    return result
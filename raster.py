@@ -0,0 +1,394 @@
+"""
+Безголовий (без вікна та без об'єктів matplotlib на кожен примітив) растеризатор
+для фракталів "Дерево Піфагора".
+
+Сегменти (task2a) та квадрати (task2b) малюються векторизовано безпосередньо
+в буфер NumPy, після чого зображення записується у PNG.
+Згладжування реалізоване суперсемплінгом: зображення малюється з більшою
+роздільною здатністю і зменшується усередненням блоків пікселів.
+"""
+from typing import Optional, Sequence, Tuple
+
+import matplotlib
+from matplotlib.image import imsave
+import numpy as np
+
+# Обмеження кількості точок, що обробляються за один векторизований крок
+MAX_BATCH_POINTS = 1 << 22
+
+Bounds = Tuple[float, float, float, float]
+
+# Назви полів структурованого масиву дерева (task2b.pythagoras_tree, layout="structured")
+TREE_FIELDS = ("x", "y", "angle", "size", "level")
+
+def segments_bounds(segments: np.ndarray) -> Bounds:
+    """
+    Обчислює межі (xmin, ymin, xmax, ymax) масиву сегментів форми (N, 2, 2).
+
+    Args:
+        segments (np.ndarray): Сегменти.
+
+    Returns:
+        Bounds: Межі сегментів.
+    """
+    points = segments.reshape(-1, 2)
+    xmin, ymin = points.min(axis=0)
+    xmax, ymax = points.max(axis=0)
+    return float(xmin), float(ymin), float(xmax), float(ymax)
+
+def tree_columns(pt_array: np.ndarray) -> Tuple[np.ndarray, ...]:
+    """
+    Повертає колонки (x, y, кут, розмір, рівень) дерева як представлення без копіювання.
+
+    Підтримує як матрицю (N, 5), так і структурований масив з полями TREE_FIELDS.
+
+    Args:
+        pt_array (np.ndarray): Масив дерева.
+
+    Returns:
+        Tuple[np.ndarray, ...]: П'ять одновимірних масивів.
+    """
+    if pt_array.dtype.names:
+        return tuple(pt_array[name] for name in TREE_FIELDS)
+    return tuple(pt_array[:, i] for i in range(5))
+
+def square_corners(pt_array: np.ndarray) -> np.ndarray:
+    """
+    Обчислює кути квадратів дерева Піфагора.
+
+    Args:
+        pt_array (np.ndarray): Масив (x, y, кут, розмір, рівень) з task2b.pythagoras_tree.
+
+    Returns:
+        np.ndarray: Масив форми (N, 4, 2) з кутами в порядку обходу.
+    """
+    x, y, theta, size = tree_columns(pt_array)[:4]
+    cos_t = np.cos(theta) * size
+    sin_t = np.sin(theta) * size
+    corners = np.empty((pt_array.shape[0], 4, 2))
+    corners[:, 0, 0] = x
+    corners[:, 0, 1] = y
+    corners[:, 1, 0] = x + cos_t
+    corners[:, 1, 1] = y + sin_t
+    corners[:, 2, 0] = x + cos_t - sin_t
+    corners[:, 2, 1] = y + sin_t + cos_t
+    corners[:, 3, 0] = x - sin_t
+    corners[:, 3, 1] = y + cos_t
+    return corners
+
+def _pixel_transform(bounds: Bounds, width: int, height: int, margin: float) -> Tuple[float, float, float]:
+    """
+    Обчислює рівномасштабне перетворення з координат даних у пікселі.
+
+    Args:
+        bounds (Bounds): Межі даних.
+        width (int): Ширина зображення.
+        height (int): Висота зображення.
+        margin (float): Відступ від країв у частках розміру зображення.
+
+    Returns:
+        Tuple[float, float, float]: Масштаб та зсуви по X і Y.
+    """
+    xmin, ymin, xmax, ymax = bounds
+    span_x = max(xmax - xmin, 1e-12)
+    span_y = max(ymax - ymin, 1e-12)
+    scale = min(width / span_x, height / span_y) * (1.0 - 2.0 * margin)
+    offset_x = (width - span_x * scale) / 2.0 - xmin * scale
+    offset_y = (height - span_y * scale) / 2.0 - ymin * scale
+    return scale, offset_x, offset_y
+
+def pixel_size(bounds: Bounds, width: int, height: int, margin: float = 0.02) -> float:
+    """
+    Повертає розмір одного пікселя в координатах даних для заданого вигляду.
+
+    Args:
+        bounds (Bounds): Межі вигляду (xmin, ymin, xmax, ymax).
+        width (int): Ширина зображення.
+        height (int): Висота зображення.
+        margin (float): Відступ від країв у частках розміру зображення.
+
+    Returns:
+        float: Довжина, що відповідає одному пікселю.
+    """
+    return 1.0 / _pixel_transform(bounds, width, height, margin)[0]
+
+def circles_intersect_box(xs: np.ndarray, ys: np.ndarray, radius: np.ndarray,
+                          bounds: Bounds) -> np.ndarray:
+    """
+    Перевіряє, які кола (центр, радіус) перетинають прямокутник bounds.
+
+    Використовується для відсікання піддерев, що гарантовано лежать поза виглядом.
+
+    Args:
+        xs (np.ndarray): Координати X центрів.
+        ys (np.ndarray): Координати Y центрів.
+        radius (np.ndarray): Радіуси (або одне число для всіх кіл).
+        bounds (Bounds): Прямокутник (xmin, ymin, xmax, ymax).
+
+    Returns:
+        np.ndarray: Булева маска кіл, що мають спільні точки з прямокутником.
+    """
+    xmin, ymin, xmax, ymax = bounds
+    dx = np.maximum(np.maximum(xmin - xs, xs - xmax), 0.0)
+    dy = np.maximum(np.maximum(ymin - ys, ys - ymax), 0.0)
+    return dx * dx + dy * dy <= radius * radius
+
+def _to_pixels(points: np.ndarray, transform: Tuple[float, float, float], height: int) -> np.ndarray:
+    """Переводить точки (..., 2) у піксельні координати (стовпець, рядок)."""
+    scale, offset_x, offset_y = transform
+    result = np.empty_like(points, dtype=float)
+    result[..., 0] = points[..., 0] * scale + offset_x
+    # Вісь Y зображення спрямована вниз
+    result[..., 1] = height - (points[..., 1] * scale + offset_y)
+    return result
+
+def _new_image(width: int, height: int, background: Sequence[float],
+               out: Optional[np.ndarray] = None) -> np.ndarray:
+    """Повертає полотно, залите кольором тла; out дозволяє повторно використати буфер."""
+    if out is None:
+        image = np.empty((height, width, 3))
+    elif out.shape != (height, width, 3):
+        raise ValueError(f"Очікується буфер форми {(height, width, 3)}")
+    else:
+        image = out
+    image[:] = background
+    return image
+
+def _downsample(image: np.ndarray, factor: int) -> np.ndarray:
+    """Зменшує зображення в factor разів усередненням блоків (згладжування)."""
+    if factor == 1:
+        return image
+    height, width = image.shape[0] // factor, image.shape[1] // factor
+    return image.reshape(height, factor, width, factor, 3).mean(axis=(1, 3))
+
+def _pixel_index(values: np.ndarray, limit: int) -> np.ndarray:
+    """Номери пікселів для координат; точка на дальній межі належить крайньому пікселю."""
+    index = np.floor(values).astype(np.int64)
+    index[index == limit] = limit - 1
+    return index
+
+def _clip_segments(segments: np.ndarray, width: int, height: int) -> np.ndarray:
+    """
+    Обрізає сегменти в піксельних координатах прямокутником зображення (Ліанг - Барскі).
+
+    Без обрізання у збільшеному вигляді довгі гілки за межами кадру
+    давали б мільйони точок, які все одно відкидаються.
+
+    Args:
+        segments (np.ndarray): Сегменти (N, 2, 2).
+        width (int): Ширина зображення.
+        height (int): Висота зображення.
+
+    Returns:
+        np.ndarray: Видимі частини сегментів (M, 2, 2), M <= N.
+    """
+    starts = segments[:, 0]
+    deltas = segments[:, 1] - starts
+    t_low = np.zeros(len(segments))
+    t_high = np.ones(len(segments))
+    visible = np.ones(len(segments), dtype=bool)
+    for p, q in ((-deltas[:, 0], starts[:, 0]), (deltas[:, 0], width - starts[:, 0]),
+                 (-deltas[:, 1], starts[:, 1]), (deltas[:, 1], height - starts[:, 1])):
+        parallel = p == 0
+        visible &= ~(parallel & (q < 0))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            t = q / p
+        t_low = np.where(p < 0, np.maximum(t_low, t), t_low)
+        t_high = np.where(p > 0, np.minimum(t_high, t), t_high)
+    visible &= t_low <= t_high
+    clipped = np.empty((int(visible.sum()), 2, 2))
+    clipped[:, 0] = starts[visible] + deltas[visible] * t_low[visible, None]
+    clipped[:, 1] = starts[visible] + deltas[visible] * t_high[visible, None]
+    return clipped
+
+def _draw_segments(image: np.ndarray, segments: np.ndarray, color: Sequence[float]) -> None:
+    """
+    Малює відрізки товщиною в 1 піксель, беручи по одній точці на кожен піксель довжини.
+
+    Args:
+        image (np.ndarray): Буфер зображення (H, W, 3).
+        segments (np.ndarray): Сегменти в піксельних координатах (N, 2, 2).
+        color (Sequence[float]): Колір RGB у діапазоні [0, 1].
+    """
+    height, width = image.shape[:2]
+    segments = _clip_segments(segments, width, height)
+    starts = segments[:, 0]
+    deltas = segments[:, 1] - starts
+    counts = np.ceil(np.abs(deltas).max(axis=1)).astype(np.int64) + 1
+    # Кінцеві зміщення точок кожного сегмента, обчислені один раз для всіх порцій
+    cumulative = np.cumsum(counts)
+
+    begin = 0
+    while begin < len(segments):
+        # Порція сегментів, сумарна кількість точок якої обмежена MAX_BATCH_POINTS
+        base = int(cumulative[begin - 1]) if begin else 0
+        end = max(begin + 1, int(np.searchsorted(cumulative, base + MAX_BATCH_POINTS)))
+        batch_counts = counts[begin:end]
+        index = np.repeat(np.arange(begin, end), batch_counts)
+        first = np.repeat(cumulative[begin:end] - base - batch_counts, batch_counts)
+        steps = np.arange(index.shape[0]) - first
+        t = steps / np.maximum(counts[index] - 1, 1)
+
+        points = starts[index] + deltas[index] * t[:, None]
+        cols = _pixel_index(points[:, 0], width)
+        rows = _pixel_index(points[:, 1], height)
+        inside = (cols >= 0) & (cols < width) & (rows >= 0) & (rows < height)
+        image[rows[inside], cols[inside]] = color
+        begin = end
+
+def _draw_squares(image: np.ndarray, corners: np.ndarray, colors: np.ndarray) -> None:
+    """
+    Заповнює повернуті квадрати, згрупувавши їх за розміром обмежувальної рамки.
+
+    Для кожної групи будується сітка кандидатів-пікселів (n, k, k), і для центру
+    кожного пікселя перевіряється належність квадрату. Квадрати, менші за піксель,
+    позначаються одним пікселем у центрі. Групи малюються від більших до менших,
+    тож дрібніші (глибші) квадрати опиняються зверху.
+
+    Args:
+        image (np.ndarray): Буфер зображення (H, W, 3).
+        corners (np.ndarray): Кути квадратів у піксельних координатах (N, 4, 2).
+        colors (np.ndarray): Кольори RGB (N, 3).
+    """
+    height, width = image.shape[:2]
+    origin = corners[:, 0]
+    edge_u = corners[:, 1] - origin
+    edge_v = corners[:, 3] - origin
+    low = np.floor(corners.min(axis=1))
+    high = np.ceil(corners.max(axis=1))
+    full_span = (high - low).max(axis=1)
+    low = np.maximum(low, 0).astype(np.int64)
+    high = np.minimum(high, (width, height)).astype(np.int64)
+    span = (high - low).max(axis=1)
+    # Розмір сітки - найменший степінь двійки, що покриває обрізану рамку;
+    # 0 - квадрат повністю поза зображенням
+    grid_size = 1 << np.ceil(np.log2(np.maximum(span, 2))).astype(np.int64)
+    buckets = np.where(full_span <= 1, 1, grid_size)
+    buckets[np.any(high <= low, axis=1)] = 0
+
+    # Обернена матриця [U V] для переходу в локальні координати квадрата
+    det = edge_u[:, 0] * edge_v[:, 1] - edge_u[:, 1] * edge_v[:, 0]
+    det = np.where(det == 0, 1e-12, det)
+    inv = np.empty((len(corners), 2, 2))
+    inv[:, 0, 0] = edge_v[:, 1] / det
+    inv[:, 0, 1] = -edge_v[:, 0] / det
+    inv[:, 1, 0] = -edge_u[:, 1] / det
+    inv[:, 1, 1] = edge_u[:, 0] / det
+
+    for size in np.unique(buckets[buckets > 0])[::-1]:
+        selected = np.nonzero(buckets == size)[0]
+        if size == 1:
+            centers = corners[selected].mean(axis=1)
+            cols = _pixel_index(centers[:, 0], width)
+            rows = _pixel_index(centers[:, 1], height)
+            inside = (cols >= 0) & (cols < width) & (rows >= 0) & (rows < height)
+            image[rows[inside], cols[inside]] = colors[selected[inside]]
+            continue
+
+        grid = np.arange(size)
+        per_batch = max(1, MAX_BATCH_POINTS // (size * size))
+        for begin in range(0, len(selected), per_batch):
+            idx = selected[begin:begin + per_batch]
+            cols = low[idx, 0, None, None] + grid[None, None, :]
+            rows = low[idx, 1, None, None] + grid[None, :, None]
+            rows, cols = np.broadcast_arrays(rows, cols)
+            qx = cols + 0.5 - origin[idx, 0, None, None]
+            qy = rows + 0.5 - origin[idx, 1, None, None]
+            a = inv[idx, 0, 0, None, None] * qx + inv[idx, 0, 1, None, None] * qy
+            b = inv[idx, 1, 0, None, None] * qx + inv[idx, 1, 1, None, None] * qy
+            mask = ((a >= 0) & (a <= 1) & (b >= 0) & (b <= 1)
+                    & (cols >= 0) & (cols < width) & (rows >= 0) & (rows < height))
+            owner = np.broadcast_to(idx[:, None, None], mask.shape)[mask]
+            image[rows[mask], cols[mask]] = colors[owner]
+
+def render_segments(segments: np.ndarray, width: int = 1024, height: int = 1024,
+                    color: Sequence[float] = (0.65, 0.16, 0.16),
+                    background: Sequence[float] = (1.0, 1.0, 1.0),
+                    antialias: int = 1, bounds: Optional[Bounds] = None,
+                    margin: float = 0.02, out: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Растеризує сегменти (наприклад, з task2a) у буфер зображення.
+
+    Args:
+        segments (np.ndarray): Сегменти форми (N, 2, 2).
+        width (int): Ширина зображення в пікселях.
+        height (int): Висота зображення в пікселях.
+        color (Sequence[float]): Колір ліній RGB у діапазоні [0, 1].
+        background (Sequence[float]): Колір тла RGB.
+        antialias (int): Коефіцієнт суперсемплінгу (1 - без згладжування).
+        bounds (Optional[Bounds]): Межі сцени; за замовчуванням обчислюються за даними.
+        margin (float): Відступ від країв у частках розміру зображення.
+        out (Optional[np.ndarray]): Буфер полотна (height * antialias, width * antialias, 3)
+            для повторного використання між викликами.
+
+    Returns:
+        np.ndarray: Зображення форми (height, width, 3) зі значеннями в [0, 1].
+    """
+    if antialias < 1:
+        raise ValueError("Коефіцієнт згладжування має бути не менше 1")
+    segments = np.asarray(segments, dtype=float).reshape(-1, 2, 2)
+    image = _new_image(width * antialias, height * antialias, background, out)
+    if len(segments) == 0:
+        return _downsample(image, antialias)
+
+    transform = _pixel_transform(bounds or segments_bounds(segments),
+                                 width * antialias, height * antialias, margin)
+    _draw_segments(image, _to_pixels(segments, transform, height * antialias), color)
+    return _downsample(image, antialias)
+
+def render_squares(pt_array: np.ndarray, width: int = 1024, height: int = 1024,
+                   colormap_name: str = "summer",
+                   background: Sequence[float] = (1.0, 1.0, 1.0),
+                   antialias: int = 1, bounds: Optional[Bounds] = None,
+                   margin: float = 0.02, max_level: Optional[int] = None,
+                   out: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Растеризує квадрати дерева Піфагора (з task2b) у буфер зображення.
+
+    Колір квадрата залежить від рівня так само, як у task2b.pythagor_tree_plot.
+
+    Args:
+        pt_array (np.ndarray): Масив (x, y, кут, розмір, рівень) або його зріз.
+        width (int): Ширина зображення в пікселях.
+        height (int): Висота зображення в пікселях.
+        colormap_name (str): Назва колірної схеми matplotlib.
+        background (Sequence[float]): Колір тла RGB.
+        antialias (int): Коефіцієнт суперсемплінгу (1 - без згладжування).
+        bounds (Optional[Bounds]): Межі сцени; за замовчуванням обчислюються за даними.
+        margin (float): Відступ від країв у частках розміру зображення.
+        max_level (Optional[int]): Найглибший рівень дерева для шкали кольорів;
+            потрібен, щоб зрізи великого дерева мали узгоджені кольори.
+        out (Optional[np.ndarray]): Буфер полотна (height * antialias, width * antialias, 3)
+            для повторного використання між викликами.
+
+    Returns:
+        np.ndarray: Зображення форми (height, width, 3) зі значеннями в [0, 1].
+    """
+    if antialias < 1:
+        raise ValueError("Коефіцієнт згладжування має бути не менше 1")
+    image = _new_image(width * antialias, height * antialias, background, out)
+    if len(pt_array) == 0:
+        return _downsample(image, antialias)
+
+    corners = square_corners(pt_array)
+    if bounds is None:
+        bounds = segments_bounds(corners)
+    levels = tree_columns(pt_array)[4].astype(float)
+    if max_level is None:
+        max_level = levels.max()
+    colormap = matplotlib.colormaps[colormap_name]
+    colors = colormap(1.0 - levels / (max_level + 1))[:, :3]
+
+    transform = _pixel_transform(bounds, width * antialias, height * antialias, margin)
+    _draw_squares(image, _to_pixels(corners, transform, height * antialias), colors)
+    return _downsample(image, antialias)
+
+def save_png(image: np.ndarray, filename: str) -> None:
+    """
+    Записує буфер зображення у PNG-файл.
+
+    Args:
+        image (np.ndarray): Зображення (H, W, 3) зі значеннями в [0, 1].
+        filename (str): Шлях до файлу.
+    """
+    imsave(filename, np.clip(image, 0.0, 1.0))
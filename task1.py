@@ -1,21 +1,461 @@
-from typing import Optional, Any
+from collections import OrderedDict, deque
+from contextlib import ExitStack, contextmanager
+from typing import Optional, Any, Callable, Dict, Iterable, Iterator, Tuple
 
+import functools
+import heapq
 import random
+import threading
+import timeit
+import tracemalloc
 
 class Node:
     """
     Вузол однозв'язного списку.
+
+    Використовує __slots__ замість __dict__, що суттєво зменшує
+    пам'ять на один елемент списку.
     """
+    __slots__ = ("data", "next")
+
     def __init__(self, data: Any):
         self.data: Any = data
         self.next: Optional['Node'] = None
 
+# Доступні стратегії сортування для LinkedList.sort
+SORT_METHODS = ("merge", "insertion", "natural")
+
+def _make_less(key: Optional[Callable[[Any], Any]], reverse: bool) -> Callable[[Any, Any], bool]:
+    """
+    Створює функцію порівняння "a має стояти строго перед b".
+
+    Args:
+        key (Optional[Callable[[Any], Any]]): Функція обчислення ключа.
+        reverse (bool): Порядок за спаданням.
+
+    Returns:
+        Callable[[Any, Any], bool]: Функція порівняння даних двох вузлів.
+    """
+    if key is None:
+        if reverse:
+            return lambda a, b: b < a
+        return lambda a, b: a < b
+    if reverse:
+        return lambda a, b: key(b) < key(a)
+    return lambda a, b: key(a) < key(b)
+
+def _split_after(node: Optional[Node], count: int) -> Optional[Node]:
+    """
+    Відрізає ланцюжок після count вузлів і повертає початок решти.
+
+    Args:
+        node (Optional[Node]): Початок ланцюжка.
+        count (int): Кількість вузлів, що залишаються в першій частині.
+
+    Returns:
+        Optional[Node]: Перший вузол відрізаної частини або None.
+    """
+    for _ in range(count - 1):
+        if node is None:
+            return None
+        node = node.next
+    if node is None:
+        return None
+    rest = node.next
+    node.next = None
+    return rest
+
+def _merge_chains(left: Optional[Node], right: Optional[Node],
+                  less: Callable[[Any, Any], bool]) -> Tuple[Optional[Node], Optional[Node]]:
+    """
+    Стабільно зливає два відсортовані ланцюжки, перепризначаючи посилання.
+
+    За рівних ключів першим іде вузол з лівого ланцюжка.
+
+    Args:
+        left (Optional[Node]): Перший відсортований ланцюжок.
+        right (Optional[Node]): Другий відсортований ланцюжок.
+        less (Callable[[Any, Any], bool]): Функція порівняння.
+
+    Returns:
+        Tuple[Optional[Node], Optional[Node]]: Голова та хвіст об'єднаного ланцюжка.
+    """
+    if left is None or right is None:
+        head = left or right
+        tail = head
+        while tail is not None and tail.next is not None:
+            tail = tail.next
+        return head, tail
+
+    if less(right.data, left.data):
+        head = tail = right
+        right = right.next
+    else:
+        head = tail = left
+        left = left.next
+
+    while left is not None and right is not None:
+        if less(right.data, left.data):
+            tail.next = right
+            tail = right
+            right = right.next
+        else:
+            tail.next = left
+            tail = left
+            left = left.next
+
+    tail.next = left if left is not None else right
+    while tail.next is not None:
+        tail = tail.next
+    return head, tail
+
+def _merge_sort(head: Node, less: Callable[[Any, Any], bool]) -> Tuple[Node, Node]:
+    """
+    Висхідне (bottom-up) сортування злиттям з O(1) додаткової пам'яті.
+
+    На кожному проході ланцюжок розбивається на пари серій довжини width,
+    які зливаються між собою; width подвоюється, доки не залишиться одна серія.
+
+    Args:
+        head (Node): Голова ланцюжка.
+        less (Callable[[Any, Any], bool]): Функція порівняння.
+
+    Returns:
+        Tuple[Node, Node]: Голова та хвіст відсортованого ланцюжка.
+    """
+    width = 1
+    while True:
+        current = head
+        head = tail = None
+        merges = 0
+        while current is not None:
+            left = current
+            right = _split_after(left, width)
+            current = _split_after(right, width)
+            merged_head, merged_tail = _merge_chains(left, right, less)
+            if tail is None:
+                head = merged_head
+            else:
+                tail.next = merged_head
+            tail = merged_tail
+            merges += 1
+        if merges <= 1:
+            return head, tail
+        width *= 2
+
+def _take_run(head: Node, less: Callable[[Any, Any], bool]) -> Tuple[Node, Node, Optional[Node]]:
+    """
+    Відокремлює природну серію від початку ланцюжка.
+
+    Неспадна серія береться як є, строго спадна - розвертається на місці
+    (строгість гарантує збереження стабільності).
+
+    Args:
+        head (Node): Початок ланцюжка.
+        less (Callable[[Any, Any], bool]): Функція порівняння.
+
+    Returns:
+        Tuple[Node, Node, Optional[Node]]: Голова серії, хвіст серії та решта ланцюжка.
+    """
+    current = head
+    if current.next is not None and less(current.next.data, current.data):
+        while current.next is not None and less(current.next.data, current.data):
+            current = current.next
+        rest = current.next
+        prev = None
+        node = head
+        while node is not rest:
+            next_node = node.next
+            node.next = prev
+            prev = node
+            node = next_node
+        return current, head, rest
+
+    while current.next is not None and not less(current.next.data, current.data):
+        current = current.next
+    rest = current.next
+    current.next = None
+    return head, current, rest
+
+def _natural_merge_sort(head: Node, less: Callable[[Any, Any], bool]) -> Tuple[Node, Node]:
+    """
+    Адаптивне сортування злиттям природних серій.
+
+    Вже відсортований список обробляється за один прохід O(n);
+    загалом - O(n log r), де r - кількість початкових серій.
+
+    Args:
+        head (Node): Голова ланцюжка.
+        less (Callable[[Any, Any], bool]): Функція порівняння.
+
+    Returns:
+        Tuple[Node, Node]: Голова та хвіст відсортованого ланцюжка.
+    """
+    while True:
+        current = head
+        head = tail = None
+        runs = 0
+        while current is not None:
+            left_head, _, current = _take_run(current, less)
+            right_head = None
+            if current is not None:
+                right_head, _, current = _take_run(current, less)
+            merged_head, merged_tail = _merge_chains(left_head, right_head, less)
+            if tail is None:
+                head = merged_head
+            else:
+                tail.next = merged_head
+            tail = merged_tail
+            runs += 1
+        if runs <= 1:
+            return head, tail
+
+def _insertion_sort(head: Node, less: Callable[[Any, Any], bool]) -> Tuple[Node, Node]:
+    """
+    Стабільне сортування вставками.
+
+    Вузол, не менший за поточний хвіст відсортованої частини, додається
+    в кінець за O(1), тому майже відсортовані списки обробляються швидко.
+
+    Args:
+        head (Node): Голова ланцюжка.
+        less (Callable[[Any, Any], bool]): Функція порівняння.
+
+    Returns:
+        Tuple[Node, Node]: Голова та хвіст відсортованого ланцюжка.
+    """
+    sorted_head = sorted_tail = head
+    current = head.next
+    head.next = None
+
+    while current is not None:
+        next_node = current.next
+        if not less(current.data, sorted_tail.data):
+            # Вставка в кінець відсортованої частини
+            sorted_tail.next = current
+            current.next = None
+            sorted_tail = current
+        elif less(current.data, sorted_head.data):
+            # Вставка на початок відсортованої частини
+            current.next = sorted_head
+            sorted_head = current
+        else:
+            # Пошук місця для вставки після всіх рівних елементів
+            temp = sorted_head
+            while not less(current.data, temp.next.data):
+                temp = temp.next
+            current.next = temp.next
+            temp.next = current
+        current = next_node
+
+    return sorted_head, sorted_tail
+
+def _is_hashable(data: Any) -> bool:
+    """
+    Перевіряє, чи можна використати дані як ключ словника.
+
+    Args:
+        data (Any): Дані вузла.
+
+    Returns:
+        bool: True, якщо дані хешовані.
+    """
+    try:
+        hash(data)
+    except TypeError:
+        return False
+    return True
+
 class LinkedList:
     """
     Клас однозв'язного списку.
+
+    Опційний хеш-індекс (indexed=True) зберігає для кожного значення OrderedDict
+    його вузлів, а також попередника кожного вузла. Це робить search_element,
+    delete_node та оновлення індексу при вставці операціями O(1) ціною додаткової пам'яті.
+    З індексом search_element і delete_node беруть перший вузол кошика. Вузол,
+    вставлений на початок списку або безпосередньо перед першим рівним, стає
+    першим у кошику, решта додаються в кінець, тож це перший рівний вузол списку,
+    якщо лише add_after (або sorted_insert у невідсортований список) не поставив
+    дублікат перед усіма рівними; тоді повертається інший вузол з тим самим значенням.
+    Вузли з нехешованими даними не індексуються: пошук і видалення
+    за нехешованим ключем виконуються лінійним проходом.
     """
-    def __init__(self):
+    # Клас вузлів, які створює список (підкласи можуть його замінити)
+    _node_type: type = Node
+
+    def __init__(self, indexed: bool = False):
         self.head: Optional[Node] = None
+        # Посилання на останній вузол та кількість вузлів,
+        # щоб додавання в кінець виконувалось за O(1)
+        self.tail: Optional[Node] = None
+        self.size: int = 0
+        # Хеш-індекс: значення -> вузли, та вузол -> попередній вузол
+        self._index: Optional[Dict[Any, 'OrderedDict[Node, None]']] = None
+        self._prev: Optional[Dict[Node, Optional[Node]]] = None
+        if indexed:
+            self.enable_index()
+
+    @property
+    def indexed(self) -> bool:
+        """Чи ввімкнено хеш-індекс."""
+        return self._index is not None
+
+    def enable_index(self) -> None:
+        """
+        Вмикає хеш-індекс та будує його за один прохід по списку.
+        """
+        self._rebuild_index()
+
+    def disable_index(self) -> None:
+        """
+        Вимикає хеш-індекс і звільняє зайняту ним пам'ять.
+        """
+        self._index = None
+        self._prev = None
+
+    def clear(self) -> None:
+        """
+        Видаляє всі елементи списку.
+        """
+        self.head = self.tail = None
+        self.size = 0
+        if self._index is not None:
+            self._index = {}
+            self._prev = {}
+
+    @classmethod
+    def from_iterable(cls, iterable: Iterable[Any], indexed: bool = False) -> 'LinkedList':
+        """
+        Створює список з елементів ітерованого об'єкта за один прохід.
+
+        Args:
+            iterable (Iterable[Any]): Джерело елементів.
+            indexed (bool): Чи вмикати хеш-індекс.
+
+        Returns:
+            LinkedList: Новий список з елементами в тому ж порядку.
+        """
+        llist = cls(indexed=indexed)
+        llist.extend(iterable)
+        return llist
+
+    def extend(self, iterable: Iterable[Any]) -> None:
+        """
+        Додає всі елементи ітерованого об'єкта в кінець списку за один прохід.
+
+        Args:
+            iterable (Iterable[Any]): Джерело елементів.
+        """
+        if iterable is self:
+            # Інакше обхід списку ніколи не завершиться
+            iterable = self.to_list()
+
+        tail = self.tail
+        count = 0
+        for data in iterable:
+            node = self._node_type(data)
+            if tail is None:
+                self.head = node
+            else:
+                tail.next = node
+            prev, tail = tail, node
+            count += 1
+            if self._index is not None:
+                self.tail = tail
+                self._index_link(node, prev)
+        self.tail = tail
+        self.size += count
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __iter__(self) -> Iterator[Any]:
+        """Лінивий прохід по даних вузлів від голови до хвоста."""
+        current = self.head
+        while current:
+            yield current.data
+            current = current.next
+
+    def iter_nodes(self) -> Iterator[Node]:
+        """
+        Лінивий прохід по вузлах списку від голови до хвоста.
+
+        Returns:
+            Iterator[Node]: Генератор вузлів.
+        """
+        current = self.head
+        while current:
+            yield current
+            current = current.next
+
+    def to_list(self) -> list:
+        """
+        Повертає елементи списку як звичайний list.
+
+        Returns:
+            list: Дані вузлів у порядку списку.
+        """
+        return list(self)
+
+    def _rebuild_index(self) -> None:
+        """Повністю перебудовує хеш-індекс за поточним станом списку."""
+        index: Dict[Any, 'OrderedDict[Node, None]'] = {}
+        prev_map: Dict[Node, Optional[Node]] = {}
+        prev = None
+        for node in self.iter_nodes():
+            prev_map[node] = prev
+            if _is_hashable(node.data):
+                bucket = index.get(node.data)
+                if bucket is None:
+                    index[node.data] = OrderedDict.fromkeys((node,))
+                else:
+                    bucket[node] = None
+            prev = node
+        self._index = index
+        self._prev = prev_map
+
+    def _index_link(self, node: Node, prev: Optional[Node]) -> None:
+        """
+        Додає до індексу щойно вставлений вузол.
+
+        Args:
+            node (Node): Новий вузол (вже зв'язаний зі списком).
+            prev (Optional[Node]): Попередній вузол або None для голови.
+        """
+        self._prev[node] = prev
+        if node.next is not None:
+            self._prev[node.next] = node
+        if not _is_hashable(node.data):
+            return
+
+        bucket = self._index.get(node.data)
+        if bucket is None:
+            self._index[node.data] = OrderedDict.fromkeys((node,))
+            return
+        first = next(iter(bucket))
+        bucket[node] = None
+        if prev is None or node.next is first:
+            # Новий вузол стоїть перед першим рівним, тож і в кошику стає першим
+            bucket.move_to_end(node, last=False)
+
+    def _index_unlink(self, node: Node) -> None:
+        """
+        Видаляє вузол з індексу (до того, як він буде від'єднаний від списку).
+
+        Args:
+            node (Node): Вузол, що видаляється.
+        """
+        prev = self._prev.pop(node)
+        if node.next is not None:
+            self._prev[node.next] = prev
+        if not _is_hashable(node.data):
+            return
+
+        bucket = self._index[node.data]
+        del bucket[node]
+        if not bucket:
+            del self._index[node.data]
 
     def add_first(self, data: Any) -> None:
         """
@@ -24,9 +464,14 @@ class LinkedList:
         Args:
             data (Any): Дані для додавання.
         """
-        new_node = Node(data)
+        new_node = self._node_type(data)
         new_node.next = self.head
         self.head = new_node
+        if self.tail is None:
+            self.tail = new_node
+        self.size += 1
+        if self._index is not None:
+            self._index_link(new_node, None)
 
     def add_last(self, data: Any) -> None:
         """
@@ -35,14 +480,16 @@ class LinkedList:
         Args:
             data (Any): Дані для додавання.
         """
-        new_node = Node(data)
-        if self.head is None:
+        new_node = self._node_type(data)
+        prev = self.tail
+        if prev is None:
             self.head = new_node
         else:
-            cur = self.head
-            while cur.next:
-                cur = cur.next
-            cur.next = new_node
+            prev.next = new_node
+        self.tail = new_node
+        self.size += 1
+        if self._index is not None:
+            self._index_link(new_node, prev)
 
     def add_after(self, prev_node: Optional[Node], data: Any) -> None:
         """
@@ -55,20 +502,49 @@ class LinkedList:
         if prev_node is None:
             print("Операція вставки не виконана. Попереднього вузла не існує")
             return
-        new_node = Node(data)
+        new_node = self._node_type(data)
         new_node.next = prev_node.next
         prev_node.next = new_node
+        if prev_node is self.tail:
+            self.tail = new_node
+        self.size += 1
+        if self._index is not None:
+            self._index_link(new_node, prev_node)
 
     def delete_node(self, key: Any) -> None:
         """
-        Видаляє вузол за ключем.
+        Видаляє перший вузол із заданим ключем.
+
+        З увімкненим індексом і хешованим ключем виконується за O(1) і видаляє
+        вузол, який повертає search_element (див. опис класу).
         
         Args:
             key (Any): Значення для видалення.
         """
+        if self._index is not None and _is_hashable(key):
+            bucket = self._index.get(key)
+            if not bucket:
+                return
+            node = next(iter(bucket))
+            prev = self._prev[node]
+            self._index_unlink(node)
+            if prev is None:
+                self.head = node.next
+            else:
+                prev.next = node.next
+            if node is self.tail:
+                self.tail = prev
+            self.size -= 1
+            return
+
         cur = self.head
         if cur and cur.data == key:
+            if self._index is not None:
+                self._index_unlink(cur)
             self.head = cur.next
+            if self.head is None:
+                self.tail = None
+            self.size -= 1
             cur = None
             return
         prev = None
@@ -77,12 +553,20 @@ class LinkedList:
             cur = cur.next
         if cur is None:
             return
+        if self._index is not None:
+            self._index_unlink(cur)
         prev.next = cur.next
+        if cur is self.tail:
+            self.tail = prev
+        self.size -= 1
         cur = None
 
     def search_element(self, data: Any) -> Optional[Node]:
         """
-        Шукає елемент у списку.
+        Шукає перший вузол із заданим значенням.
+
+        З увімкненим індексом і хешованим значенням виконується за O(1) і повертає
+        перший вузол кошика індексу (див. опис класу).
         
         Args:
             data (Any): Значення для пошуку.
@@ -90,6 +574,10 @@ class LinkedList:
         Returns:
             Optional[Node]: Знайдений вузол або None.
         """
+        if self._index is not None and _is_hashable(data):
+            bucket = self._index.get(data)
+            return next(iter(bucket)) if bucket else None
+
         cur = self.head
         while cur:
             if cur.data == data:
@@ -101,12 +589,7 @@ class LinkedList:
         """
         Виводить список на екран.
         """
-        current = self.head
-        elems = []
-        while current:
-            elems.append(str(current.data))
-            current = current.next
-        print(" -> ".join(elems) + " -> None")
+        print(" -> ".join(map(str, self)) + " -> None")
 
     def reverse(self) -> None:
         """
@@ -114,12 +597,15 @@ class LinkedList:
         """
         prev = None
         current = self.head
+        self.tail = current
         while current:
             next_node = current.next
             current.next = prev
             prev = current
             current = next_node
         self.head = prev
+        if self._index is not None:
+            self._rebuild_index()
 
     def sorted_insert(self, data: Any) -> None:
         """
@@ -128,89 +614,1003 @@ class LinkedList:
         Args:
             data (Any): Дані для вставки.
         """
-        new_node = Node(data)
+        new_node = self._node_type(data)
         if not self.head or self.head.data >= new_node.data:
+            prev = None
             new_node.next = self.head
             self.head = new_node
+            if self.tail is None:
+                self.tail = new_node
         else:
             current = self.head
             while current.next and current.next.data < new_node.data:
                 current = current.next
+            prev = current
             new_node.next = current.next
             current.next = new_node
+            if current is self.tail:
+                self.tail = new_node
+        self.size += 1
+        if self._index is not None:
+            self._index_link(new_node, prev)
 
-    def sort(self) -> None:
+    def sort(self, key: Optional[Callable[[Any], Any]] = None, reverse: bool = False,
+             method: str = "merge") -> None:
         """
-        Сортує список методом сортування вставками.
-        """
-        if self.head is None or self.head.next is None:
-            return 
+        Сортує список, змінюючи посилання між вузлами (без створення нових вузлів).
 
-        sorted_list = None
-        current = self.head
+        Сортування стабільне: вузли з рівними ключами зберігають початковий порядок.
 
-        while current is not None:
-            next_node = current.next
-            if sorted_list is None or current.data < sorted_list.data:
-                # Вставка на початок відсортованої частини
-                current.next = sorted_list
-                sorted_list = current
-            else:
-                # Пошук місця для вставки
-                temp = sorted_list
-                while temp.next is not None and temp.next.data < current.data:
-                    temp = temp.next
-                current.next = temp.next
-                temp.next = current
+        Args:
+            key (Optional[Callable[[Any], Any]]): Функція обчислення ключа, як у sorted().
+            reverse (bool): Сортувати за спаданням.
+            method (str): Стратегія сортування:
+                "merge" - висхідне сортування злиттям, O(n log n) часу та O(1) пам'яті;
+                "insertion" - сортування вставками, для дуже коротких або майже відсортованих списків;
+                "natural" - адаптивне злиття природних серій, що вже є в списку.
 
-            current = next_node
-        self.head = sorted_list
+        Raises:
+            ValueError: Якщо задано невідомий метод сортування.
+        """
+        if method not in SORT_METHODS:
+            raise ValueError(f"Невідомий метод сортування: {method}")
+        if self.head is None or self.head.next is None:
+            return
+
+        less = _make_less(key, reverse)
+        if method == "insertion":
+            self.head, self.tail = _insertion_sort(self.head, less)
+        elif method == "natural":
+            self.head, self.tail = _natural_merge_sort(self.head, less)
+        else:
+            self.head, self.tail = _merge_sort(self.head, less)
+        if self._index is not None:
+            self._rebuild_index()
 
-    def merge_with(self, sorted_list: 'LinkedList') -> 'LinkedList':
+    def merge_with(self, sorted_list: 'LinkedList', in_place: bool = False) -> 'LinkedList':
         """
         Об'єднує два відсортовані однозв'язні списки в один відсортований список.
         
         Args:
             sorted_list (LinkedList): Інший відсортований список.
+            in_place (bool): Якщо True, вузли обох списків зшиваються без створення нових,
+                результат записується в поточний список, а sorted_list стає порожнім.
             
         Returns:
-            LinkedList: Новий об'єднаний відсортований список.
+            LinkedList: Новий об'єднаний відсортований список того ж типу, що й поточний
+                (або поточний список при in_place=True).
+
+        Raises:
+            ValueError: Якщо список зливається сам із собою на місці.
         """
-        merged_list = LinkedList()
-        
-        current_self = self.head
-        current_other = sorted_list.head
-        
-        # Оскільки sorted_insert може бути повільним (O(N)), краще будувати список вручну для O(N+M)
-        # Але для збереження простоти та використання існуючих методів, 
-        # можна використати sorted_insert, якщо ефективність не є критичною,
-        # або реалізувати ефективне злиття.
-        # Тут реалізуємо ефективне злиття з хвостом.
-        
-        dummy = Node(0)
-        tail = dummy
-        
-        while current_self and current_other:
-            if current_self.data <= current_other.data:
-                tail.next = Node(current_self.data)
-                current_self = current_self.next
+        if in_place:
+            if sorted_list is self:
+                raise ValueError("Неможливо злити список сам із собою на місці")
+            self.head, self.tail = _merge_chains(self.head, sorted_list.head, _make_less(None, False))
+            self.size += sorted_list.size
+            sorted_list.clear()
+            if self._index is not None:
+                self._rebuild_index()
+            return self
+
+        # Результат того ж типу, що й поточний список: extend підкласу зберігає
+        # його інваріанти (зворотні посилання, шар skip-list, блокування).
+        # heapq.merge за рівних значень першим бере елемент поточного списку
+        merged_list = type(self)(indexed=self._index is not None)
+        merged_list.extend(heapq.merge(self, sorted_list))
+        return merged_list
+
+class SkipNode(Node):
+    """
+    Вузол сортованого списку з "експрес-посиланнями" skip-list.
+
+    Посилання next утворює звичайний однозв'язний ланцюжок (рівень 0),
+    forward[i] вказує на наступний вузол рівня i + 1.
+    """
+    __slots__ = ("forward",)
+
+    def __init__(self, data: Any, height: int = 1):
+        super().__init__(data)
+        self.forward: list = [None] * (height - 1) if height > 1 else []
+
+# Максимальна кількість рівнів skip-list (достатньо для ~2^32 елементів)
+SKIP_MAX_LEVEL = 32
+
+class SortedLinkedList(LinkedList):
+    """
+    Сортований однозв'язний список з шаром skip-list над вузлами.
+
+    sorted_insert, search_element та delete_node виконуються за очікуваний O(log n),
+    irange повертає елементи з заданого діапазону ключів.
+    Операції, що можуть порушити порядок (add_first, add_last, add_after, reverse,
+    злиття на місці), викликають TypeError; extend та from_iterable вставляють
+    елементи з сортуванням.
+    """
+    def __init__(self, indexed: bool = False):
+        # Заголовок-вартовий: header.next дублює head, header.forward - початки експрес-рівнів
+        self._header = SkipNode(None, SKIP_MAX_LEVEL)
+        self._level = 1
+        super().__init__(indexed=indexed)
+
+    @staticmethod
+    def _random_height() -> int:
+        """Випадкова висота вузла з геометричним розподілом (p = 1/2)."""
+        height = 1
+        while height < SKIP_MAX_LEVEL and random.random() < 0.5:
+            height += 1
+        return height
+
+    def _find_predecessors(self, data: Any) -> list:
+        """
+        Знаходить на кожному рівні останній вузол з даними, строго меншими за data.
+
+        Args:
+            data (Any): Ключ пошуку.
+
+        Returns:
+            list: Попередники за рівнями (індекс 0 - базовий ланцюжок).
+        """
+        update = [self._header] * self._level
+        node = self._header
+        for i in range(self._level - 2, -1, -1):
+            nxt = node.forward[i]
+            while nxt is not None and nxt.data < data:
+                node = nxt
+                nxt = node.forward[i]
+            update[i + 1] = node
+        nxt = node.next
+        while nxt is not None and nxt.data < data:
+            node = nxt
+            nxt = node.next
+        update[0] = node
+        return update
+
+    def clear(self) -> None:
+        super().clear()
+        self._header = SkipNode(None, SKIP_MAX_LEVEL)
+        self._level = 1
+
+    def _reject(self, operation: str) -> None:
+        """
+        Відхиляє операцію, яка може порушити порядок елементів.
+
+        Raises:
+            TypeError: Завжди; повідомлення вказує операцію та альтернативу.
+        """
+        raise TypeError(f"SortedLinkedList не підтримує {operation}: операція може порушити "
+                        f"порядок елементів; використовуйте sorted_insert або LinkedList")
+
+    def add_first(self, data: Any) -> None:
+        """
+        Не підтримується: вставка на початок порушила б порядок.
+
+        Raises:
+            TypeError: Завжди.
+        """
+        self._reject("add_first")
+
+    def add_last(self, data: Any) -> None:
+        """
+        Не підтримується: вставка в кінець порушила б порядок.
+
+        Raises:
+            TypeError: Завжди.
+        """
+        self._reject("add_last")
+
+    def add_after(self, prev_node: Optional[Node], data: Any) -> None:
+        """
+        Не підтримується: вставка після довільного вузла порушила б порядок.
+
+        Raises:
+            TypeError: Завжди.
+        """
+        self._reject("add_after")
+
+    def reverse(self) -> None:
+        """
+        Не підтримується: розворот зробив би список спадним.
+
+        Raises:
+            TypeError: Завжди.
+        """
+        self._reject("reverse")
+
+    def extend(self, iterable: Iterable[Any]) -> None:
+        """
+        Вставляє всі елементи ітерованого об'єкта зі збереженням порядку.
+
+        Args:
+            iterable (Iterable[Any]): Джерело елементів.
+        """
+        if iterable is self:
+            iterable = self.to_list()
+        for data in iterable:
+            self.sorted_insert(data)
+
+    def sort(self, key: Optional[Callable[[Any], Any]] = None, reverse: bool = False,
+             method: str = "merge") -> None:
+        """
+        Список завжди відсортований, тому сортування за замовчуванням нічого не робить.
+
+        Raises:
+            TypeError: Якщо задано інший ключ або порядок сортування.
+        """
+        if key is not None or reverse:
+            self._reject("сортування з key або reverse")
+
+    def merge_with(self, sorted_list: LinkedList, in_place: bool = False) -> LinkedList:
+        """
+        Зливає з іншим відсортованим списком у новий список.
+
+        Raises:
+            TypeError: Якщо in_place=True.
+        """
+        if in_place:
+            self._reject("злиття на місці")
+        return super().merge_with(sorted_list)
+
+    def sorted_insert(self, data: Any) -> None:
+        """
+        Вставляє елемент перед усіма рівними йому за очікуваний O(log n).
+
+        Args:
+            data (Any): Дані для вставки.
+        """
+        update = self._find_predecessors(data)
+        height = self._random_height()
+        if height > self._level:
+            update.extend([self._header] * (height - self._level))
+            self._level = height
+
+        new_node = SkipNode(data, height)
+        for i in range(height - 1):
+            prev = update[i + 1]
+            new_node.forward[i] = prev.forward[i]
+            prev.forward[i] = new_node
+
+        prev = update[0]
+        new_node.next = prev.next
+        prev.next = new_node
+        self.head = self._header.next
+        if new_node.next is None:
+            self.tail = new_node
+        self.size += 1
+        if self._index is not None:
+            self._index_link(new_node, None if prev is self._header else prev)
+
+    def search_element(self, data: Any) -> Optional[Node]:
+        """
+        Шукає перший вузол із заданим значенням за очікуваний O(log n).
+
+        Args:
+            data (Any): Значення для пошуку.
+
+        Returns:
+            Optional[Node]: Знайдений вузол або None.
+        """
+        if self._index is not None and _is_hashable(data):
+            return super().search_element(data)
+        candidate = self._find_predecessors(data)[0].next
+        if candidate is not None and candidate.data == data:
+            return candidate
+        return None
+
+    def delete_node(self, key: Any) -> None:
+        """
+        Видаляє перший вузол із заданим ключем за очікуваний O(log n).
+
+        Args:
+            key (Any): Значення для видалення.
+        """
+        update = self._find_predecessors(key)
+        target = update[0].next
+        if target is None or target.data != key:
+            return
+
+        if self._index is not None:
+            self._index_unlink(target)
+        for i in range(len(target.forward)):
+            prev = update[i + 1]
+            if prev.forward[i] is target:
+                prev.forward[i] = target.forward[i]
+        update[0].next = target.next
+        while self._level > 1 and self._header.forward[self._level - 2] is None:
+            self._level -= 1
+
+        self.head = self._header.next
+        if target is self.tail:
+            self.tail = None if update[0] is self._header else update[0]
+        self.size -= 1
+
+    def irange(self, low: Any, high: Any) -> Iterator[Any]:
+        """
+        Лінивий прохід по елементах з ключами в діапазоні [low, high].
+
+        Args:
+            low (Any): Нижня межа (включно).
+            high (Any): Верхня межа (включно).
+
+        Returns:
+            Iterator[Any]: Генератор даних у порядку зростання.
+        """
+        node = self._find_predecessors(low)[0].next
+        while node is not None and not high < node.data:
+            yield node.data
+            node = node.next
+
+def _locked(method: Callable) -> Callable:
+    """
+    Обгортає метод LinkedList так, щоб він виконувався під обома блокуваннями списку.
+
+    Args:
+        method (Callable): Метод базового класу.
+
+    Returns:
+        Callable: Потокобезпечна версія методу.
+    """
+    @functools.wraps(method)
+    def wrapper(self: 'ConcurrentLinkedList', *args: Any, **kwargs: Any) -> Any:
+        with self._head_lock, self._tail_lock:
+            return method(self, *args, **kwargs)
+    return wrapper
+
+class ConcurrentLinkedList(LinkedList):
+    """
+    Потокобезпечний однозв'язний список для сценаріїв "виробник - споживач".
+
+    Використовує схему з двома блокуваннями: додавання в кінець (add_last, extend)
+    захоплює лише блокування хвоста, а pop_first - лише блокування голови,
+    тож виробники та споживачі не заважають одне одному. Обидва блокування
+    потрібні лише тоді, коли список порожній або містить один вузол.
+    Решта операцій (reverse, sort, видалення, пошук тощо) виконується під обома
+    блокуваннями (завжди в порядку голова -> хвіст, щоб уникнути взаємоблокування).
+    Ітерація повертає узгоджений знімок стану списку.
+    """
+    def __init__(self, indexed: bool = False):
+        self._head_lock = threading.RLock()
+        self._tail_lock = threading.RLock()
+        self._size_lock = threading.Lock()
+        super().__init__(indexed=indexed)
+
+    @contextmanager
+    def _append_locks(self) -> Iterator[None]:
+        """Захоплює блокування хвоста, а для порожнього списку чи з індексом - обидва."""
+        self._tail_lock.acquire()
+        if self.tail is not None and self._index is None:
+            try:
+                yield
+            finally:
+                self._tail_lock.release()
+            return
+        self._tail_lock.release()
+        with self._head_lock, self._tail_lock:
+            yield
+
+    def add_last(self, data: Any) -> None:
+        """
+        Додає новий вузол в кінець списку (потокобезпечно).
+
+        Args:
+            data (Any): Дані для додавання.
+        """
+        self.extend((data,))
+
+    def extend(self, iterable: Iterable[Any]) -> None:
+        """
+        Додає всі елементи в кінець списку однією атомарною операцією.
+
+        Ланцюжок нових вузлів будується поза блокуваннями,
+        під блокуванням лише приєднується до хвоста.
+
+        Args:
+            iterable (Iterable[Any]): Джерело елементів.
+        """
+        if iterable is self:
+            iterable = self.to_list()
+
+        first = last = None
+        count = 0
+        for data in iterable:
+            node = self._node_type(data)
+            if last is None:
+                first = node
             else:
-                tail.next = Node(current_other.data)
-                current_other = current_other.next
-            tail = tail.next
-            
-        while current_self:
-            tail.next = Node(current_self.data)
-            current_self = current_self.next
-            tail = tail.next
-            
-        while current_other:
-            tail.next = Node(current_other.data)
-            current_other = current_other.next
-            tail = tail.next
-            
-        merged_list.head = dummy.next
+                last.next = node
+            last = node
+            count += 1
+        if first is None:
+            return
+
+        with self._append_locks():
+            prev = self.tail
+            if prev is None:
+                self.head = first
+            else:
+                prev.next = first
+            with self._size_lock:
+                self.size += count
+            if self._index is None:
+                self.tail = last
+                return
+            node = first
+            while node is not None:
+                self.tail = node
+                self._index_link(node, prev)
+                prev, node = node, node.next
+
+    def pop_first(self) -> Any:
+        """
+        Видаляє та повертає перший елемент списку (потокобезпечно).
+
+        Returns:
+            Any: Дані видаленого вузла.
+
+        Raises:
+            IndexError: Якщо список порожній.
+        """
+        with self._head_lock:
+            node = self.head
+            if node is None:
+                raise IndexError("Видалення з порожнього списку")
+            if node.next is None or self._index is not None:
+                # Можливо, видаляється останній вузол - потрібне і блокування хвоста
+                with self._tail_lock:
+                    return self._unlink_first()
+            return self._unlink_first()
+
+    def _unlink_first(self) -> Any:
+        """Від'єднує головний вузол; викликається під блокуванням голови."""
+        node = self.head
+        if self._index is not None:
+            self._index_unlink(node)
+        self.head = node.next
+        if self.head is None:
+            self.tail = None
+        with self._size_lock:
+            self.size -= 1
+        return node.data
+
+    def snapshot(self) -> list:
+        """
+        Повертає узгоджений знімок даних списку.
+
+        Returns:
+            list: Дані вузлів на момент виклику.
+        """
+        with self._head_lock, self._tail_lock:
+            return list(LinkedList.__iter__(self))
+
+    def __iter__(self) -> Iterator[Any]:
+        """Ітерація по знімку списку, безпечна при одночасних змінах."""
+        return iter(self.snapshot())
+
+    def iter_nodes(self) -> Iterator[Node]:
+        """Ітерація по знімку вузлів списку."""
+        with self._head_lock, self._tail_lock:
+            return iter(list(LinkedList.iter_nodes(self)))
+
+    def to_list(self) -> list:
+        return self.snapshot()
+
+    def merge_with(self, sorted_list: LinkedList, in_place: bool = False) -> LinkedList:
+        """
+        Потокобезпечне злиття; блокування обох списків захоплюються в сталому порядку.
+
+        Args:
+            sorted_list (LinkedList): Інший відсортований список.
+            in_place (bool): Зшити вузли в поточний список, спорожнивши sorted_list.
+
+        Returns:
+            LinkedList: Результат злиття.
+        """
+        lists = [self]
+        if isinstance(sorted_list, ConcurrentLinkedList) and sorted_list is not self:
+            lists.append(sorted_list)
+        with ExitStack() as stack:
+            for llist in sorted(lists, key=id):
+                stack.enter_context(llist._head_lock)
+                stack.enter_context(llist._tail_lock)
+            return super().merge_with(sorted_list, in_place=in_place)
+
+    add_first = _locked(LinkedList.add_first)
+    add_after = _locked(LinkedList.add_after)
+    delete_node = _locked(LinkedList.delete_node)
+    search_element = _locked(LinkedList.search_element)
+    display = _locked(LinkedList.display)
+    reverse = _locked(LinkedList.reverse)
+    sorted_insert = _locked(LinkedList.sorted_insert)
+    sort = _locked(LinkedList.sort)
+    clear = _locked(LinkedList.clear)
+    enable_index = _locked(LinkedList.enable_index)
+    disable_index = _locked(LinkedList.disable_index)
+
+class DNode(Node):
+    """
+    Вузол двозв'язного списку.
+    """
+    __slots__ = ("prev",)
+
+    def __init__(self, data: Any):
+        super().__init__(data)
+        self.prev: Optional['DNode'] = None
+
+class DoublyLinkedList(LinkedList):
+    """
+    Двозв'язний список з тим самим API, що й LinkedList.
+
+    Кожен вузол знає свого попередника, тому видалення відомого вузла
+    (remove_node), видалення з обох кінців (pop_first, pop_last) та
+    перенесення вузла на початок (move_to_front) виконуються за O(1).
+    Разом зі словником ключ -> вузол це основа LRU-кешу.
+    """
+    _node_type = DNode
+
+    def _relink_prev(self) -> None:
+        """Відновлює посилання prev після перестановки вузлів за посиланнями next."""
+        prev = None
+        for node in self.iter_nodes():
+            node.prev = prev
+            prev = node
+
+    def _link_after(self, prev_node: Optional[DNode], node: DNode) -> None:
+        """
+        Вставляє вузол після prev_node (або на початок, якщо prev_node None).
+
+        Args:
+            prev_node (Optional[DNode]): Попередній вузол.
+            node (DNode): Вузол для вставки.
+        """
+        next_node = self.head if prev_node is None else prev_node.next
+        node.prev = prev_node
+        node.next = next_node
+        if prev_node is None:
+            self.head = node
+        else:
+            prev_node.next = node
+        if next_node is None:
+            self.tail = node
+        else:
+            next_node.prev = node
+        self.size += 1
+        if self._index is not None:
+            self._index_link(node, prev_node)
+
+    def add_first(self, data: Any) -> None:
+        """
+        Додає новий вузол на початок списку.
+
+        Args:
+            data (Any): Дані для додавання.
+        """
+        self._link_after(None, DNode(data))
+
+    def add_last(self, data: Any) -> None:
+        """
+        Додає новий вузол в кінець списку.
+
+        Args:
+            data (Any): Дані для додавання.
+        """
+        self._link_after(self.tail, DNode(data))
+
+    def add_after(self, prev_node: Optional[DNode], data: Any) -> None:
+        """
+        Вставляє новий вузол після заданого вузла.
+
+        Args:
+            prev_node (Optional[DNode]): Попередній вузол.
+            data (Any): Дані для додавання.
+        """
+        if prev_node is None:
+            print("Операція вставки не виконана. Попереднього вузла не існує")
+            return
+        self._link_after(prev_node, DNode(data))
+
+    def extend(self, iterable: Iterable[Any]) -> None:
+        """
+        Додає всі елементи ітерованого об'єкта в кінець списку за один прохід.
+
+        Args:
+            iterable (Iterable[Any]): Джерело елементів.
+        """
+        prev = self.tail
+        super().extend(iterable)
+        node = self.head if prev is None else prev.next
+        while node is not None:
+            node.prev = prev
+            prev, node = node, node.next
+
+    def remove_node(self, node: DNode) -> None:
+        """
+        Від'єднує вузол цього списку за O(1).
+
+        Args:
+            node (DNode): Вузол, що належить цьому списку.
+        """
+        if self._index is not None:
+            self._index_unlink(node)
+        if node.prev is None:
+            self.head = node.next
+        else:
+            node.prev.next = node.next
+        if node.next is None:
+            self.tail = node.prev
+        else:
+            node.next.prev = node.prev
+        node.prev = node.next = None
+        self.size -= 1
+
+    def pop_first(self) -> Any:
+        """
+        Видаляє та повертає перший елемент списку за O(1).
+
+        Returns:
+            Any: Дані видаленого вузла.
+
+        Raises:
+            IndexError: Якщо список порожній.
+        """
+        if self.head is None:
+            raise IndexError("Видалення з порожнього списку")
+        node = self.head
+        self.remove_node(node)
+        return node.data
+
+    def pop_last(self) -> Any:
+        """
+        Видаляє та повертає останній елемент списку за O(1).
+
+        Returns:
+            Any: Дані видаленого вузла.
+
+        Raises:
+            IndexError: Якщо список порожній.
+        """
+        if self.tail is None:
+            raise IndexError("Видалення з порожнього списку")
+        node = self.tail
+        self.remove_node(node)
+        return node.data
+
+    def move_to_front(self, node: DNode) -> None:
+        """
+        Переносить вузол цього списку на початок за O(1).
+
+        Args:
+            node (DNode): Вузол, що належить цьому списку.
+        """
+        if node is self.head:
+            return
+        self.remove_node(node)
+        self._link_after(None, node)
+
+    def delete_node(self, key: Any) -> None:
+        """
+        Видаляє перший вузол із заданим ключем.
+
+        Args:
+            key (Any): Значення для видалення.
+        """
+        node = self.search_element(key)
+        if node is not None:
+            self.remove_node(node)
+
+    def reverse(self) -> None:
+        """
+        Реверсує список, міняючи місцями посилання prev та next кожного вузла.
+        """
+        node = self.head
+        while node is not None:
+            node.prev, node.next = node.next, node.prev
+            node = node.prev
+        self.head, self.tail = self.tail, self.head
+        if self._index is not None:
+            self._rebuild_index()
+
+    def sorted_insert(self, data: Any) -> None:
+        """
+        Вставляє елемент у відсортований список, зберігаючи порядок сортування.
+
+        Args:
+            data (Any): Дані для вставки.
+        """
+        prev = None
+        current = self.head
+        while current is not None and current.data < data:
+            prev = current
+            current = current.next
+        self._link_after(prev, DNode(data))
+
+    def sort(self, key: Optional[Callable[[Any], Any]] = None, reverse: bool = False,
+             method: str = "merge") -> None:
+        super().sort(key=key, reverse=reverse, method=method)
+        self._relink_prev()
+
+    def merge_with(self, sorted_list: LinkedList, in_place: bool = False) -> 'DoublyLinkedList':
+        """
+        Об'єднує два відсортовані списки в один відсортований двозв'язний список.
+
+        Args:
+            sorted_list (LinkedList): Інший відсортований список.
+            in_place (bool): Зшити вузли в поточний список, спорожнивши sorted_list.
+
+        Returns:
+            DoublyLinkedList: Результат злиття.
+
+        Raises:
+            TypeError: Якщо злиття на місці виконується з не двозв'язним списком.
+        """
+        if in_place:
+            if not isinstance(sorted_list, DoublyLinkedList):
+                raise TypeError("Злиття на місці можливе лише з DoublyLinkedList")
+            super().merge_with(sorted_list, in_place=True)
+            self._relink_prev()
+            return self
+        return super().merge_with(sorted_list)
+
+def merge_many(lists: Iterable[LinkedList], in_place: bool = False) -> LinkedList:
+    """
+    Зливає k відсортованих списків за O(N log k) за допомогою купи.
+
+    За рівних значень першим іде елемент зі списку, що стоїть раніше в lists.
+
+    Args:
+        lists (Iterable[LinkedList]): Відсортовані списки.
+        in_place (bool): Якщо True, існуючі вузли зшиваються без створення нових,
+            а всі вхідні списки стають порожніми.
+
+    Returns:
+        LinkedList: Новий об'єднаний відсортований список. Без in_place він має тип
+            першого зі списків (наприклад, SortedLinkedList чи DoublyLinkedList);
+            при in_place=True - звичайний LinkedList з перенесених вузлів.
+            Хеш-індекс результату ввімкнено, якщо він є в першого зі списків.
+
+    Raises:
+        ValueError: Якщо при in_place=True один і той самий список передано кілька разів.
+    """
+    lists = list(lists)
+    if in_place and len({id(llist) for llist in lists}) < len(lists):
+        raise ValueError("Неможливо злити список сам із собою на місці")
+    if not in_place and lists:
+        # extend підкласу зберігає його інваріанти; heapq.merge стабільний за порядком lists
+        merged_list = type(lists[0])(indexed=lists[0].indexed)
+        merged_list.extend(heapq.merge(*lists))
         return merged_list
+    merged_list = LinkedList()
+
+    # Купа зберігає (значення, індекс списку, вузол); індекс робить порядок стабільним
+    heap = [(llist.head.data, i, llist.head) for i, llist in enumerate(lists) if llist.head]
+    heapq.heapify(heap)
+
+    tail = None
+    while heap:
+        _, i, node = heap[0]
+        next_node = node.next
+        if next_node is not None:
+            heapq.heapreplace(heap, (next_node.data, i, next_node))
+        else:
+            heapq.heappop(heap)
+
+        if tail is None:
+            merged_list.head = node
+        else:
+            tail.next = node
+        tail = node
+        merged_list.size += 1
+
+    if tail is not None:
+        tail.next = None
+    merged_list.tail = tail
+
+    if in_place:
+        for llist in lists:
+            llist.clear()
+    return merged_list
+
+def benchmark_add_last(sizes: tuple = (10_000, 50_000, 100_000, 200_000), repeats: int = 3) -> None:
+    """
+    Вимірює час побудови списку через add_last для різних розмірів.
+
+    Завдяки посиланню на хвіст час на один елемент має залишатися сталим,
+    тобто загальний час побудови зростає лінійно.
+
+    Args:
+        sizes (tuple): Розміри списків для вимірювання.
+        repeats (int): Кількість повторів для кожного розміру.
+    """
+    def build(n: int) -> LinkedList:
+        llist = LinkedList()
+        for i in range(n):
+            llist.add_last(i)
+        return llist
+
+    print(f"{'N':>10} | {'Час, с':>10} | {'мкс/елемент':>12}")
+    for n in sizes:
+        dt = min(timeit.repeat(lambda: build(n), number=1, repeat=repeats))
+        print(f"{n:>10} | {dt:>10.4f} | {dt / n * 1e6:>12.3f}")
+
+def benchmark_sort(sizes: tuple = (1_000, 10_000, 100_000), repeats: int = 3) -> None:
+    """
+    Порівнює час роботи стратегій LinkedList.sort на випадкових даних.
+
+    Сортування вставками вимірюється лише для невеликих розмірів,
+    оскільки має квадратичну складність.
+
+    Args:
+        sizes (tuple): Розміри списків для вимірювання.
+        repeats (int): Кількість повторів для кожного розміру.
+    """
+    print(f"{'N':>10} | {'Метод':>10} | {'Час, с':>10}")
+    for n in sizes:
+        values = [random.random() for _ in range(n)]
+        for method in SORT_METHODS:
+            if method == "insertion" and n > 10_000:
+                continue
+
+            def run() -> None:
+                llist = LinkedList()
+                for value in values:
+                    llist.add_last(value)
+                llist.sort(method=method)
+
+            dt = min(timeit.repeat(run, number=1, repeat=repeats))
+            print(f"{n:>10} | {method:>10} | {dt:>10.4f}")
+
+def benchmark_node_memory(n: int = 200_000, repeats: int = 3) -> None:
+    """
+    Порівнює пам'ять на елемент і швидкість побудови списку для вузлів
+    з __slots__ (Node) та звичайних вузлів з __dict__.
+
+    Args:
+        n (int): Кількість елементів у списку.
+        repeats (int): Кількість повторів для вимірювання часу.
+    """
+    class DictNode:
+        """Вузол без __slots__ для порівняння."""
+        def __init__(self, data: Any):
+            self.data = data
+            self.next = None
+
+    def build(node_cls: type) -> Any:
+        # Однакові дані (None) для всіх вузлів, щоб вимірювалась лише вартість вузлів
+        head = tail = node_cls(None)
+        for _ in range(n - 1):
+            node = node_cls(None)
+            tail.next = node
+            tail = node
+        return head
+
+    print(f"{'Вузол':>10} | {'байт/елемент':>12} | {'млн елементів/с':>16}")
+    for name, node_cls in (("__dict__", DictNode), ("__slots__", Node)):
+        tracemalloc.start()
+        head = build(node_cls)
+        size, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        del head
+
+        dt = min(timeit.repeat(lambda: build(node_cls), number=1, repeat=repeats))
+        print(f"{name:>10} | {size / n:>12.1f} | {n / dt / 1e6:>16.2f}")
+
+def benchmark_sorted_insert(sizes: tuple = (10_000, 100_000, 1_000_000), plain_limit: int = 10_000) -> None:
+    """
+    Порівнює побудову сортованого списку потоком sorted_insert
+    для LinkedList (O(n) на вставку) та SortedLinkedList (очікуваний O(log n)).
+
+    Звичайний список вимірюється лише до plain_limit елементів,
+    оскільки побудова має квадратичну складність.
+
+    Args:
+        sizes (tuple): Кількість вставок.
+        plain_limit (int): Максимальний розмір для звичайного LinkedList.
+    """
+    print(f"{'N':>10} | {'LinkedList, с':>14} | {'SortedLinkedList, с':>20}")
+    for n in sizes:
+        values = [random.random() for _ in range(n)]
+        timings = []
+        for cls in (LinkedList, SortedLinkedList):
+            if cls is LinkedList and n > plain_limit:
+                timings.append("-")
+                continue
+            llist = cls()
+            start = timeit.default_timer()
+            for value in values:
+                llist.sorted_insert(value)
+            timings.append(f"{timeit.default_timer() - start:.3f}")
+        print(f"{n:>10} | {timings[0]:>14} | {timings[1]:>20}")
+
+def benchmark_concurrent(n: int = 200_000, producers: int = 2, consumers: int = 2) -> None:
+    """
+    Вимірює пропускну здатність ConcurrentLinkedList у сценарії "виробники - споживачі".
+
+    Args:
+        n (int): Кількість елементів на одного виробника.
+        producers (int): Кількість потоків-виробників.
+        consumers (int): Кількість потоків-споживачів.
+    """
+    llist = ConcurrentLinkedList()
+    total = n * producers
+    consumed = [0] * consumers
+
+    def produce() -> None:
+        for i in range(n):
+            llist.add_last(i)
+
+    def consume(slot: int) -> None:
+        # Споживачі завершуються, коли всі елементи оброблено
+        while sum(consumed) < total:
+            try:
+                llist.pop_first()
+            except IndexError:
+                continue
+            consumed[slot] += 1
+
+    threads = [threading.Thread(target=produce) for _ in range(producers)]
+    threads += [threading.Thread(target=consume, args=(i,)) for i in range(consumers)]
+    start = timeit.default_timer()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    dt = timeit.default_timer() - start
+    print(f"Виробників: {producers}, споживачів: {consumers}, операцій: {2 * total}")
+    print(f"Час: {dt:.3f} с, пропускна здатність: {2 * total / dt / 1e6:.2f} млн операцій/с")
+
+def benchmark_deque_ops(n: int = 200_000, cache_size: int = 1_000) -> None:
+    """
+    Порівнює DoublyLinkedList з collections.deque (черга) та OrderedDict (LRU-кеш).
+
+    Args:
+        n (int): Кількість операцій.
+        cache_size (int): Місткість LRU-кешу.
+    """
+    def queue_deque() -> None:
+        queue = deque()
+        for i in range(n):
+            queue.append(i)
+        while queue:
+            queue.popleft()
+
+    def queue_dll() -> None:
+        queue = DoublyLinkedList()
+        for i in range(n):
+            queue.add_last(i)
+        while queue.head is not None:
+            queue.pop_first()
+
+    keys = [random.randrange(cache_size * 2) for _ in range(n)]
+
+    def lru_ordered_dict() -> None:
+        cache = OrderedDict()
+        for k in keys:
+            if k in cache:
+                cache.move_to_end(k, last=False)
+            else:
+                cache[k] = k
+                cache.move_to_end(k, last=False)
+                if len(cache) > cache_size:
+                    cache.popitem(last=True)
+
+    def lru_dll() -> None:
+        order = DoublyLinkedList()
+        nodes = {}
+        for k in keys:
+            node = nodes.get(k)
+            if node is not None:
+                order.move_to_front(node)
+            else:
+                order.add_first(k)
+                nodes[k] = order.head
+                if len(order) > cache_size:
+                    del nodes[order.pop_last()]
+
+    print(f"{'Сценарій':>28} | {'Час, с':>8}")
+    for name, func in (("черга: deque", queue_deque),
+                       ("черга: DoublyLinkedList", queue_dll),
+                       ("LRU: OrderedDict", lru_ordered_dict),
+                       ("LRU: DoublyLinkedList", lru_dll)):
+        dt = min(timeit.repeat(func, number=1, repeat=3))
+        print(f"{name:>28} | {dt:>8.4f}")
 
 def test_case():
     # Testing
@@ -258,14 +1658,8 @@ def test_case():
     llist.display()
     
     print("Тест #8: Об'єднання двох відсортованих списків")
-    list1 = LinkedList()
-    for _ in range(10):
-        list1.add_last(random.randint(1, 100))
-    
-    
-    list2 = LinkedList()
-    for _ in range(10):
-        list2.add_last(random.randint(1, 100))
+    list1 = LinkedList.from_iterable(random.randint(1, 100) for _ in range(10))
+    list2 = LinkedList.from_iterable(random.randint(1, 100) for _ in range(10))
     
     list1.sort()
     list2.sort()
@@ -282,3 +1676,15 @@ def test_case():
 
 if __name__ == "__main__":
     test_case()
+    print("Бенчмарк: побудова списку через add_last")
+    benchmark_add_last()
+    print("Бенчмарк: стратегії сортування")
+    benchmark_sort()
+    print("Бенчмарк: пам'ять вузлів")
+    benchmark_node_memory()
+    print("Бенчмарк: сортована вставка")
+    benchmark_sorted_insert()
+    print("Бенчмарк: багатопотоковий список")
+    benchmark_concurrent()
+    print("Бенчмарк: двозв'язний список, deque та OrderedDict")
+    benchmark_deque_ops()
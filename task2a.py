@@ -2,17 +2,46 @@
 Скрипт для візуалізації фрактала "Дерево Піфагора" за допомогою matplotlib.
 """
 
+from concurrent.futures import ProcessPoolExecutor
+import itertools
 import math
+from multiprocessing import shared_memory
+import os
+import timeit
+from typing import Iterator, List, Optional, Sequence, Tuple
+import weakref
 import matplotlib.pyplot as plt
+from matplotlib.backends.backend_agg import FigureCanvasAgg
 from matplotlib.collections import LineCollection
+from matplotlib.figure import Figure
+from matplotlib.image import imsave
 import numpy as np
 
-# Конфігурація
+import export
+import raster
+
+# Конфігурація (значення для параметрів branch_angle та scale, не заданих явно;
+# читаються під час виклику)
 ANGLE = 45  # Кут повороту гілки (градуси)
 SCALE = 0.7  # Коефіцієнт зменшення довжини гілки
 BRANCH_LENGTH = 100  # Початкова довжина гілки
+CHUNK_SIZE = 65536  # Максимальна кількість сегментів в одній порції
+# Способи обчислення: прямий (cos/sin для кожної гілки), таблиці cos/sin для рівня,
+# таблиці + штампування шаблонного піддерева
+ENGINES = ("direct", "table", "template")
+
+def _tree_parameters(branch_angle: Optional[float], scale: Optional[float]) -> Tuple[float, float]:
+    """
+    Підставляє ANGLE та SCALE замість None.
 
-def get_tree_segments(x: float, y: float, angle: float, length: float, level: int) -> list:
+    Значення модуля читаються під час виклику, тож зміна task2a.ANGLE чи task2a.SCALE
+    діє на всі подальші виклики.
+    """
+    return (ANGLE if branch_angle is None else branch_angle,
+            SCALE if scale is None else scale)
+
+def get_tree_segments(x: float, y: float, angle: float, length: float, level: int,
+                      branch_angle: Optional[float] = None, scale: Optional[float] = None) -> list:
     """
     Рекурсивно обчислює координати сегментів дерева.
 
@@ -22,10 +51,14 @@ def get_tree_segments(x: float, y: float, angle: float, length: float, level: in
         angle (float): Кут нахилу гілки в градусах.
         length (float): Довжина гілки.
         level (int): Поточний рівень рекурсії.
+        branch_angle (Optional[float]): Кут повороту гілки відносно батьківської (градуси);
+            None - поточне значення ANGLE.
+        scale (Optional[float]): Коефіцієнт зменшення довжини гілки; None - поточне значення SCALE.
 
     Returns:
         list: Список сегментів, де кожен сегмент - це кортеж ((x1, y1), (x2, y2)).
     """
+    branch_angle, scale = _tree_parameters(branch_angle, scale)
     if level <= 0:
         return []
 
@@ -42,13 +75,495 @@ def get_tree_segments(x: float, y: float, angle: float, length: float, level: in
     
     # Рекурсивні виклики для лівої та правої гілок
     # Ліва гілка: кут збільшується
-    segments.extend(get_tree_segments(x_end, y_end, angle + ANGLE, length * SCALE, level - 1))
+    segments.extend(get_tree_segments(x_end, y_end, angle + branch_angle, length * scale, level - 1,
+                                      branch_angle, scale))
     
     # Права гілка: кут зменшується
-    segments.extend(get_tree_segments(x_end, y_end, angle - ANGLE, length * SCALE, level - 1))
+    segments.extend(get_tree_segments(x_end, y_end, angle - branch_angle, length * scale, level - 1,
+                                      branch_angle, scale))
     
     return segments
 
+def _level_blocks(segments: np.ndarray, level: int, top: int = 0, root: int = 0) -> List[np.ndarray]:
+    """
+    Повертає представлення рядків кожного рівня піддерева в масиві сегментів.
+
+    Гілки рівня top + j піддерева з коренем номер root (на рівні top) займають рядки
+    2^(top+j) - 1 + root * 2^j ... + 2^j; для всього дерева top = root = 0.
+
+    Args:
+        segments (np.ndarray): Масив сегментів дерева.
+        level (int): Кількість рівнів піддерева.
+        top (int): Рівень кореня піддерева.
+        root (int): Номер кореня серед гілок рівня top.
+
+    Returns:
+        List[np.ndarray]: Представлення (2^j, 2, 2) для j = 0..level-1, без копіювання.
+    """
+    blocks = []
+    for j in range(level):
+        width = 2 ** j
+        start = 2 ** (top + j) - 1 + root * width
+        blocks.append(segments[start:start + width])
+    return blocks
+
+def _fill_levels_table(blocks: Sequence[np.ndarray], x: float, y: float, rad_angle: float,
+                       length: float, branch_angle: float, scale: float) -> tuple:
+    """
+    Заповнює рівні сегментів за таблицями cos/sin, обчисленими один раз на рівень.
+
+    Кут гілки рівня depth залежить лише від кількості правих поворотів r на шляху
+    від стовбура: rad_angle + branch_angle * (depth - 2r), а довжина однакова для всього
+    рівня. Тож замість cos/sin для кожної гілки береться значення з таблиці
+    з depth + 1 елементів.
+
+    Args:
+        blocks (Sequence[np.ndarray]): Представлення рівнів для заповнення (_level_blocks).
+        x (float): Координата X початку стовбура.
+        y (float): Координата Y початку стовбура.
+        rad_angle (float): Кут нахилу стовбура в радіанах.
+        length (float): Довжина стовбура.
+        branch_angle (float): Кут повороту гілки відносно батьківської (градуси).
+        scale (float): Коефіцієнт зменшення довжини гілки.
+
+    Returns:
+        tuple: Початки гілок наступного рівня (xs, ys), їхні кількості правих
+        поворотів та довжина.
+    """
+    xs = np.array([x], dtype=float)
+    ys = np.array([y], dtype=float)
+    turns = np.zeros(1, dtype=np.int64)
+    delta = math.radians(branch_angle)
+
+    for depth, block in enumerate(blocks):
+        angles = rad_angle + delta * (depth - 2 * np.arange(depth + 1))
+        cos_table = length * np.cos(angles)
+        sin_table = length * np.sin(angles)
+        x_end = xs + cos_table[turns]
+        y_end = ys + sin_table[turns]
+
+        block[:, 0, 0] = xs
+        block[:, 0, 1] = ys
+        block[:, 1, 0] = x_end
+        block[:, 1, 1] = y_end
+
+        # Ліва гілка зберігає кількість правих поворотів, права - збільшує на 1
+        xs = np.repeat(x_end, 2)
+        ys = np.repeat(y_end, 2)
+        turns = (turns[:, None] + np.array([0, 1])).ravel()
+        length *= scale
+
+    return xs, ys, turns, length
+
+def _fill_levels_direct(blocks: Sequence[np.ndarray], x: float, y: float, rad_angle: float,
+                        length: float, branch_angle: float, scale: float) -> None:
+    """
+    Заповнює рівні сегментів, обчислюючи cos/sin для кожної гілки.
+
+    Args:
+        blocks (Sequence[np.ndarray]): Представлення рівнів для заповнення (_level_blocks).
+        x (float): Координата X початку стовбура.
+        y (float): Координата Y початку стовбура.
+        rad_angle (float): Кут нахилу стовбура в радіанах.
+        length (float): Довжина стовбура.
+        branch_angle (float): Кут повороту гілки відносно батьківської (градуси).
+        scale (float): Коефіцієнт зменшення довжини гілки.
+    """
+    xs = np.array([x], dtype=float)
+    ys = np.array([y], dtype=float)
+    angles = np.array([rad_angle])
+    lengths = np.array([length], dtype=float)
+    delta = math.radians(branch_angle)
+
+    for block in blocks:
+        x_end = xs + lengths * np.cos(angles)
+        y_end = ys + lengths * np.sin(angles)
+
+        block[:, 0, 0] = xs
+        block[:, 0, 1] = ys
+        block[:, 1, 0] = x_end
+        block[:, 1, 1] = y_end
+
+        # Кожна гілка породжує ліву (кут + branch_angle) та праву (кут - branch_angle) гілки
+        xs = np.repeat(x_end, 2)
+        ys = np.repeat(y_end, 2)
+        angles = np.column_stack((angles + delta, angles - delta)).ravel()
+        lengths = np.repeat(lengths * scale, 2)
+
+def _fill_levels_template(blocks: Sequence[np.ndarray], x: float, y: float, rad_angle: float,
+                          length: float, branch_angle: float, scale: float) -> None:
+    """
+    Заповнює верхню половину рівнів за таблицями, а нижню - копіями одного піддерева.
+
+    Піддерево обчислюється для стовбура (0, 0, 0°, 1): кожне піддерево - його копія,
+    повернута, масштабована та зсунута до свого кореня. Повернутих копій лише
+    стільки, скільки різних кутів на рівні коренів.
+
+    Args:
+        blocks (Sequence[np.ndarray]): Представлення рівнів для заповнення (_level_blocks).
+        x (float): Координата X початку стовбура.
+        y (float): Координата Y початку стовбура.
+        rad_angle (float): Кут нахилу стовбура в радіанах.
+        length (float): Довжина стовбура.
+        branch_angle (float): Кут повороту гілки відносно батьківської (градуси).
+        scale (float): Коефіцієнт зменшення довжини гілки.
+    """
+    level = len(blocks)
+    top = level // 2
+    sub = level - top
+    xs, ys, turns, branch = _fill_levels_table(blocks[:top], x, y, rad_angle, length,
+                                               branch_angle, scale)
+    template = np.empty((2 ** sub - 1, 2, 2))
+    _fill_levels_table(_level_blocks(template, sub), 0.0, 0.0, 0.0, 1.0, branch_angle, scale)
+
+    # Шаблон, повернутий та масштабований для кожного можливого кута кореня
+    delta = math.radians(branch_angle)
+    root_angles = rad_angle + delta * (top - 2 * np.arange(top + 1))
+    cos_r = (branch * np.cos(root_angles))[:, None, None]
+    sin_r = (branch * np.sin(root_angles))[:, None, None]
+    rotated = np.empty((top + 1,) + template.shape)
+    rotated[..., 0] = cos_r * template[..., 0] - sin_r * template[..., 1]
+    rotated[..., 1] = sin_r * template[..., 0] + cos_r * template[..., 1]
+
+    roots = np.column_stack((xs, ys))[:, None, None, :]
+    for j in range(sub):
+        # Гілки рівня top + j упорядковані як (корінь, гілка шаблону рівня j)
+        width = 2 ** j
+        block = blocks[top + j].reshape(2 ** top, width, 2, 2)
+        np.add(rotated[turns, width - 1:2 * width - 1], roots, out=block)
+
+# Функції заповнення рівнів для кожного способу обчислення з ENGINES
+_FILLERS = {"direct": _fill_levels_direct, "table": _fill_levels_table,
+            "template": _fill_levels_template}
+
+def _fill_shared_subtrees(storage: str, shape: tuple, level: int, top: int, first_root: int,
+                          xs: np.ndarray, ys: np.ndarray, angles: np.ndarray, length: float,
+                          engine: str, branch_angle: float, scale: float) -> None:
+    """
+    Виконується в дочірньому процесі: обчислює піддерева прямо в спільній пам'яті.
+
+    Рівні кожного піддерева займають окремі діапазони рядків (_level_blocks),
+    тож процеси пишуть у неперетинні діапазони без проміжних копій,
+    і результат не серіалізується назад.
+
+    Args:
+        storage (str): Ім'я сегмента multiprocessing.shared_memory.
+        shape (tuple): Форма масиву сегментів.
+        level (int): Кількість рівнів усього дерева.
+        top (int): Рівень коренів піддерев.
+        first_root (int): Номер першого кореня.
+        xs (np.ndarray): Координати X початків коренів.
+        ys (np.ndarray): Координати Y початків коренів.
+        angles (np.ndarray): Кути коренів у градусах.
+        length (float): Довжина гілок рівня top.
+        engine (str): Спосіб обчислення з ENGINES.
+        branch_angle (float): Кут повороту гілки відносно батьківської (градуси).
+        scale (float): Коефіцієнт зменшення довжини гілки.
+    """
+    shm = shared_memory.SharedMemory(name=storage)
+    segments = np.ndarray(shape, dtype=float, buffer=shm.buf)
+    # Сегмент закривається, коли зникає останнє представлення масиву,
+    # зокрема збережене у трасуванні винятку
+    weakref.finalize(segments, shm.close)
+    fill = _FILLERS[engine]
+    for index in range(len(xs)):
+        # Рівні піддерева заповнюються прямо в їхні рядки спільного масиву
+        blocks = _level_blocks(segments, level - top, top, first_root + index)
+        fill(blocks, xs[index], ys[index], math.radians(angles[index]), length,
+             branch_angle, scale)
+
+def _segments_parallel(x: float, y: float, angle: float, length: float, level: int,
+                       engine: str, workers: int, split_level: Optional[int],
+                       branch_angle: float, scale: float) -> np.ndarray:
+    """
+    Обчислює сегменти в кількох процесах, розділивши дерево на незалежні піддерева.
+
+    Рівні до split_level обчислюються в поточному процесі за таблицями cos/sin,
+    далі кожне піддерево - окреме завдання ProcessPoolExecutor, що пише
+    в сегмент multiprocessing.shared_memory.
+
+    Args:
+        x (float): Координата X початку стовбура.
+        y (float): Координата Y початку стовбура.
+        angle (float): Кут нахилу стовбура в градусах.
+        length (float): Довжина стовбура.
+        level (int): Кількість рівнів.
+        engine (str): Спосіб обчислення піддерев з ENGINES.
+        workers (int): Кількість процесів.
+        split_level (Optional[int]): Рівень коренів піддерев; за замовчуванням
+            найменший, на якому піддерев щонайменше вчетверо більше за процеси.
+        branch_angle (float): Кут повороту гілки відносно батьківської (градуси).
+        scale (float): Коефіцієнт зменшення довжини гілки.
+
+    Returns:
+        np.ndarray: Масив сегментів (2^level - 1, 2, 2) у тому ж порядку, що й без процесів,
+        розміщений у спільній пам'яті.
+    """
+    if split_level is None:
+        split_level = (4 * workers - 1).bit_length()
+    top = max(0, min(split_level, level - 1))
+    shape = (2 ** level - 1, 2, 2)
+    shm = shared_memory.SharedMemory(create=True, size=int(np.prod(shape)) * 8)
+    segments = np.ndarray(shape, dtype=float, buffer=shm.buf)
+    # Результат залишається у спільній пам'яті без копії; сегмент закривається
+    # разом з останнім представленням масиву
+    weakref.finalize(segments, shm.close)
+    try:
+        xs, ys, turns, branch = _fill_levels_table(_level_blocks(segments, top), x, y,
+                                                   math.radians(angle), length, branch_angle, scale)
+        root_angles = angle + branch_angle * (top - 2 * turns)
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(_fill_shared_subtrees, shm.name, shape, level, top, root,
+                                   xs[root:root + 1], ys[root:root + 1],
+                                   root_angles[root:root + 1], branch, engine,
+                                   branch_angle, scale)
+                       for root in range(2 ** top)]
+            for future in futures:
+                future.result()
+    finally:
+        # Ім'я більше не потрібне: відображена пам'ять живе до закриття сегмента
+        shm.unlink()
+    return segments
+
+def get_tree_segments_vectorized(x: float, y: float, angle: float, length: float, level: int,
+                                 engine: str = "direct", workers: int = 1,
+                                 split_level: Optional[int] = None,
+                                 branch_angle: Optional[float] = None, scale: Optional[float] = None,
+                                 out: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Обчислює сегменти дерева рівень за рівнем без рекурсії.
+
+    Усі гілки одного рівня обчислюються однією операцією NumPy над масивами
+    (x, y, кут, довжина). Сегменти впорядковані за рівнями (спочатку стовбур,
+    далі гілки рівня 2 тощо), а не в порядку рекурсивного обходу.
+
+    Рушій "template" обчислює верхню половину рівнів за таблицями, а нижню
+    отримує з одного піддерева, обчисленого для стовбура (0, 0, 0°, 1):
+    кожне піддерево - його копія, повернута, масштабована та зсунута до свого
+    кореня. Повернутих копій лише стільки, скільки різних кутів на рівні коренів.
+
+    Args:
+        x (float): Координата X початку стовбура.
+        y (float): Координата Y початку стовбура.
+        angle (float): Кут нахилу стовбура в градусах.
+        length (float): Довжина стовбура.
+        level (int): Кількість рівнів.
+        engine (str): "direct" - cos/sin для кожної гілки; "table" - таблиці cos/sin
+            для кожного рівня; "template" - таблиці та штампування піддерева.
+        workers (int): Кількість процесів; більше 1 - піддерева з коренями на рівні
+            split_level обчислюються паралельно, і результат повертається без копії
+            з сегмента спільної пам'яті.
+        split_level (Optional[int]): Рівень, на якому дерево ділиться між процесами.
+        branch_angle (Optional[float]): Кут повороту гілки відносно батьківської (градуси);
+            None - поточне значення ANGLE.
+        scale (Optional[float]): Коефіцієнт зменшення довжини гілки; None - поточне значення SCALE.
+        out (Optional[np.ndarray]): Готовий масив (N, 2, 2) для повторного використання
+            між викликами; лише з workers=1.
+
+    Returns:
+        np.ndarray: Суцільний масив форми (N, 2, 2) з N = 2^level - 1 сегментами,
+        який можна напряму передати в LineCollection.
+
+    Raises:
+        ValueError: Якщо engine невідомий, out має іншу форму чи тип
+            або out задано разом з workers > 1.
+    """
+    branch_angle, scale = _tree_parameters(branch_angle, scale)
+    if engine not in ENGINES:
+        raise ValueError(f"Невідомий спосіб обчислення: {engine}")
+    shape = (2 ** max(level, 0) - 1, 2, 2)
+    if out is not None:
+        if out.shape != shape or out.dtype != np.float64:
+            raise ValueError(f"Очікується масив форми {shape} з типом float64")
+        if workers > 1:
+            raise ValueError("out не можна поєднувати з workers > 1: процеси пишуть у спільну пам'ять")
+    if level <= 0:
+        return np.empty(shape) if out is None else out
+    if workers > 1:
+        return _segments_parallel(x, y, angle, length, level, engine, workers, split_level,
+                                  branch_angle, scale)
+
+    segments = np.empty(shape) if out is None else out
+    _FILLERS[engine](_level_blocks(segments, level), x, y, math.radians(angle), length,
+                     branch_angle, scale)
+    return segments
+
+def iter_tree_segments(x: float, y: float, angle: float, length: float, level: int,
+                       chunk_size: int = CHUNK_SIZE, branch_angle: Optional[float] = None,
+                       scale: Optional[float] = None) -> Iterator[np.ndarray]:
+    """
+    Генерує сегменти дерева порціями обмеженого розміру.
+
+    Дерево ділиться на верхню частину та піддерева з не більше ніж chunk_size
+    сегментів. Верхня частина обробляється рекурсивно тим самим способом,
+    а піддерева обчислюються векторизовано по одному, тож пікове використання
+    пам'яті не залежить від рівня. Кожен сегмент повертається рівно один раз,
+    але порядок відрізняється від get_tree_segments.
+
+    Args:
+        x (float): Координата X початку стовбура.
+        y (float): Координата Y початку стовбура.
+        angle (float): Кут нахилу стовбура в градусах.
+        length (float): Довжина стовбура.
+        level (int): Кількість рівнів.
+        chunk_size (int): Максимальна кількість сегментів у порції.
+        branch_angle (Optional[float]): Кут повороту гілки відносно батьківської (градуси);
+            None - поточне значення ANGLE.
+        scale (Optional[float]): Коефіцієнт зменшення довжини гілки; None - поточне значення SCALE.
+
+    Yields:
+        np.ndarray: Порції сегментів форми (n, 2, 2), n <= chunk_size.
+    """
+    branch_angle, scale = _tree_parameters(branch_angle, scale)
+    if chunk_size < 1:
+        raise ValueError("Розмір порції має бути більше нуля")
+    if level <= 0:
+        return
+
+    # Найбільше піддерево, що вміщується в одну порцію
+    sub_levels = min(level, (chunk_size + 1).bit_length() - 1)
+    top_levels = level - sub_levels
+    if top_levels == 0:
+        yield get_tree_segments_vectorized(x, y, angle, length, level,
+                                           branch_angle=branch_angle, scale=scale)
+        return
+
+    yield from iter_tree_segments(x, y, angle, length, top_levels, chunk_size, branch_angle, scale)
+
+    delta = branch_angle
+    sub_length = length * scale ** top_levels
+    for index in range(2 ** top_levels):
+        # Шлях до кореня піддерева задається бітами індексу (0 - ліва гілка, 1 - права)
+        x_root, y_root, angle_root, branch = x, y, angle, length
+        for bit in range(top_levels - 1, -1, -1):
+            rad_angle = math.radians(angle_root)
+            x_root += branch * math.cos(rad_angle)
+            y_root += branch * math.sin(rad_angle)
+            angle_root += -delta if (index >> bit) & 1 else delta
+            branch *= scale
+        yield get_tree_segments_vectorized(x_root, y_root, angle_root, sub_length, sub_levels,
+                                           branch_angle=branch_angle, scale=scale)
+
+def get_tree_segments_lod(x: float, y: float, angle: float, length: float, level: int,
+                          min_length: float = 0.0,
+                          bounds: Optional[raster.Bounds] = None,
+                          branch_angle: Optional[float] = None, scale: Optional[float] = None) -> np.ndarray:
+    """
+    Обчислює лише видиму частину дерева (рівень деталізації залежить від вигляду).
+
+    Гілка коротша за min_length ще малюється, але не ділиться далі. Гілка,
+    все піддерево якої гарантовано лежить поза bounds, відкидається разом
+    з нащадками: піддерево вміщується в коло з центром на початку гілки
+    і радіусом, рівним сумі довжин гілок на шляху донизу. Тож вартість
+    визначається видимими деталями, а не 2^level.
+
+    Args:
+        x (float): Координата X початку стовбура.
+        y (float): Координата Y початку стовбура.
+        angle (float): Кут нахилу стовбура в градусах.
+        length (float): Довжина стовбура.
+        level (int): Максимальна кількість рівнів.
+        min_length (float): Найменша довжина гілки, що ще ділиться (наприклад, розмір пікселя).
+        bounds (Optional[raster.Bounds]): Видима область (xmin, ymin, xmax, ymax);
+            None - без відсікання за областю.
+        branch_angle (Optional[float]): Кут повороту гілки відносно батьківської (градуси);
+            None - поточне значення ANGLE.
+        scale (Optional[float]): Коефіцієнт зменшення довжини гілки; None - поточне значення SCALE.
+
+    Returns:
+        np.ndarray: Масив сегментів форми (M, 2, 2), упорядкований за рівнями.
+    """
+    branch_angle, scale = _tree_parameters(branch_angle, scale)
+    if level <= 0:
+        return np.empty((0, 2, 2))
+
+    xs = np.array([x], dtype=float)
+    ys = np.array([y], dtype=float)
+    angles = np.array([math.radians(angle)])
+    lengths = np.array([length], dtype=float)
+    delta = math.radians(branch_angle)
+
+    blocks = []
+    for depth in range(level):
+        if bounds is not None:
+            # Радіус кола, що містить гілку та всіх її нащадків на решті рівнів
+            remaining = level - depth
+            reach = remaining if scale == 1 else (1 - scale ** remaining) / (1 - scale)
+            visible = raster.circles_intersect_box(xs, ys, lengths * abs(reach), bounds)
+            xs, ys, angles, lengths = xs[visible], ys[visible], angles[visible], lengths[visible]
+        if xs.shape[0] == 0:
+            break
+
+        x_end = xs + lengths * np.cos(angles)
+        y_end = ys + lengths * np.sin(angles)
+        block = np.empty((xs.shape[0], 2, 2))
+        block[:, 0, 0] = xs
+        block[:, 0, 1] = ys
+        block[:, 1, 0] = x_end
+        block[:, 1, 1] = y_end
+        blocks.append(block)
+
+        # Діляться лише гілки, не менші за поріг деталізації
+        split = lengths >= min_length
+        xs = np.repeat(x_end[split], 2)
+        ys = np.repeat(y_end[split], 2)
+        angles = np.column_stack((angles[split] + delta, angles[split] - delta)).ravel()
+        lengths = np.repeat(lengths[split] * scale, 2)
+
+    return np.concatenate(blocks) if blocks else np.empty((0, 2, 2))
+
+def benchmark_segments(levels: tuple = (10, 14, 18), repeats: int = 3) -> None:
+    """
+    Порівнює рекурсивну та векторизовану генерацію сегментів.
+
+    Args:
+        levels (tuple): Рівні рекурсії для вимірювання.
+        repeats (int): Кількість повторів.
+    """
+    print(f"{'Рівень':>7} | {'Сегментів':>10} | {'Рекурсія, с':>12} | {'NumPy, с':>10} | {'Прискорення':>11}")
+    for level in levels:
+        recursive = min(timeit.repeat(
+            lambda: get_tree_segments(0, 0, 90, BRANCH_LENGTH, level), number=1, repeat=repeats))
+        vectorized = min(timeit.repeat(
+            lambda: get_tree_segments_vectorized(0, 0, 90, BRANCH_LENGTH, level), number=1, repeat=repeats))
+        print(f"{level:>7} | {2 ** level - 1:>10} | {recursive:>12.4f} | {vectorized:>10.4f} | "
+              f"{recursive / vectorized:>10.1f}x")
+
+def benchmark_engines(levels: tuple = (14, 18, 22), repeats: int = 3) -> None:
+    """
+    Порівнює способи обчислення сегментів: прямий, таблиці cos/sin та штампування шаблону.
+
+    Args:
+        levels (tuple): Рівні рекурсії.
+        repeats (int): Кількість повторів.
+    """
+    print(f"{'Рівень':>7} | " + " | ".join(f"{engine + ', с':>12}" for engine in ENGINES))
+    for level in levels:
+        times = [min(timeit.repeat(
+            lambda: get_tree_segments_vectorized(0, 0, 90, BRANCH_LENGTH, level, engine=engine),
+            number=1, repeat=repeats)) for engine in ENGINES]
+        print(f"{level:>7} | " + " | ".join(f"{elapsed:>12.4f}" for elapsed in times))
+
+def benchmark_parallel(level: int = 24, workers: tuple = (1, 2, 4, 8, 16, 32),
+                       engine: str = "direct") -> None:
+    """
+    Вимірює масштабування паралельної генерації сегментів з кількістю процесів.
+
+    Args:
+        level (int): Рівень рекурсії.
+        workers (tuple): Кількості процесів.
+        engine (str): Спосіб обчислення з ENGINES.
+    """
+    # Прискорення обмежене кількістю ядер, тож вона друкується разом з результатами
+    print(f"Ядер: {os.cpu_count()}")
+    print(f"{'Процесів':>9} | {'Час, с':>8} | {'Прискорення':>11}")
+    baseline = None
+    for count in workers:
+        elapsed = timeit.timeit(lambda: get_tree_segments_vectorized(
+            0, 0, 90, BRANCH_LENGTH, level, engine=engine, workers=count), number=1)
+        baseline = baseline or elapsed
+        print(f"{count:>9} | {elapsed:>8.3f} | {baseline / elapsed:>10.1f}x")
+
 def draw_tree(level: int) -> None:
     """
     Візуалізує дерево Піфагора за допомогою matplotlib.
@@ -57,9 +572,9 @@ def draw_tree(level: int) -> None:
         level (int): Рівень рекурсії.
     """
     # Початкові параметри: (0, 0), кут 90 (вгору), початкова довжина
-    segments = get_tree_segments(0, 0, 90, BRANCH_LENGTH, level)
+    segments = get_tree_segments_vectorized(0, 0, 90, BRANCH_LENGTH, level)
     
-    if not segments:
+    if len(segments) == 0:
         print("Немає сегментів для відображення.")
         return
 
@@ -82,6 +597,280 @@ def draw_tree(level: int) -> None:
     
     plt.show()
 
+def draw_tree_streaming(level: int, filename: str, chunk_size: int = CHUNK_SIZE,
+                        figsize: tuple = (10, 8), dpi: int = 100, branch_angle: Optional[float] = None,
+                        scale: Optional[float] = None) -> None:
+    """
+    Малює дерево у PNG-файл, передаючи сегменти рендеру порціями.
+
+    Кожна порція малюється в буфер Agg і одразу звільняється, тому
+    пам'ять не зростає з рівнем рекурсії. Межі осей дає tree_bounds:
+    точні межі верхніх рівнів, розширені на суму довжин гілок решти рівнів.
+
+    Args:
+        level (int): Рівень рекурсії.
+        filename (str): Шлях до вихідного PNG-файлу.
+        chunk_size (int): Максимальна кількість сегментів у порції.
+        figsize (tuple): Розмір зображення в дюймах.
+        dpi (int): Роздільна здатність.
+        branch_angle (Optional[float]): Кут повороту гілки відносно батьківської (градуси);
+            None - поточне значення ANGLE.
+        scale (Optional[float]): Коефіцієнт зменшення довжини гілки; None - поточне значення SCALE.
+    """
+    branch_angle, scale = _tree_parameters(branch_angle, scale)
+    fig = Figure(figsize=figsize, dpi=dpi)
+    canvas = FigureCanvasAgg(fig)
+    ax = fig.add_subplot()
+
+    xmin, ymin, xmax, ymax = tree_bounds(level, branch_angle, scale)
+    ax.set_xlim(xmin, xmax)
+    ax.set_ylim(ymin, ymax)
+    ax.set_aspect('equal')
+    ax.axis('off')
+    ax.set_title(f"Дерево Піфагора (рівень {level})")
+    canvas.draw()
+
+    for chunk in iter_tree_segments(0, 0, 90, BRANCH_LENGTH, level, chunk_size, branch_angle, scale):
+        lc = LineCollection(chunk, colors='brown', linewidths=1)
+        ax.add_collection(lc, autolim=False)
+        ax.draw_artist(lc)
+        lc.remove()
+
+    imsave(filename, np.asarray(canvas.buffer_rgba()))
+
+def save_tree_png(level: int, filename: str, width: int = 1024, height: int = 1024,
+                  antialias: int = 1, branch_angle: Optional[float] = None, scale: Optional[float] = None) -> None:
+    """
+    Растеризує дерево в PNG без matplotlib-об'єктів для кожного сегмента.
+
+    Args:
+        level (int): Рівень рекурсії.
+        filename (str): Шлях до вихідного PNG-файлу.
+        width (int): Ширина зображення в пікселях.
+        height (int): Висота зображення в пікселях.
+        antialias (int): Коефіцієнт суперсемплінгу (1 - без згладжування).
+        branch_angle (Optional[float]): Кут повороту гілки відносно батьківської (градуси);
+            None - поточне значення ANGLE.
+        scale (Optional[float]): Коефіцієнт зменшення довжини гілки; None - поточне значення SCALE.
+    """
+    branch_angle, scale = _tree_parameters(branch_angle, scale)
+    segments = get_tree_segments_vectorized(0, 0, 90, BRANCH_LENGTH, level,
+                                            branch_angle=branch_angle, scale=scale)
+    image = raster.render_segments(segments, width, height, antialias=antialias)
+    raster.save_png(image, filename)
+
+def save_tree_view_png(level: int, filename: str, bounds: raster.Bounds,
+                       width: int = 1024, height: int = 1024, antialias: int = 1,
+                       detail: float = 1.0, branch_angle: Optional[float] = None,
+                       scale: Optional[float] = None) -> int:
+    """
+    Растеризує збільшений фрагмент глибокого дерева, генеруючи лише видимі деталі.
+
+    Args:
+        level (int): Максимальний рівень рекурсії.
+        filename (str): Шлях до вихідного PNG-файлу.
+        bounds (raster.Bounds): Видима область (xmin, ymin, xmax, ymax).
+        width (int): Ширина зображення в пікселях.
+        height (int): Висота зображення в пікселях.
+        antialias (int): Коефіцієнт суперсемплінгу (1 - без згладжування).
+        detail (float): Поріг поділу гілки в пікселях (менше - детальніше).
+        branch_angle (Optional[float]): Кут повороту гілки відносно батьківської (градуси);
+            None - поточне значення ANGLE.
+        scale (Optional[float]): Коефіцієнт зменшення довжини гілки; None - поточне значення SCALE.
+
+    Returns:
+        int: Кількість намальованих сегментів.
+    """
+    branch_angle, scale = _tree_parameters(branch_angle, scale)
+    min_length = detail * raster.pixel_size(bounds, width * antialias, height * antialias, margin=0)
+    segments = get_tree_segments_lod(0, 0, 90, BRANCH_LENGTH, level, min_length, bounds,
+                                     branch_angle, scale)
+    image = raster.render_segments(segments, width, height, antialias=antialias,
+                                   bounds=bounds, margin=0)
+    raster.save_png(image, filename)
+    return len(segments)
+
+def _render_variants(level: int, variants: list, width: int, height: int, antialias: int,
+                     engine: str) -> None:
+    """
+    Рендерить варіанти (кут, коефіцієнт, файл) у PNG одним процесом.
+
+    Буфери сегментів і полотна виділяються один раз і заповнюються заново
+    для кожного варіанта.
+    """
+    segments = np.empty((max(2 ** level - 1, 0), 2, 2))
+    canvas = np.empty((height * antialias, width * antialias, 3))
+    for branch_angle, scale, filename in variants:
+        get_tree_segments_vectorized(0, 0, 90, BRANCH_LENGTH, level, engine=engine,
+                                     branch_angle=branch_angle, scale=scale, out=segments)
+        image = raster.render_segments(segments, width, height, antialias=antialias, out=canvas)
+        raster.save_png(image, filename)
+
+def render_sweep(level: int, angles: Sequence[float], scales: Sequence[float], directory: str,
+                 width: int = 512, height: int = 512, antialias: int = 1, workers: int = 1,
+                 engine: str = "direct") -> List[str]:
+    """
+    Генерує та растеризує дерева для всієї сітки параметрів (кут x коефіцієнт).
+
+    Параметри передаються кожному виклику, а не через глобальні ANGLE та SCALE,
+    тож варіанти можна безпечно обчислювати одночасно. Варіанти розподіляються
+    між процесами ProcessPoolExecutor порівну; кожен процес повторно використовує
+    свої буфери.
+
+    Args:
+        level (int): Рівень рекурсії.
+        angles (Sequence[float]): Кути повороту гілки (градуси).
+        scales (Sequence[float]): Коефіцієнти зменшення довжини гілки.
+        directory (str): Каталог для PNG-файлів (створюється за потреби).
+        width (int): Ширина зображення в пікселях.
+        height (int): Висота зображення в пікселях.
+        antialias (int): Коефіцієнт суперсемплінгу (1 - без згладжування).
+        workers (int): Кількість процесів.
+        engine (str): Спосіб обчислення сегментів з ENGINES.
+
+    Returns:
+        List[str]: Шляхи до файлів у порядку сітки (кут зовнішній, коефіцієнт внутрішній).
+    """
+    os.makedirs(directory, exist_ok=True)
+    variants = [(branch_angle, scale,
+                 os.path.join(directory, f"tree_{index:04d}_a{branch_angle:g}_s{scale:g}.png"))
+                for index, (branch_angle, scale) in enumerate(itertools.product(angles, scales))]
+    if workers <= 1:
+        _render_variants(level, variants, width, height, antialias, engine)
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(_render_variants, level, variants[start::workers],
+                                   width, height, antialias, engine)
+                       for start in range(min(workers, len(variants)))]
+            for future in futures:
+                future.result()
+    return [filename for _, _, filename in variants]
+
+def tree_bounds(level: int, branch_angle: Optional[float] = None, scale: Optional[float] = None,
+                exact_levels: int = 12) -> raster.Bounds:
+    """
+    Оцінює межі дерева без побудови всіх сегментів.
+
+    Межі перших exact_levels рівнів обчислюються точно й розширюються на суму
+    довжин гілок решти рівнів, тож результат гарантовано охоплює все дерево.
+
+    Args:
+        level (int): Рівень рекурсії.
+        branch_angle (Optional[float]): Кут повороту гілки відносно батьківської (градуси);
+            None - поточне значення ANGLE.
+        scale (Optional[float]): Коефіцієнт зменшення довжини гілки; None - поточне значення SCALE.
+        exact_levels (int): Кількість рівнів, що обчислюються точно.
+
+    Returns:
+        raster.Bounds: Межі (xmin, ymin, xmax, ymax).
+    """
+    branch_angle, scale = _tree_parameters(branch_angle, scale)
+    shallow = max(1, min(level, exact_levels))
+    segments = get_tree_segments_vectorized(0, 0, 90, BRANCH_LENGTH, shallow,
+                                            branch_angle=branch_angle, scale=scale)
+    xmin, ymin, xmax, ymax = raster.segments_bounds(segments)
+    remaining = max(level - shallow, 0)
+    branch = BRANCH_LENGTH * scale ** shallow
+    reach = branch * remaining if scale == 1 else branch * (1 - scale ** remaining) / (1 - scale)
+    return xmin - reach, ymin - reach, xmax + reach, ymax + reach
+
+def export_tree(level: int, filename: str, branch_angle: Optional[float] = None, scale: Optional[float] = None,
+                chunk_size: int = CHUNK_SIZE) -> None:
+    """
+    Експортує сегменти дерева у файл; формат визначається розширенням.
+
+    .svg, .npy, .txt та .csv записуються потоково з iter_tree_segments, тож пам'ять
+    не зростає з рівнем (сегменти йдуть у порядку порцій). .npz містить масив
+    сегментів у порядку рівнів разом з параметрами побудови.
+
+    Args:
+        level (int): Рівень рекурсії.
+        filename (str): Шлях до вихідного файлу (.svg, .npy, .npz, .txt або .csv).
+        branch_angle (Optional[float]): Кут повороту гілки відносно батьківської (градуси);
+            None - поточне значення ANGLE.
+        scale (Optional[float]): Коефіцієнт зменшення довжини гілки; None - поточне значення SCALE.
+        chunk_size (int): Максимальна кількість сегментів у порції.
+    """
+    branch_angle, scale = _tree_parameters(branch_angle, scale)
+    if level <= 0:
+        raise ValueError("Рівень рекурсії повинен бути більше нуля")
+    extension = os.path.splitext(filename)[1].lower()
+    chunks = iter_tree_segments(0, 0, 90, BRANCH_LENGTH, level, chunk_size, branch_angle, scale)
+    if extension == ".svg":
+        export.save_segments_svg(chunks, filename, tree_bounds(level, branch_angle, scale),
+                                 chunk_size=chunk_size)
+    elif extension == ".npy":
+        export.save_npy(chunks, filename, count=2 ** level - 1)
+    elif extension == ".npz":
+        segments = get_tree_segments_vectorized(0, 0, 90, BRANCH_LENGTH, level,
+                                                branch_angle=branch_angle, scale=scale)
+        export.save_npz(filename, segments=segments, level=np.array(level),
+                        branch_angle=np.array(branch_angle), scale=np.array(scale))
+    elif extension in (".txt", ".csv"):
+        export.save_text(chunks, filename, delimiter="," if extension == ".csv" else " ",
+                         header=("x0", "y0", "x1", "y1"), chunk_size=chunk_size)
+    else:
+        raise ValueError(f"Непідтримуваний формат: {extension}")
+
+def benchmark_export(level: int = 20, directory: str = ".") -> None:
+    """
+    Вимірює час експорту дерева в усі формати.
+
+    Args:
+        level (int): Рівень рекурсії.
+        directory (str): Каталог для тимчасових файлів.
+    """
+    print(f"{'Формат':>7} | {'Сегментів':>10} | {'Час, с':>8} | {'Розмір, МБ':>11}")
+    for extension in (".svg", ".npy", ".npz", ".txt", ".csv"):
+        filename = os.path.join(directory, f"task2a_export{extension}")
+        elapsed = timeit.timeit(lambda: export_tree(level, filename), number=1)
+        print(f"{extension:>7} | {2 ** level - 1:>10} | {elapsed:>8.3f} | "
+              f"{os.path.getsize(filename) / 2 ** 20:>11.1f}")
+        os.remove(filename)
+
+def benchmark_render(levels: tuple = (12, 16, 18), filename: str = "task2a_benchmark.png") -> None:
+    """
+    Порівнює рендеринг через matplotlib (LineCollection + savefig) та растеризатор NumPy.
+
+    Args:
+        levels (tuple): Рівні рекурсії.
+        filename (str): Тимчасовий файл для запису зображень.
+    """
+    def matplotlib_render(segments: np.ndarray) -> None:
+        fig = Figure(figsize=(10.24, 10.24), dpi=100)
+        FigureCanvasAgg(fig)
+        ax = fig.add_subplot()
+        ax.add_collection(LineCollection(segments, colors='brown', linewidths=1))
+        ax.autoscale()
+        ax.set_aspect('equal')
+        ax.axis('off')
+        fig.savefig(filename)
+
+    print(f"{'Рівень':>7} | {'matplotlib, с':>14} | {'NumPy, с':>10}")
+    for level in levels:
+        segments = get_tree_segments_vectorized(0, 0, 90, BRANCH_LENGTH, level)
+        mpl_time = timeit.timeit(lambda: matplotlib_render(segments), number=1)
+        raster_time = timeit.timeit(
+            lambda: raster.save_png(raster.render_segments(segments), filename), number=1)
+        print(f"{level:>7} | {mpl_time:>14.3f} | {raster_time:>10.3f}")
+
+def benchmark_view(levels: tuple = (18, 22, 26, 30), bounds: raster.Bounds = (-20, 230, 20, 270),
+                   filename: str = "task2a_view.png") -> None:
+    """
+    Показує, що вартість збільшеного вигляду з відсіканням не зростає як 2^level.
+
+    Args:
+        levels (tuple): Рівні рекурсії.
+        bounds (raster.Bounds): Видима область.
+        filename (str): Тимчасовий файл для запису зображень.
+    """
+    print(f"{'Рівень':>7} | {'Усього сегментів':>17} | {'Намальовано':>12} | {'Час, с':>8}")
+    for level in levels:
+        start = timeit.default_timer()
+        drawn = save_tree_view_png(level, filename, bounds)
+        elapsed = timeit.default_timer() - start
+        print(f"{level:>7} | {2 ** level - 1:>17} | {drawn:>12} | {elapsed:>8.3f}")
+
 def main():
     """
     Головна функція програми.
@@ -1,28 +1,93 @@
 """
 Скрипт для генерації та візуалізації фрактала "Дерево Піфагора" за допомогою matplotlib.
 """
+from concurrent.futures import ProcessPoolExecutor
 from math import atan2, pi, sqrt
+from multiprocessing import shared_memory
+import os
+import timeit
+from typing import List, Optional, Sequence, Tuple, Union
+import weakref
 import matplotlib.pyplot as plt
 import numpy as np
+from numpy.typing import DTypeLike
 from matplotlib import cm, patches
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.collections import PolyCollection
+from matplotlib.figure import Figure
 
-def pythagoras_tree(ratio: float = 1.0, nb_levels: int = 12) -> np.ndarray:
+import export
+import raster
+
+# Допустимі схеми зберігання дерева: матриця (N, 5) або структурований масив
+TREE_LAYOUTS = ("matrix", "structured")
+# Кількість батьківських квадратів, що обробляються за один векторизований крок
+LEVEL_CHUNK = 1 << 20
+# Способи обчислення дерева: прямий (cos/sin для кожного квадрата),
+# таблиці cos/sin для рівня, таблиці + штампування шаблонного піддерева
+ENGINES = ("direct", "table", "template")
+# Кількість одиничних бітів у кожному байті
+_POPCOUNT = np.array([bin(i).count("1") for i in range(256)], dtype=np.int64)
+
+def tree_dtype(dtype: DTypeLike = np.float64, layout: str = "matrix") -> np.dtype:
     """
-    Обчислює координати квадратів для дерева Піфагора.
-    
-    Дерево Піфагора - це плоский фрактал, побудований з квадратів.
-    
+    Повертає тип елементів масиву дерева для заданої схеми зберігання.
+
     Args:
-        ratio (float): Відношення сторін прямокутного трикутника (за замовчуванням 1.0 для симетричного дерева).
-        nb_levels (int): Кількість рівнів рекурсії.
-        
+        dtype (DTypeLike): Тип координат, кута та розміру.
+        layout (str): "matrix" - усі 5 колонок мають тип dtype;
+            "structured" - поля x, y, angle, size типу dtype та level типу uint8.
+
     Returns:
-        np.ndarray: Матриця з параметрами квадратів (x, y, кут, розмір, рівень).
+        np.dtype: Тип елементів масиву.
+
+    Raises:
+        ValueError: Якщо задано невідому схему.
+    """
+    if layout not in TREE_LAYOUTS:
+        raise ValueError(f"Невідома схема зберігання: {layout}")
+    dtype = np.dtype(dtype)
+    if layout == "matrix":
+        return dtype
+    return np.dtype([(name, dtype) for name in raster.TREE_FIELDS[:4]] + [("level", np.uint8)])
+
+def _allocate_tree(nb_elements: int, dtype: DTypeLike, layout: str,
+                   out: Union[None, str, os.PathLike, np.ndarray]) -> np.ndarray:
+    """
+    Виділяє (або перевіряє наданий) масив для дерева.
+
+    Args:
+        nb_elements (int): Кількість квадратів.
+        dtype (DTypeLike): Тип координат.
+        layout (str): Схема зберігання.
+        out (Union[None, str, os.PathLike, np.ndarray]): Шлях до .npy-файлу для numpy.memmap
+            або готовий масив.
+
+    Returns:
+        np.ndarray: Масив для заповнення.
+    """
+    full_dtype = tree_dtype(dtype, layout)
+    shape = (nb_elements, 5) if layout == "matrix" else (nb_elements,)
+    if out is None:
+        return np.empty(shape, dtype=full_dtype)
+    if isinstance(out, (str, os.PathLike)):
+        # Файл .npy із заголовком, який потім можна відкрити через np.load(..., mmap_mode="r")
+        return np.lib.format.open_memmap(out, mode="w+", dtype=full_dtype, shape=shape)
+    if out.shape != shape or out.dtype != full_dtype:
+        raise ValueError(f"Очікується масив форми {shape} з типом {full_dtype}")
+    return out
+
+def _tree_geometry(ratio: float) -> tuple:
+    """
+    Обчислює сталі побудови дерева для заданого співвідношення сторін.
+
+    Args:
+        ratio (float): Відношення сторін прямокутного трикутника.
+
+    Returns:
+        tuple: (c_1, c_2, tr_pat, alpha1, alpha2) - коефіцієнти зменшення лівого
+        та правого квадратів, патерн трансляції та кути повороту.
     """
-    # Перевірка вхідних даних
-    if ratio <= 0:
-        raise ValueError("Коефіцієнт співвідношення має бути більше нуля")
-    
     # Обчислення констант
     c_d = sqrt(1.0 + ratio ** 2)
     # Нормалізована довжина 1
@@ -38,49 +103,431 @@ def pythagoras_tree(ratio: float = 1.0, nb_levels: int = 12) -> np.ndarray:
     # Кути повороту
     alpha1 = atan2(ratio, 1.0)
     alpha2 = alpha1 - pi / 2.0
+    return c_1, c_2, tr_pat, alpha1, alpha2
+
+def _child_squares(x: np.ndarray, y: np.ndarray, angle: np.ndarray, size: np.ndarray,
+                   geometry: tuple) -> tuple:
+    """
+    Векторно обчислює лівий та правий дочірні квадрати для масиву батьків.
+
+    Args:
+        x (np.ndarray): Координати X батьків.
+        y (np.ndarray): Координати Y батьків.
+        angle (np.ndarray): Кути батьків.
+        size (np.ndarray): Розміри батьків.
+        geometry (tuple): Сталі з _tree_geometry.
+
+    Returns:
+        tuple: Два кортежі (x, y, кут, розмір) - для лівих та правих дітей.
+    """
+    c_1, c_2, tr_pat, alpha1, alpha2 = geometry
+    # Матриці повороту, помножені на розмір батька, для всіх батьків одразу
+    c_a = size * np.cos(angle)
+    s_a = size * np.sin(angle)
+
+    # Трансформація (size * R) @ tr_pat, розписана поелементно
+    left = (c_a * tr_pat[0, 0] + (-s_a) * tr_pat[1, 0] + x,
+            s_a * tr_pat[0, 0] + c_a * tr_pat[1, 0] + y,
+            (angle + alpha1) % (2.0 * pi),
+            size * c_1)
+    right = (c_a * tr_pat[0, 1] + (-s_a) * tr_pat[1, 1] + x,
+             s_a * tr_pat[0, 1] + c_a * tr_pat[1, 1] + y,
+             (angle + alpha2) % (2.0 * pi),
+             size * c_2)
+    return left, right
+
+def _right_turns(first: int, last: int) -> np.ndarray:
+    """
+    Повертає кількість поворотів праворуч для вузлів рівня з номерами first..last-1.
+
+    Номер вузла в межах рівня кодує шлях від кореня (0 - ліва гілка, 1 - права),
+    тож кількість правих поворотів дорівнює кількості одиничних бітів номера.
+    """
+    local = np.arange(first, last, dtype=np.uint64)
+    return _POPCOUNT[local.view(np.uint8).reshape(-1, 8)].sum(axis=1)
+
+def _level_tables(geometry: tuple, depth: int) -> tuple:
+    """
+    Обчислює кути та розміри квадратів рівня depth для кожної кількості правих поворотів.
+
+    Усі квадрати рівня з однаковою кількістю правих поворотів r мають той самий
+    кут depth * alpha1 - r * pi / 2 та розмір c_1^(depth - r) * c_2^r.
+
+    Args:
+        geometry (tuple): Сталі з _tree_geometry.
+        depth (int): Рівень.
+
+    Returns:
+        tuple: Масиви кутів та розмірів довжини depth + 1.
+    """
+    c_1, c_2, _, alpha1, alpha2 = geometry
+    turns = np.arange(depth + 1)
+    angles = (alpha1 * (depth - turns) + alpha2 * turns) % (2.0 * pi)
+    sizes = c_1 ** (depth - turns) * c_2 ** turns
+    return angles, sizes
+
+def _level_range(level: int, top: int, roots: Tuple[int, int]) -> Tuple[int, int]:
+    """
+    Повертає рядки рівня level, що належать піддеревам з коренями roots рівня top.
+
+    Нащадки вузлів roots[0]..roots[1]-1 на кожному глибшому рівні займають
+    суцільний діапазон рядків, бо вузли впорядковані за рівнями, а діти вузла
+    j - це 2j + 1 та 2j + 2.
+    """
+    start = 2 ** level - 1
+    shift = level - top
+    return start + (roots[0] << shift), start + (roots[1] << shift)
+
+def _fill_direct(columns: tuple, nb_levels: int, geometry: tuple, top: int = 0,
+                 roots: Tuple[int, int] = (0, 1)) -> None:
+    """
+    Заповнює рівні top+1..nb_levels піддерев з коренями roots рівня top,
+    обчислюючи cos/sin для кожного батьківського квадрата.
+    """
+    x, y, angle, size = columns
+    # Батьківські квадрати рівня обробляються векторно порціями по LEVEL_CHUNK,
+    # тож тимчасова пам'ять не залежить від глибини дерева
+    for level in range(top, nb_levels):
+        begin, end = _level_range(level, top, roots)
+        for first in range(begin, end, LEVEL_CHUNK):
+            last = min(first + LEVEL_CHUNK, end)
+            parents = slice(first, last)
+            # Діти батька j: 2j + 1 (ліва гілка) та 2j + 2 (права гілка)
+            left = slice(2 * first + 1, 2 * last + 1, 2)
+            right = slice(2 * first + 2, 2 * last + 2, 2)
+
+            left_square, right_square = _child_squares(
+                x[parents], y[parents], angle[parents], size[parents], geometry)
+            x[left], y[left], angle[left], size[left] = left_square
+            x[right], y[right], angle[right], size[right] = right_square
+
+def _fill_table(columns: tuple, nb_levels: int, geometry: tuple, top: int = 0,
+                roots: Tuple[int, int] = (0, 1)) -> None:
+    """
+    Заповнює рівні top+1..nb_levels піддерев з коренями roots рівня top за таблицями
+    cos/sin, обчисленими один раз на рівень.
+
+    Замість cos/sin для кожного квадрата береться значення з таблиці
+    за кількістю правих поворотів (не більше nb_levels + 1 значень на рівень).
+    """
+    x, y, angle, size = columns
+    tr_pat = geometry[2]
+    for level in range(top, nb_levels):
+        start = 2 ** level - 1
+        begin, end = _level_range(level, top, roots)
+        p_angles, p_sizes = _level_tables(geometry, level)
+        cos_table = p_sizes * np.cos(p_angles)
+        sin_table = p_sizes * np.sin(p_angles)
+        child_angles, child_sizes = _level_tables(geometry, level + 1)
+        for first in range(begin, end, LEVEL_CHUNK):
+            last = min(first + LEVEL_CHUNK, end)
+            parents = slice(first, last)
+            left = slice(2 * first + 1, 2 * last + 1, 2)
+            right = slice(2 * first + 2, 2 * last + 2, 2)
+
+            turns = _right_turns(first - start, last - start)
+            c_a = cos_table[turns]
+            s_a = sin_table[turns]
+            x[left] = c_a * tr_pat[0, 0] + (-s_a) * tr_pat[1, 0] + x[parents]
+            y[left] = s_a * tr_pat[0, 0] + c_a * tr_pat[1, 0] + y[parents]
+            x[right] = c_a * tr_pat[0, 1] + (-s_a) * tr_pat[1, 1] + x[parents]
+            y[right] = s_a * tr_pat[0, 1] + c_a * tr_pat[1, 1] + y[parents]
+            angle[left] = child_angles[turns]
+            angle[right] = child_angles[turns + 1]
+            size[left] = child_sizes[turns]
+            size[right] = child_sizes[turns + 1]
+
+def _stamp_template(columns: tuple, ratio: float, top: int, sub: int, geometry: tuple,
+                    roots: Optional[Tuple[int, int]] = None) -> None:
+    """
+    Заповнює рівні top+1..top+sub копіями одного канонічного піддерева.
+
+    Піддерево глибини sub обчислюється один раз для кореня (0, 0, 0, 1).
+    Будь-яке піддерево з коренем рівня top - його афінне перетворення
+    (поворот на кут кореня, масштаб на його розмір і зсув), причому кут і розмір
+    залежать лише від кількості правих поворотів, тож повернуті копії шаблону
+    готуються для кожного з top + 1 варіантів, а штампування зводиться
+    до вибірки та додавання координат кореня.
+
+    Args:
+        columns (tuple): Колонки x, y, кут, розмір (рівні 0..top уже заповнені).
+        ratio (float): Відношення сторін прямокутного трикутника.
+        top (int): Рівень коренів піддерев.
+        sub (int): Глибина піддерев.
+        geometry (tuple): Сталі з _tree_geometry.
+        roots (Optional[Tuple[int, int]]): Номери коренів рівня top; за замовчуванням усі.
+    """
+    x, y, angle, size = columns
+    template = pythagoras_tree(ratio, sub, engine="table")
+    t_x = template[:, 0] - template[0, 0]
+    t_y = template[:, 1] - template[0, 1]
+
+    root_angles, root_sizes = _level_tables(geometry, top)
+    cos_r = (root_sizes * np.cos(root_angles))[:, None]
+    sin_r = (root_sizes * np.sin(root_angles))[:, None]
+    rot_x = cos_r * t_x - sin_r * t_y
+    rot_y = sin_r * t_x + cos_r * t_y
+    rot_angle = (root_angles[:, None] + template[:, 2]) % (2.0 * pi)
+    rot_size = root_sizes[:, None] * template[:, 3]
+
+    root_start = 2 ** top - 1
+    first_root, last_root = roots or (0, 2 ** top)
+    for j in range(1, sub + 1):
+        # Вузли рівня top + j упорядковані як (корінь, вузол шаблону рівня j)
+        width = 2 ** j
+        rows = slice(width - 1, 2 * width - 1)
+        level_start = 2 ** (top + j) - 1
+        per_chunk = max(1, LEVEL_CHUNK // width)
+        for first in range(first_root, last_root, per_chunk):
+            last = min(first + per_chunk, last_root)
+            turns = _right_turns(first, last)
+            roots = slice(root_start + first, root_start + last)
+            block = slice(level_start + first * width, level_start + last * width)
+            x[block] = (rot_x[turns, rows] + x[roots, None]).ravel()
+            y[block] = (rot_y[turns, rows] + y[roots, None]).ravel()
+            angle[block] = rot_angle[turns, rows].ravel()
+            size[block] = rot_size[turns, rows].ravel()
+
+def _fill_forest(columns: tuple, ratio: float, nb_levels: int, engine: str, top: int = 0,
+                 roots: Tuple[int, int] = (0, 1)) -> None:
+    """
+    Заповнює рівні top+1..nb_levels піддерев з коренями roots рівня top вибраним способом.
+
+    Args:
+        columns (tuple): Колонки x, y, кут, розмір (корені вже заповнені).
+        ratio (float): Відношення сторін прямокутного трикутника.
+        nb_levels (int): Останній рівень дерева.
+        engine (str): Спосіб обчислення з ENGINES.
+        top (int): Рівень коренів.
+        roots (Tuple[int, int]): Номери першого та наступного після останнього кореня.
+    """
+    geometry = _tree_geometry(ratio)
+    if engine == "direct":
+        _fill_direct(columns, nb_levels, geometry, top, roots)
+    elif engine == "table":
+        _fill_table(columns, nb_levels, geometry, top, roots)
+    else:
+        middle = max(top, nb_levels // 2)
+        _fill_table(columns, middle, geometry, top, roots)
+        shift = middle - top
+        _stamp_template(columns, ratio, middle, nb_levels - middle, geometry,
+                        (roots[0] << shift, roots[1] << shift))
+
+def _fill_shared(storage: str, in_file: bool, shape: tuple, dtype: np.dtype, ratio: float,
+                 nb_levels: int, engine: str, top: int, roots: Tuple[int, int]) -> None:
+    """
+    Виконується в дочірньому процесі: заповнює піддерева у спільній пам'яті.
+
+    Результат записується безпосередньо в сегмент multiprocessing.shared_memory
+    (або у файл .npy через numpy.memmap) і не серіалізується назад.
+
+    Args:
+        storage (str): Ім'я сегмента спільної пам'яті або шлях до .npy-файлу.
+        in_file (bool): True, якщо storage - шлях до файлу.
+        shape (tuple): Форма масиву дерева.
+        dtype (np.dtype): Тип елементів масиву дерева.
+        ratio (float): Відношення сторін прямокутного трикутника.
+        nb_levels (int): Останній рівень дерева.
+        engine (str): Спосіб обчислення з ENGINES.
+        top (int): Рівень коренів піддерев.
+        roots (Tuple[int, int]): Номери коренів, що обробляє цей процес.
+    """
+    if in_file:
+        pt_array = np.load(storage, mmap_mode="r+")
+        _fill_forest(raster.tree_columns(pt_array)[:4], ratio, nb_levels, engine, top, roots)
+        pt_array.flush()
+        return
+
+    shm = shared_memory.SharedMemory(name=storage)
+    pt_array = np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+    # Сегмент закривається разом з останнім представленням масиву,
+    # навіть якщо воно лишилося у трасуванні винятку
+    weakref.finalize(pt_array, shm.close)
+    _fill_forest(raster.tree_columns(pt_array)[:4], ratio, nb_levels, engine, top, roots)
+
+def _fill_parallel(pt_array: np.ndarray, storage: str, in_file: bool, ratio: float,
+                   nb_levels: int, engine: str, workers: int, split_level: Optional[int]) -> None:
+    """
+    Заповнює дерево в кількох процесах, розділивши його на незалежні піддерева.
+
+    Рівні 0..split_level обчислюються в поточному процесі, після чого кожне
+    з 2^split_level піддерев - окреме завдання ProcessPoolExecutor. Піддерева
+    займають неперетинні діапазони рядків, тож процеси пишуть у спільний масив
+    без синхронізації.
+
+    Args:
+        pt_array (np.ndarray): Масив дерева у спільній пам'яті або у файлі.
+        storage (str): Ім'я сегмента спільної пам'яті або шлях до файлу.
+        in_file (bool): True, якщо storage - шлях до файлу.
+        ratio (float): Відношення сторін прямокутного трикутника.
+        nb_levels (int): Кількість рівнів.
+        engine (str): Спосіб обчислення з ENGINES.
+        workers (int): Кількість процесів.
+        split_level (Optional[int]): Рівень коренів піддерев; за замовчуванням
+            найменший, на якому піддерев щонайменше вчетверо більше за процеси.
+    """
+    if split_level is None:
+        split_level = (4 * workers - 1).bit_length()
+    split_level = max(0, min(split_level, nb_levels))
+    top_engine = engine
+    if engine == "template":
+        # Верхня половина рівнів шаблонного способу обчислюється за таблицями,
+        # тож ділення вище за неї дає той самий результат, що й без процесів
+        split_level = min(split_level, nb_levels // 2)
+        top_engine = "table"
+    _fill_forest(raster.tree_columns(pt_array)[:4], ratio, split_level, top_engine)
+    if isinstance(pt_array, np.memmap):
+        pt_array.flush()
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(_fill_shared, storage, in_file, pt_array.shape, pt_array.dtype,
+                               ratio, nb_levels, engine, split_level, (root, root + 1))
+                   for root in range(2 ** split_level)]
+        for future in futures:
+            future.result()
+
+def pythagoras_tree(ratio: float = 1.0, nb_levels: int = 12, dtype: DTypeLike = np.float64,
+                    layout: str = "matrix",
+                    out: Union[None, str, os.PathLike, np.ndarray] = None,
+                    engine: str = "direct", workers: int = 1,
+                    split_level: Optional[int] = None) -> np.ndarray:
+    """
+    Обчислює координати квадратів для дерева Піфагора.
+    
+    Дерево Піфагора - це плоский фрактал, побудований з квадратів.
+    
+    Args:
+        ratio (float): Відношення сторін прямокутного трикутника (за замовчуванням 1.0 для симетричного дерева).
+        nb_levels (int): Кількість рівнів рекурсії.
+        dtype (DTypeLike): Тип координат, кута та розміру (наприклад, np.float32 для економії пам'яті).
+        layout (str): "matrix" - матриця (N, 5); "structured" - структурований масив
+            з полями x, y, angle, size та level типу uint8.
+        out (Union[None, str, os.PathLike, np.ndarray]): Куди записати результат:
+            шлях до .npy-файлу (масив на диску через numpy.memmap) або готовий масив
+            (лише з workers=1).
+        engine (str): "direct" - cos/sin для кожного квадрата; "table" - таблиці cos/sin
+            для кожного рівня; "template" - верхня половина рівнів за таблицями,
+            нижня - штампуванням одного обчисленого піддерева.
+        workers (int): Кількість процесів; більше 1 - піддерева з коренями на рівні
+            split_level обчислюються паралельно у файлі out або в сегменті спільної
+            пам'яті, який повертається без копії.
+        split_level (Optional[int]): Рівень, на якому дерево ділиться між процесами.
+        
+    Returns:
+        np.ndarray: Матриця з параметрами квадратів (x, y, кут, розмір, рівень).
+    """
+    # Перевірка вхідних даних
+    if ratio <= 0:
+        raise ValueError("Коефіцієнт співвідношення має бути більше нуля")
+    if layout == "structured" and nb_levels > np.iinfo(np.uint8).max:
+        raise ValueError("Рівень не вміщується в колонку типу uint8")
+    if engine not in ENGINES:
+        raise ValueError(f"Невідомий спосіб обчислення: {engine}")
     
     # Кількість елементів (квадратів)
     nb_elements = 2 ** (nb_levels + 1) - 1
     
-    # Матриця для зберігання дерева
-    # 5 колонок: x, y, кут, розмір, рівень
-    pt_array = np.zeros((nb_elements, 5))
+    # Масив для зберігання дерева: x, y, кут, розмір, рівень
+    shm = None
+    if workers > 1 and out is None:
+        # Процеси пишуть у спільний сегмент, і він же повертається без копії
+        full_dtype = tree_dtype(dtype, layout)
+        shape = (nb_elements, 5) if layout == "matrix" else (nb_elements,)
+        shm = shared_memory.SharedMemory(create=True, size=max(int(np.prod(shape)) * full_dtype.itemsize, 1))
+        pt_array = np.ndarray(shape, dtype=full_dtype, buffer=shm.buf)
+        weakref.finalize(pt_array, shm.close)
+    elif workers > 1 and not isinstance(out, (str, os.PathLike)):
+        raise ValueError("З workers > 1 out має бути шляхом до файлу: процеси не пишуть у приватний масив")
+    else:
+        pt_array = _allocate_tree(nb_elements, dtype, layout, out)
+    x, y, angle, size, levels = raster.tree_columns(pt_array)
     
     # Ініціалізація кореня (стовбура)
-    pt_array[0, :] = [0.0, -1.0, 0.0, 1.0, 0.0] # Рівень 0
+    x[0], y[0], angle[0], size[0] = 0.0, -1.0, 0.0, 1.0
 
     # Обчислення рівня кожного квадрата
     offset = 0
     for i in range(nb_levels + 1):
         tmp = 2 ** i
-        pt_array[offset : offset + tmp, 4] = i
+        levels[offset : offset + tmp] = i
         offset += tmp
 
-    def mat_rot(angle_rad: float) -> np.ndarray:
-        """Матриця повороту"""
-        c_a = np.cos(angle_rad)
-        s_a = np.sin(angle_rad)
-        return np.array([[c_a, -s_a], [s_a, c_a]])
+    # Обчислення позиції та розміру квадратів рівень за рівнем
+    if workers <= 1:
+        _fill_forest((x, y, angle, size), ratio, nb_levels, engine)
+    elif shm is None:
+        _fill_parallel(pt_array, os.fspath(out), True, ratio, nb_levels, engine,
+                       workers, split_level)
+    else:
+        try:
+            _fill_parallel(pt_array, shm.name, False, ratio, nb_levels, engine,
+                           workers, split_level)
+        finally:
+            shm.unlink()
 
-    # Обчислення позиції та розміру кожного квадрата відносно батьківського
-    for i in range(1, nb_elements, 2):
-        j = (i + 1) // 2 - 1
-        
-        # Трансформація
-        t_m = pt_array[j, 3] * mat_rot(pt_array[j, 2]) @ tr_pat
-        t_x = t_m[0, :] + pt_array[j, 0]
-        t_y = t_m[1, :] + pt_array[j, 1]
-        
-        theta1 = (pt_array[j, 2] + alpha1) % (2.0 * pi)
-        theta2 = (pt_array[j, 2] + alpha2) % (2.0 * pi)
-        
-        # Ліва гілка
-        pt_array[i, 0:4] = [t_x[0], t_y[0], theta1, pt_array[j, 3] * c_1]
-        # Права гілка
-        pt_array[i + 1, 0:4] = [t_x[1], t_y[1], theta2, pt_array[j, 3] * c_2]
-        
+    if isinstance(pt_array, np.memmap):
+        pt_array.flush()
     return pt_array
 
+def pythagoras_tree_lod(ratio: float = 1.0, nb_levels: int = 12, min_size: float = 0.0,
+                        bounds: Optional[raster.Bounds] = None,
+                        dtype: DTypeLike = np.float64) -> np.ndarray:
+    """
+    Обчислює лише видимі квадрати дерева Піфагора (рівень деталізації залежить від вигляду).
+
+    Квадрат, менший за min_size, ще малюється, але не ділиться далі. Квадрат, усе
+    піддерево якого гарантовано лежить поза bounds, відкидається разом з нащадками:
+    початок дочірнього квадрата зміщений від початку батьківського не більше ніж
+    на size * D (D - найбільша довжина стовпця патерну трансляції), а розміри
+    спадають щонайменше в max(c_1, c_2) разів, тож піддерево вміщується в коло
+    радіуса size * (sqrt(2) + D * (1 - c^k) / (1 - c)) навколо початку квадрата.
+
+    Args:
+        ratio (float): Відношення сторін прямокутного трикутника.
+        nb_levels (int): Максимальна кількість рівнів рекурсії.
+        min_size (float): Найменший розмір квадрата, що ще ділиться (наприклад, розмір пікселя).
+        bounds (Optional[raster.Bounds]): Видима область (xmin, ymin, xmax, ymax);
+            None - без відсікання за областю.
+        dtype (DTypeLike): Тип елементів результату.
+
+    Returns:
+        np.ndarray: Матриця (M, 5) видимих квадратів (x, y, кут, розмір, рівень),
+        упорядкована за рівнями.
+    """
+    if ratio <= 0:
+        raise ValueError("Коефіцієнт співвідношення має бути більше нуля")
+
+    geometry = _tree_geometry(ratio)
+    c_1, c_2, tr_pat = geometry[:3]
+    shrink = max(c_1, c_2)
+    shift = float(np.hypot(tr_pat[0], tr_pat[1]).max())
+
+    x = np.array([0.0])
+    y = np.array([-1.0])
+    angle = np.array([0.0])
+    size = np.array([1.0])
+
+    blocks = []
+    for level in range(nb_levels + 1):
+        if bounds is not None:
+            remaining = nb_levels - level
+            reach = sqrt(2.0) + shift * (1.0 - shrink ** remaining) / (1.0 - shrink)
+            visible = raster.circles_intersect_box(x, y, size * reach, bounds)
+            x, y, angle, size = x[visible], y[visible], angle[visible], size[visible]
+        if x.shape[0] == 0:
+            break
+
+        blocks.append(np.column_stack((x, y, angle, size, np.full(x.shape[0], level))).astype(dtype))
+        if level == nb_levels:
+            break
+
+        # Діляться лише квадрати, не менші за поріг деталізації
+        split = size >= min_size
+        left, right = _child_squares(x[split], y[split], angle[split], size[split], geometry)
+        x, y, angle, size = (np.concatenate(pair) for pair in zip(left, right))
+
+    return np.concatenate(blocks) if blocks else np.empty((0, 5), dtype=dtype)
+
 def pythagor_tree_plot(pt_array: np.ndarray, colormap_name: str = "summer") -> None:
     """
     Візуалізує дерево Піфагора за допомогою matplotlib.
@@ -97,36 +544,287 @@ def pythagor_tree_plot(pt_array: np.ndarray, colormap_name: str = "summer") -> N
         
     fig, axis = plt.subplots(figsize=(10, 8))
     
-    max_level = pt_array[-1, 4]
+    levels = raster.tree_columns(pt_array)[4]
+    max_level = float(levels[-1])
     
-    for i in range(pt_array.shape[0]):
-        c_x = pt_array[i, 0]
-        c_y = pt_array[i, 1]
-        theta = pt_array[i, 2] * 180.0 / pi
-        s_i = pt_array[i, 3]
-        level = pt_array[i, 4]
-        
-        # Колір залежить від рівня рекурсії
-        color = colormap(1.0 - level / (max_level + 1))
-        
-        rect = patches.Rectangle(
-            [c_x, c_y],
-            s_i,
-            s_i,
-            angle=theta,
-            ec="none", # Без контуру
-            color=color,
-        )
-        axis.add_patch(rect)
+    # Кути всіх квадратів обчислюються векторизовано, а колір залежить від рівня рекурсії
+    corners = raster.square_corners(pt_array)
+    colors = colormap(1.0 - levels / (max_level + 1))
+    
+    # Усі квадрати передаються однією колекцією замість окремого патча на кожен
+    collection = PolyCollection(corners, facecolors=colors, edgecolors="none")
+    axis.add_collection(collection)
         
-    # Налаштування відображення
-    plt.xlim([-4, 4])
-    plt.ylim([-1.5, 3.5])
+    # Налаштування відображення: межі обчислюються за даними з невеликим відступом
+    xmin, ymin, xmax, ymax = raster.segments_bounds(corners)
+    pad = 0.02 * max(xmax - xmin, ymax - ymin)
+    plt.xlim([xmin - pad, xmax + pad])
+    plt.ylim([ymin - pad, ymax + pad])
     plt.gca().set_aspect("equal", adjustable="box")
     plt.axis("off") # Приховати осі
     plt.title(f"Дерево Піфагора (рівнів: {int(max_level)})")
     plt.show()
 
+def benchmark_tree(levels: tuple = (12, 16, 20, 22, 24)) -> None:
+    """
+    Показує масштабування векторизованої генерації дерева з рівнем.
+
+    Args:
+        levels (tuple): Рівні рекурсії.
+    """
+    print(f"{'Рівень':>7} | {'Квадратів':>10} | {'Час, с':>8} | {'нс/квадрат':>10}")
+    for level in levels:
+        dt = timeit.timeit(lambda: pythagoras_tree(nb_levels=level), number=1)
+        count = 2 ** (level + 1) - 1
+        print(f"{level:>7} | {count:>10} | {dt:>8.3f} | {dt / count * 1e9:>10.1f}")
+
+def benchmark_engines(levels: tuple = (16, 20, 22), repeats: int = 3) -> None:
+    """
+    Порівнює способи обчислення дерева: прямий, таблиці cos/sin та штампування шаблону.
+
+    Args:
+        levels (tuple): Рівні рекурсії.
+        repeats (int): Кількість повторів.
+    """
+    print(f"{'Рівень':>7} | " + " | ".join(f"{engine + ', с':>12}" for engine in ENGINES))
+    for level in levels:
+        times = [min(timeit.repeat(lambda: pythagoras_tree(nb_levels=level, engine=engine),
+                                   number=1, repeat=repeats)) for engine in ENGINES]
+        print(f"{level:>7} | " + " | ".join(f"{elapsed:>12.4f}" for elapsed in times))
+
+def benchmark_parallel(level: int = 24, workers: tuple = (1, 2, 4, 8, 16, 32),
+                       engine: str = "direct") -> None:
+    """
+    Вимірює масштабування паралельної генерації з кількістю процесів.
+
+    Args:
+        level (int): Рівень рекурсії.
+        workers (tuple): Кількості процесів.
+        engine (str): Спосіб обчислення з ENGINES.
+    """
+    # Прискорення обмежене кількістю ядер, тож вона друкується разом з результатами
+    print(f"Ядер: {os.cpu_count()}")
+    print(f"{'Процесів':>9} | {'Час, с':>8} | {'Прискорення':>11}")
+    baseline = None
+    for count in workers:
+        elapsed = timeit.timeit(
+            lambda: pythagoras_tree(nb_levels=level, engine=engine, workers=count), number=1)
+        baseline = baseline or elapsed
+        print(f"{count:>9} | {elapsed:>8.3f} | {baseline / elapsed:>10.1f}x")
+
+def pythagor_tree_png(pt_array: np.ndarray, filename: str, width: int = 1024, height: int = 1024,
+                      colormap_name: str = "summer", antialias: int = 1) -> None:
+    """
+    Растеризує дерево Піфагора в PNG без окремого patches.Rectangle для кожного квадрата.
+
+    Args:
+        pt_array (np.ndarray): Матриця даних дерева.
+        filename (str): Шлях до вихідного PNG-файлу.
+        width (int): Ширина зображення в пікселях.
+        height (int): Висота зображення в пікселях.
+        colormap_name (str): Назва колірної схеми matplotlib.
+        antialias (int): Коефіцієнт суперсемплінгу (1 - без згладжування).
+    """
+    image = raster.render_squares(pt_array, width, height, colormap_name=colormap_name,
+                                  antialias=antialias)
+    raster.save_png(image, filename)
+
+def pythagor_tree_view_png(filename: str, bounds: raster.Bounds, nb_levels: int = 30,
+                           ratio: float = 1.0, width: int = 1024, height: int = 1024,
+                           colormap_name: str = "summer", antialias: int = 1,
+                           detail: float = 1.0) -> int:
+    """
+    Растеризує збільшений фрагмент глибокого дерева, генеруючи лише видимі квадрати.
+
+    Args:
+        filename (str): Шлях до вихідного PNG-файлу.
+        bounds (raster.Bounds): Видима область (xmin, ymin, xmax, ymax).
+        nb_levels (int): Максимальний рівень рекурсії.
+        ratio (float): Відношення сторін прямокутного трикутника.
+        width (int): Ширина зображення в пікселях.
+        height (int): Висота зображення в пікселях.
+        colormap_name (str): Назва колірної схеми matplotlib.
+        antialias (int): Коефіцієнт суперсемплінгу (1 - без згладжування).
+        detail (float): Поріг поділу квадрата в пікселях (менше - детальніше).
+
+    Returns:
+        int: Кількість намальованих квадратів.
+    """
+    min_size = detail * raster.pixel_size(bounds, width * antialias, height * antialias, margin=0)
+    pt_array = pythagoras_tree_lod(ratio, nb_levels, min_size, bounds)
+    image = raster.render_squares(pt_array, width, height, colormap_name=colormap_name,
+                                  antialias=antialias, bounds=bounds, margin=0,
+                                  max_level=nb_levels)
+    raster.save_png(image, filename)
+    return len(pt_array)
+
+def _render_ratios(nb_levels: int, variants: list, width: int, height: int, antialias: int,
+                   colormap_name: str, engine: str) -> None:
+    """
+    Рендерить варіанти (ratio, файл) у PNG одним процесом.
+
+    Масив дерева та полотно виділяються один раз і заповнюються заново
+    для кожного варіанта.
+    """
+    pt_array = np.empty((2 ** (nb_levels + 1) - 1, 5))
+    canvas = np.empty((height * antialias, width * antialias, 3))
+    for ratio, filename in variants:
+        pythagoras_tree(ratio, nb_levels, out=pt_array, engine=engine)
+        image = raster.render_squares(pt_array, width, height, colormap_name=colormap_name,
+                                      antialias=antialias, out=canvas)
+        raster.save_png(image, filename)
+
+def render_sweep(nb_levels: int, ratios: Sequence[float], directory: str, width: int = 512,
+                 height: int = 512, antialias: int = 1, workers: int = 1,
+                 engine: str = "direct", colormap_name: str = "summer") -> List[str]:
+    """
+    Генерує та растеризує дерева Піфагора для набору співвідношень сторін.
+
+    Варіанти розподіляються між процесами ProcessPoolExecutor порівну;
+    кожен процес повторно використовує свої буфери.
+
+    Args:
+        nb_levels (int): Кількість рівнів рекурсії.
+        ratios (Sequence[float]): Відношення сторін прямокутного трикутника.
+        directory (str): Каталог для PNG-файлів (створюється за потреби).
+        width (int): Ширина зображення в пікселях.
+        height (int): Висота зображення в пікселях.
+        antialias (int): Коефіцієнт суперсемплінгу (1 - без згладжування).
+        workers (int): Кількість процесів.
+        engine (str): Спосіб обчислення з ENGINES.
+        colormap_name (str): Назва колірної схеми matplotlib.
+
+    Returns:
+        List[str]: Шляхи до файлів у порядку ratios.
+    """
+    if any(ratio <= 0 for ratio in ratios):
+        raise ValueError("Коефіцієнт співвідношення має бути більше нуля")
+    os.makedirs(directory, exist_ok=True)
+    variants = [(ratio, os.path.join(directory, f"tree_{index:04d}_r{ratio:g}.png"))
+                for index, ratio in enumerate(ratios)]
+    if workers <= 1:
+        _render_ratios(nb_levels, variants, width, height, antialias, colormap_name, engine)
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(_render_ratios, nb_levels, variants[start::workers], width,
+                                   height, antialias, colormap_name, engine)
+                       for start in range(min(workers, len(variants)))]
+            for future in futures:
+                future.result()
+    return [filename for _, filename in variants]
+
+def export_tree(pt_array: np.ndarray, filename: str, colormap_name: str = "summer") -> None:
+    """
+    Експортує масив дерева у файл; формат визначається розширенням.
+
+    Масив (зокрема numpy.memmap з pythagoras_tree(out=...)) обробляється порціями,
+    тож у пам'яті одночасно перебуває лише одна порція тексту.
+
+    Args:
+        pt_array (np.ndarray): Масив дерева (матриця (N, 5) або структурований).
+        filename (str): Шлях до вихідного файлу (.svg, .npy, .npz, .txt або .csv).
+        colormap_name (str): Назва колірної схеми matplotlib для SVG.
+    """
+    extension = os.path.splitext(filename)[1].lower()
+    if extension == ".svg":
+        export.save_squares_svg(pt_array, filename, colormap_name=colormap_name)
+    elif extension == ".npy":
+        export.save_npy(pt_array, filename)
+    elif extension == ".npz":
+        export.save_npz(filename, tree=pt_array)
+    elif extension in (".txt", ".csv"):
+        export.save_text(pt_array, filename, delimiter="," if extension == ".csv" else " ",
+                         header=raster.TREE_FIELDS)
+    else:
+        raise ValueError(f"Непідтримуваний формат: {extension}")
+
+def benchmark_export(level: int = 19, directory: str = ".") -> None:
+    """
+    Вимірює час експорту дерева в усі формати.
+
+    Args:
+        level (int): Рівень рекурсії.
+        directory (str): Каталог для тимчасових файлів.
+    """
+    pt_array = pythagoras_tree(nb_levels=level)
+    print(f"{'Формат':>7} | {'Квадратів':>10} | {'Час, с':>8} | {'Розмір, МБ':>11}")
+    for extension in (".svg", ".npy", ".npz", ".txt", ".csv"):
+        filename = os.path.join(directory, f"task2b_export{extension}")
+        elapsed = timeit.timeit(lambda: export_tree(pt_array, filename), number=1)
+        print(f"{extension:>7} | {len(pt_array):>10} | {elapsed:>8.3f} | "
+              f"{os.path.getsize(filename) / 2 ** 20:>11.1f}")
+        os.remove(filename)
+
+def benchmark_render(levels: tuple = (8, 12, 14), filename: str = "task2b_benchmark.png") -> None:
+    """
+    Порівнює рендеринг через matplotlib (Rectangle на кожен квадрат та одна PolyCollection)
+    та растеризатор NumPy.
+
+    Args:
+        levels (tuple): Рівні рекурсії.
+        filename (str): Тимчасовий файл для запису зображень.
+    """
+    def new_axis() -> tuple:
+        fig = Figure(figsize=(10.24, 10.24), dpi=100)
+        FigureCanvasAgg(fig)
+        axis = fig.add_subplot()
+        axis.set_xlim([-4, 4])
+        axis.set_ylim([-1.5, 3.5])
+        axis.set_aspect("equal", adjustable="box")
+        axis.axis("off")
+        return fig, axis
+
+    def patches_render(pt_array: np.ndarray) -> None:
+        colormap = plt.get_cmap("summer")
+        max_level = pt_array[-1, 4]
+        fig, axis = new_axis()
+        for row in pt_array:
+            axis.add_patch(patches.Rectangle(
+                [row[0], row[1]], row[3], row[3], angle=row[2] * 180.0 / pi,
+                ec="none", color=colormap(1.0 - row[4] / (max_level + 1))))
+        fig.savefig(filename)
+
+    def collection_render(pt_array: np.ndarray) -> None:
+        colormap = plt.get_cmap("summer")
+        fig, axis = new_axis()
+        colors = colormap(1.0 - pt_array[:, 4] / (pt_array[-1, 4] + 1))
+        axis.add_collection(PolyCollection(raster.square_corners(pt_array),
+                                           facecolors=colors, edgecolors="none"))
+        fig.savefig(filename)
+
+    print(f"{'Рівень':>7} | {'Квадратів':>10} | {'Rectangle, с':>13} | {'PolyCollection, с':>18} | {'NumPy, с':>10}")
+    for level in levels:
+        pt_array = pythagoras_tree(nb_levels=level)
+        patches_time = timeit.timeit(lambda: patches_render(pt_array), number=1)
+        collection_time = timeit.timeit(lambda: collection_render(pt_array), number=1)
+        raster_time = timeit.timeit(lambda: pythagor_tree_png(pt_array, filename), number=1)
+        print(f"{level:>7} | {len(pt_array):>10} | {patches_time:>13.3f} | "
+              f"{collection_time:>18.3f} | {raster_time:>10.3f}")
+
+def benchmark_view(levels: tuple = (14, 18, 22, 26), bounds: raster.Bounds = (-0.6, 1.6, 0.2, 2.4),
+                   filename: str = "task2b_view.png") -> None:
+    """
+    Порівнює повну генерацію з рендерингом збільшеного вигляду з відсіканням.
+
+    Args:
+        levels (tuple): Рівні рекурсії.
+        bounds (raster.Bounds): Видима область.
+        filename (str): Тимчасовий файл для запису зображень.
+    """
+    print(f"{'Рівень':>7} | {'Усього квадратів':>17} | {'Повне дерево, с':>16} | "
+          f"{'Намальовано':>12} | {'З відсіканням, с':>17}")
+    for level in levels:
+        if level <= 20:
+            full_time = timeit.timeit(lambda: raster.save_png(raster.render_squares(
+                pythagoras_tree(nb_levels=level), bounds=bounds, margin=0), filename), number=1)
+            full = f"{full_time:>16.3f}"
+        else:
+            full = f"{'-':>16}"
+        start = timeit.default_timer()
+        drawn = pythagor_tree_view_png(filename, bounds, nb_levels=level)
+        elapsed = timeit.default_timer() - start
+        print(f"{level:>7} | {2 ** (level + 1) - 1:>17} | {full} | {drawn:>12} | {elapsed:>17.3f}")
+
 def main():
     """Головна функція програми."""
     print('Програма для генерації фрактала "Дерево Піфагора"')
@@ -1,19 +1,158 @@
 import heapq
+import math
+import mmap
+import os
 import random
-from typing import Dict, List, Tuple, Set
+import timeit
+import weakref
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import Callable, Dict, Hashable, Iterable, List, Optional, Sequence, Tuple, Set, Union
 
+import numpy as np
 
-def dijkstra(graph: Dict[str, Dict[str, int]], start: str) -> Dict[str, float]:
+
+class IndexedHeap:
+    """
+    Індексована d-арна мін-купа з операцією decrease-key.
+
+    Кожен елемент зберігається в купі не більше одного разу, а словник позицій
+    дозволяє знайти його за O(1) і зменшити пріоритет за O(log_d n).
+    Тому розмір купи в алгоритмі Дейкстри не перевищує кількості вершин,
+    тоді як лінива купа heapq накопичує до O(E) застарілих записів.
+    """
+    __slots__ = ("arity", "_priorities", "_items", "_positions")
+
+    def __init__(self, arity: int = 4):
+        """
+        Args:
+            arity (int): Кількість нащадків вузла (2 - бінарна купа).
+        """
+        if arity < 2:
+            raise ValueError("arity має бути не меншою за 2")
+        self.arity = arity
+        self._priorities: List[float] = []
+        self._items: List[Hashable] = []
+        self._positions: Dict[Hashable, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __contains__(self, item: Hashable) -> bool:
+        return item in self._positions
+
+    def priority(self, item: Hashable) -> float:
+        """Повертає поточний пріоритет елемента (KeyError, якщо його немає)."""
+        return self._priorities[self._positions[item]]
+
+    def peek(self) -> Tuple[float, Hashable]:
+        """Повертає (пріоритет, елемент) з найменшим пріоритетом без видалення."""
+        if not self._items:
+            raise IndexError("peek from empty heap")
+        return self._priorities[0], self._items[0]
+
+    def push(self, item: Hashable, priority: float) -> bool:
+        """
+        Додає елемент або зменшує його пріоритет (decrease-key).
+
+        Args:
+            item (Hashable): Елемент.
+            priority (float): Новий пріоритет.
+
+        Returns:
+            bool: True, якщо купу змінено; False, якщо елемент вже мав не більший пріоритет.
+        """
+        position = self._positions.get(item)
+        if position is None:
+            position = len(self._items)
+            self._priorities.append(priority)
+            self._items.append(item)
+        elif priority < self._priorities[position]:
+            self._priorities[position] = priority
+        else:
+            return False
+        self._sift_up(position, item, priority)
+        return True
+
+    def pop(self) -> Tuple[float, Hashable]:
+        """Видаляє та повертає (пріоритет, елемент) з найменшим пріоритетом."""
+        if not self._items:
+            raise IndexError("pop from empty heap")
+        priorities, items = self._priorities, self._items
+        top_priority, top_item = priorities[0], items[0]
+        del self._positions[top_item]
+        last_priority, last_item = priorities.pop(), items.pop()
+        if items:
+            self._sift_down(0, last_item, last_priority)
+        return top_priority, top_item
+
+    def _sift_up(self, position: int, item: Hashable, priority: float) -> None:
+        """Піднімає "дірку" на місці position, зсуваючи батьків униз, і ставить туди елемент."""
+        priorities, items, positions, arity = self._priorities, self._items, self._positions, self.arity
+        while position:
+            parent = (position - 1) // arity
+            if priorities[parent] <= priority:
+                break
+            priorities[position] = priorities[parent]
+            items[position] = items[parent]
+            positions[items[position]] = position
+            position = parent
+        priorities[position] = priority
+        items[position] = item
+        positions[item] = position
+
+    def _sift_down(self, position: int, item: Hashable, priority: float) -> None:
+        """Опускає елемент від position, піднімаючи найменших нащадків."""
+        priorities, items, positions, arity = self._priorities, self._items, self._positions, self.arity
+        size = len(items)
+        while True:
+            first = position * arity + 1
+            if first >= size:
+                break
+            last = min(first + arity, size)
+            child = first
+            child_priority = priorities[first]
+            for candidate in range(first + 1, last):
+                if priorities[candidate] < child_priority:
+                    child, child_priority = candidate, priorities[candidate]
+            if priority <= child_priority:
+                break
+            priorities[position] = child_priority
+            items[position] = items[child]
+            positions[items[position]] = position
+            position = child
+        priorities[position] = priority
+        items[position] = item
+        positions[item] = position
+
+
+# Черги пріоритетів для dijkstra:
+# "lazy" - heapq із лінивим видаленням застарілих записів,
+# "indexed" - IndexedHeap з decrease-key.
+QUEUES = ("lazy", "indexed")
+
+
+def dijkstra(graph: Dict[str, Dict[str, int]], start: str, queue: str = "lazy", arity: int = 4,
+             stats: Optional[Dict[str, int]] = None) -> Dict[str, float]:
     """
     Реалізує алгоритм Дейкстри для пошуку найкоротшого шляху в графі.
 
     Args:
         graph (Dict[str, Dict[str, int]]): Граф, представлений у вигляді словника суміжності.
         start (str): Початкова вершина.
+        queue (str): Черга пріоритетів з QUEUES.
+        arity (int): Арність IndexedHeap для queue="indexed".
+        stats (Optional[Dict[str, int]]): Якщо задано, отримує "settled" (кількість
+            оброблених вершин) та "peak_queue" (найбільший розмір черги).
 
     Returns:
         Dict[str, float]: Словник найкоротших відстаней від початкової вершини до всіх інших.
     """
+    if queue not in QUEUES:
+        raise ValueError(f"queue має бути одним з {QUEUES}")
+    if queue == "indexed":
+        return _dijkstra_indexed(graph, start, arity, stats)
+
     # Ініціалізація відстаней: нескінченність для всіх вершин, крім початкової
     distances = {vertex: float("infinity") for vertex in graph}
     distances[start] = 0
@@ -24,6 +163,7 @@ def dijkstra(graph: Dict[str, Dict[str, int]], start: str) -> Dict[str, float]:
 
     # Множина відвіданих вершин, для яких вже знайдено найкоротший шлях
     visited: Set[str] = set()
+    peak_queue = 1
 
     while priority_queue:
         # Витягуємо вершину з найменшою відстанню з черги пріоритетів
@@ -47,9 +187,350 @@ def dijkstra(graph: Dict[str, Dict[str, int]], start: str) -> Dict[str, float]:
                 # Додаємо сусіда в чергу з новою відстанню
                 heapq.heappush(priority_queue, (distance, neighbor))
 
+        # Купа росте лише під час релаксації, тож максимум досить перевіряти раз на вершину
+        if len(priority_queue) > peak_queue:
+            peak_queue = len(priority_queue)
+
+    if stats is not None:
+        stats["settled"] = len(visited)
+        stats["peak_queue"] = peak_queue
+    return distances
+
+
+def _dijkstra_indexed(graph: Dict[str, Dict[str, int]], start: str, arity: int,
+                      stats: Optional[Dict[str, int]]) -> Dict[str, float]:
+    """
+    Алгоритм Дейкстри з IndexedHeap: покращення відстані зменшує ключ наявного запису,
+    тому купа містить лише вершини фронту без застарілих дублікатів.
+    """
+    distances = {vertex: float("infinity") for vertex in graph}
+    distances[start] = 0
+    heap = IndexedHeap(arity)
+    heap.push(start, 0)
+    visited: Set[str] = set()
+    peak_queue = 1
+
+    while heap:
+        current_distance, current_vertex = heap.pop()
+        visited.add(current_vertex)
+
+        for neighbor, weight in graph[current_vertex].items():
+            distance = current_distance + weight
+            if distance < distances[neighbor]:
+                distances[neighbor] = distance
+                # Для невід'ємних ваг оброблена вершина сюди не потрапляє; перевірка лише
+                # гарантує завершення (як у лінивій версії) при від'ємних вагах
+                if neighbor not in visited:
+                    heap.push(neighbor, distance)
+
+        if len(heap) > peak_queue:
+            peak_queue = len(heap)
+
+    if stats is not None:
+        stats["settled"] = len(visited)
+        stats["peak_queue"] = peak_queue
+    return distances
+
+
+# Способи обчислення відстаней у CSR-графі:
+# "heap" - класичний Дейкстра з купою над цілими id,
+# "delta" - векторизований delta-stepping: за один крок NumPy релаксує всі ребра
+# вершин, чия відстань не перевищує поточний мінімум + delta.
+CSR_ENGINES = ("heap", "delta")
+
+
+class CSRGraph:
+    """
+    Компактний орієнтований граф у форматі CSR (compressed sparse row).
+
+    Імена вершин інтерновані у цілі id 0..n-1. Ребра вершини v займають
+    проміжок offsets[v]:offsets[v + 1] масивів targets та weights, тому граф
+    з 10M ребер займає близько 120 МБ (int32 цілі + float64 ваги) замість
+    гігабайтів словників.
+    """
+    __slots__ = ("names", "ids", "offsets", "targets", "weights")
+
+    def __init__(self, names: Sequence[str], offsets: np.ndarray, targets: np.ndarray,
+                 weights: np.ndarray):
+        """
+        Args:
+            names (Sequence[str]): Імена вершин у порядку їх id.
+            offsets (np.ndarray): Межі списків суміжності, довжина n + 1.
+            targets (np.ndarray): Кінці ребер (id вершин).
+            weights (np.ndarray): Ваги ребер.
+
+        Raises:
+            ValueError: Якщо масиви неузгоджені або є від'ємні ваги.
+        """
+        self.names: List[str] = list(names)
+        self.ids: Dict[str, int] = {name: i for i, name in enumerate(self.names)}
+        self.offsets = np.ascontiguousarray(offsets, dtype=np.int64)
+        self.targets = np.ascontiguousarray(targets, dtype=np.int32)
+        self.weights = np.ascontiguousarray(weights, dtype=np.float64)
+        n = len(self.names)
+        if len(self.ids) != n:
+            raise ValueError("Імена вершин мають бути унікальними")
+        if self.offsets.shape != (n + 1,) or self.offsets[0] != 0 or np.any(np.diff(self.offsets) < 0):
+            raise ValueError("offsets має бути неспадною послідовністю довжини n + 1 від 0")
+        if self.targets.shape != (self.offsets[-1],) or self.weights.shape != self.targets.shape:
+            raise ValueError("Довжини targets та weights мають дорівнювати offsets[-1]")
+        if self.targets.size and (self.targets.min() < 0 or self.targets.max() >= n):
+            raise ValueError("targets містить неіснуючі вершини")
+        if np.any(self.weights < 0):
+            raise ValueError("Алгоритм Дейкстри не підтримує від'ємні ваги")
+
+    @classmethod
+    def from_dict(cls, graph: Dict[str, Dict[str, float]]) -> 'CSRGraph':
+        """
+        Перетворює словник суміжності на CSR-граф.
+
+        Вершини, які зустрічаються лише як сусіди, додаються в кінець.
+
+        Args:
+            graph (Dict[str, Dict[str, float]]): Граф у форматі dijkstra.
+
+        Returns:
+            CSRGraph: Компактне представлення того ж графа.
+        """
+        names = list(graph)
+        ids = {name: i for i, name in enumerate(names)}
+        for neighbors in graph.values():
+            for neighbor in neighbors:
+                if neighbor not in ids:
+                    ids[neighbor] = len(names)
+                    names.append(neighbor)
+        degrees = [len(graph[name]) if name in graph else 0 for name in names]
+        offsets = np.zeros(len(names) + 1, dtype=np.int64)
+        np.cumsum(degrees, out=offsets[1:])
+        count = int(offsets[-1])
+        targets = np.fromiter((ids[neighbor] for neighbors in graph.values() for neighbor in neighbors),
+                              dtype=np.int32, count=count)
+        weights = np.fromiter((weight for neighbors in graph.values() for weight in neighbors.values()),
+                              dtype=np.float64, count=count)
+        return cls(names, offsets, targets, weights)
+
+    @classmethod
+    def from_edges(cls, vertices: Union[int, Sequence[str]], sources: Iterable[int],
+                   targets: Iterable[int], weights: Iterable[float]) -> 'CSRGraph':
+        """
+        Будує CSR-граф зі списку ребер без проміжних словників.
+
+        Args:
+            vertices (Union[int, Sequence[str]]): Кількість вершин (імена "0".."n-1") або їх імена.
+            sources (Iterable[int]): Початки ребер (id).
+            targets (Iterable[int]): Кінці ребер (id).
+            weights (Iterable[float]): Ваги ребер.
+
+        Returns:
+            CSRGraph: Граф, у якому ребра згруповані за початковою вершиною.
+        """
+        names = [str(i) for i in range(vertices)] if isinstance(vertices, int) else vertices
+        sources = np.asarray(sources, dtype=np.int64)
+        targets = np.asarray(targets)
+        weights = np.asarray(weights, dtype=np.float64)
+        if sources.size and (sources.min() < 0 or sources.max() >= len(names)):
+            raise ValueError("sources містить неіснуючі вершини")
+        # Стабільне сортування зберігає порядок ребер кожної вершини
+        order = np.argsort(sources, kind="stable")
+        offsets = np.zeros(len(names) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(sources, minlength=len(names)), out=offsets[1:])
+        return cls(names, offsets, targets[order], weights[order])
+
+    @property
+    def num_vertices(self) -> int:
+        return len(self.names)
+
+    @property
+    def num_edges(self) -> int:
+        return int(self.targets.size)
+
+    @property
+    def nbytes(self) -> int:
+        """Розмір масивів CSR у байтах (без таблиці імен)."""
+        return self.offsets.nbytes + self.targets.nbytes + self.weights.nbytes
+
+    def vertex(self, vertex: Union[str, int]) -> int:
+        """
+        Повертає id вершини за іменем (цілі id повертаються як є).
+
+        Raises:
+            KeyError: Якщо вершини немає в графі.
+        """
+        if isinstance(vertex, (int, np.integer)):
+            if not 0 <= vertex < len(self.names):
+                raise KeyError(vertex)
+            return int(vertex)
+        return self.ids[vertex]
+
+    def neighbors(self, vertex: Union[str, int]) -> Tuple[np.ndarray, np.ndarray]:
+        """Повертає (targets, weights) вихідних ребер вершини як представлення масивів."""
+        v = self.vertex(vertex)
+        start, end = self.offsets[v], self.offsets[v + 1]
+        return self.targets[start:end], self.weights[start:end]
+
+    def to_dict(self) -> Dict[str, Dict[str, float]]:
+        """
+        Перетворює граф назад у словник суміжності.
+
+        Для паралельних ребер залишається найменша вага.
+        """
+        graph: Dict[str, Dict[str, float]] = {}
+        offsets = self.offsets.tolist()
+        targets = self.targets.tolist()
+        weights = self.weights.tolist()
+        for v, name in enumerate(self.names):
+            neighbors = graph[name] = {}
+            for i in range(offsets[v], offsets[v + 1]):
+                neighbor = self.names[targets[i]]
+                if weights[i] < neighbors.get(neighbor, float("infinity")):
+                    neighbors[neighbor] = weights[i]
+        return graph
+
+    def as_dict(self, values: Sequence[float]) -> Dict[str, float]:
+        """Підписує масив значень по id іменами вершин (формат результату dijkstra)."""
+        return dict(zip(self.names, np.asarray(values).tolist()))
+
+
+def random_csr_graph(num_vertices: int, num_edges: int, max_weight: int = 100,
+                     seed: Optional[int] = None) -> CSRGraph:
+    """
+    Генерує випадковий орієнтований граф одразу у форматі CSR.
+
+    Args:
+        num_vertices (int): Кількість вершин.
+        num_edges (int): Кількість ребер.
+        max_weight (int): Максимальна (цілочисельна) вага ребра.
+        seed (Optional[int]): Зерно генератора.
+
+    Returns:
+        CSRGraph: Граф з вершинами "0".."n-1".
+    """
+    rng = np.random.default_rng(seed)
+    sources = rng.integers(0, num_vertices, num_edges)
+    targets = rng.integers(0, num_vertices, num_edges, dtype=np.int32)
+    weights = rng.integers(1, max_weight + 1, num_edges).astype(np.float64)
+    return CSRGraph.from_edges(num_vertices, sources, targets, weights)
+
+
+def _dijkstra_heap(offsets: np.ndarray, targets: np.ndarray, weights: np.ndarray, source: int) -> np.ndarray:
+    """
+    Дейкстра з купою над цілими id: списки замість словників та рядкових ключів.
+
+    Працює з масивами CSR напряму, тож підходить і для масивів у спільній пам'яті.
+    """
+    distances = [float("infinity")] * (len(offsets) - 1)
+    distances[source] = 0.0
+    offsets = offsets.tolist()
+    priority_queue = [(0.0, source)]
+    heappop, heappush = heapq.heappop, heapq.heappush
+
+    while priority_queue:
+        current_distance, current_vertex = heappop(priority_queue)
+        # Застарілий запис: вершину вже досягнуто коротшим шляхом
+        if current_distance > distances[current_vertex]:
+            continue
+        start, end = offsets[current_vertex], offsets[current_vertex + 1]
+        # Зріз масивів переводимо у списки одним викликом на вершину
+        for neighbor, weight in zip(targets[start:end].tolist(), weights[start:end].tolist()):
+            distance = current_distance + weight
+            if distance < distances[neighbor]:
+                distances[neighbor] = distance
+                heappush(priority_queue, (distance, neighbor))
+
+    return np.array(distances)
+
+
+def _default_delta(weights: np.ndarray) -> float:
+    """Типова ширина кошика delta-stepping - середня вага ребра."""
+    return float(weights.mean()) if weights.size else 1.0
+
+
+def _dijkstra_delta(offsets: np.ndarray, targets: np.ndarray, weights: np.ndarray, source: int,
+                    delta: float) -> np.ndarray:
+    """
+    Векторизований delta-stepping.
+
+    На кожному кроці релаксуються всі вершини, що очікують обробки і мають відстань
+    не більшу за мінімальну серед них + delta. Вершина, відстань якої потім зменшилась,
+    повертається в чергу, тому результат точний для будь-якого delta >= 0:
+    delta = 0 обробляє рівні однакових відстаней, велике delta перетворюється
+    на Беллмана-Форда по фронту.
+    """
+    num_vertices = len(offsets) - 1
+    distances = np.full(num_vertices, np.inf)
+    distances[source] = 0.0
+    pending = np.array([source], dtype=np.int64)
+    # Прапорці вершин у черзі, щоб не додавати їх повторно без сортування
+    queued = np.zeros(num_vertices, dtype=bool)
+    queued[source] = True
+
+    while pending.size:
+        pending_distances = distances[pending]
+        selected = pending_distances <= pending_distances.min() + delta
+        front = pending[selected]
+        pending = pending[~selected]
+        queued[front] = False
+
+        # Індекси всіх вихідних ребер фронту без циклу Python
+        starts = offsets[front]
+        counts = offsets[front + 1] - starts
+        total = int(counts.sum())
+        if not total:
+            continue
+        edges = np.repeat(starts - (np.cumsum(counts) - counts), counts) + np.arange(total)
+        neighbors = targets[edges]
+        candidates = np.repeat(distances[front], counts) + weights[edges]
+
+        better = candidates < distances[neighbors]
+        neighbors = neighbors[better]
+        candidates = candidates[better]
+        # При повторах вершини в присвоєнні перемагає останній запис,
+        # тому впорядковуємо кандидатів за спаданням відстані
+        order = np.argsort(candidates)[::-1]
+        distances[neighbors[order]] = candidates[order]
+        added = np.unique(neighbors[~queued[neighbors]])
+        queued[added] = True
+        pending = np.concatenate((pending, added))
+
     return distances
 
 
+def dijkstra_csr(graph: CSRGraph, start: Union[str, int], engine: str = "heap",
+                 delta: Optional[float] = None) -> np.ndarray:
+    """
+    Алгоритм Дейкстри для графа у форматі CSR.
+
+    Args:
+        graph (CSRGraph): Граф.
+        start (Union[str, int]): Початкова вершина (ім'я або id).
+        engine (str): Спосіб обчислення з CSR_ENGINES.
+        delta (Optional[float]): Ширина кошика для engine="delta" (типово середня вага ребра).
+
+    Returns:
+        np.ndarray: Відстані за id вершин (inf для недосяжних); graph.as_dict дає словник за іменами.
+
+    Raises:
+        KeyError: Якщо початкової вершини немає в графі.
+        ValueError: Якщо engine невідомий або delta від'ємна.
+    """
+    if engine not in CSR_ENGINES:
+        raise ValueError(f"engine має бути одним з {CSR_ENGINES}")
+    if delta is not None and delta < 0:
+        raise ValueError("delta має бути невід'ємною")
+    source = graph.vertex(start)
+    if delta is None:
+        delta = _default_delta(graph.weights)
+    return _csr_distances(graph.offsets, graph.targets, graph.weights, source, engine, delta)
+
+
+def _csr_distances(offsets: np.ndarray, targets: np.ndarray, weights: np.ndarray, source: int,
+                   engine: str, delta: float) -> np.ndarray:
+    """Обчислює відстані від source обраним способом з CSR_ENGINES."""
+    if engine == "heap":
+        return _dijkstra_heap(offsets, targets, weights, source)
+    return _dijkstra_delta(offsets, targets, weights, source, delta)
+
+
 def create_graph() -> Dict[str, Dict[str, int]]:
     """
     Генерує випадковий граф з 10 вершинами та 15-20 ребрами.
@@ -99,6 +580,782 @@ def create_graph() -> Dict[str, Dict[str, int]]:
     return graph
 
 
+def grid_graph(rows: int, cols: int, max_weight: int = 10, seed: Optional[int] = None) -> Dict[str, Dict[str, int]]:
+    """
+    Генерує граф-решітку, схожий на дорожню мережу.
+
+    Сусідні клітинки з'єднані ребрами в обидва боки з незалежними вагами,
+    тобто граф орієнтований, як і в create_graph.
+
+    Args:
+        rows (int): Кількість рядків.
+        cols (int): Кількість стовпців.
+        max_weight (int): Максимальна вага ребра.
+        seed (Optional[int]): Зерно генератора.
+
+    Returns:
+        Dict[str, Dict[str, int]]: Граф з вершинами "рядок,стовпець".
+    """
+    rng = random.Random(seed)
+    graph: Dict[str, Dict[str, int]] = {f"{r},{c}": {} for r in range(rows) for c in range(cols)}
+    for r in range(rows):
+        for c in range(cols):
+            neighbors = graph[f"{r},{c}"]
+            for nr, nc in ((r - 1, c), (r + 1, c), (r, c - 1), (r, c + 1)):
+                if 0 <= nr < rows and 0 <= nc < cols:
+                    neighbors[f"{nr},{nc}"] = rng.randint(1, max_weight)
+    return graph
+
+
+def reverse_graph(graph: Dict[str, Dict[str, int]]) -> Dict[str, Dict[str, int]]:
+    """
+    Будує обернений граф: кожне ребро u -> v стає ребром v -> u з тією ж вагою.
+
+    Args:
+        graph (Dict[str, Dict[str, int]]): Граф у вигляді словника суміжності.
+
+    Returns:
+        Dict[str, Dict[str, int]]: Обернений граф з тими самими вершинами.
+    """
+    reverse: Dict[str, Dict[str, int]] = {vertex: {} for vertex in graph}
+    for vertex, neighbors in graph.items():
+        for neighbor, weight in neighbors.items():
+            reverse.setdefault(neighbor, {})[vertex] = weight
+    return reverse
+
+
+def _build_path(predecessors: Dict[str, Optional[str]], vertex: str) -> List[str]:
+    """Відновлює шлях до вершини за словником попередників (у зворотному порядку)."""
+    path = []
+    while vertex is not None:
+        path.append(vertex)
+        vertex = predecessors[vertex]
+    return path
+
+
+def shortest_path(graph: Dict[str, Dict[str, int]], source: str, target: str,
+                  stats: Optional[Dict[str, int]] = None) -> Tuple[float, List[str]]:
+    """
+    Знаходить найкоротший шлях між двома вершинами алгоритмом Дейкстри з раннім виходом.
+
+    Пошук зупиняється, щойно target оброблено, а відстані зберігаються лише для
+    досягнутих вершин, тому ціна запиту залежить від відстані до цілі, а не від розміру графа.
+
+    Args:
+        graph (Dict[str, Dict[str, int]]): Граф у вигляді словника суміжності.
+        source (str): Початкова вершина.
+        target (str): Кінцева вершина.
+        stats (Optional[Dict[str, int]]): Якщо задано, отримує "settled" - кількість оброблених вершин.
+
+    Returns:
+        Tuple[float, List[str]]: Довжина шляху та вершини від source до target;
+        (inf, []) якщо target недосяжна.
+
+    Raises:
+        KeyError: Якщо source або target немає в графі.
+    """
+    for vertex in (source, target):
+        if vertex not in graph:
+            raise KeyError(vertex)
+    distances: Dict[str, float] = {source: 0}
+    predecessors: Dict[str, Optional[str]] = {source: None}
+    priority_queue: List[Tuple[float, str]] = [(0, source)]
+    visited: Set[str] = set()
+
+    while priority_queue:
+        current_distance, current_vertex = heapq.heappop(priority_queue)
+        if current_vertex in visited:
+            continue
+        visited.add(current_vertex)
+        # Відстань до цілі остаточна з моменту її вилучення з купи
+        if current_vertex == target:
+            break
+
+        for neighbor, weight in graph[current_vertex].items():
+            distance = current_distance + weight
+            if distance < distances.get(neighbor, float("infinity")):
+                distances[neighbor] = distance
+                predecessors[neighbor] = current_vertex
+                heapq.heappush(priority_queue, (distance, neighbor))
+
+    if stats is not None:
+        stats["settled"] = len(visited)
+    if target not in visited:
+        return float("infinity"), []
+    return distances[target], _build_path(predecessors, target)[::-1]
+
+
+def bidirectional_shortest_path(graph: Dict[str, Dict[str, int]], source: str, target: str,
+                                reverse: Optional[Dict[str, Dict[str, int]]] = None,
+                                stats: Optional[Dict[str, int]] = None) -> Tuple[float, List[str]]:
+    """
+    Двонаправлений алгоритм Дейкстри: прямий пошук від source та зворотний від target.
+
+    Кожен крок розширює меншу з двох черг. Найкращий шлях mu оновлюється, коли ребро
+    веде у вершину, вже досягнуту з іншого боку; пошук зупиняється, коли сума мінімумів
+    обох черг не менша за mu. Обидва пошуки обходять кола радіусом близько половини
+    відстані, що на дорожніх графах суттєво менше одного кола повного радіуса.
+
+    Args:
+        graph (Dict[str, Dict[str, int]]): Граф у вигляді словника суміжності.
+        source (str): Початкова вершина.
+        target (str): Кінцева вершина.
+        reverse (Optional[Dict[str, Dict[str, int]]]): Обернений граф (reverse_graph);
+            для серії запитів варто побудувати його один раз.
+        stats (Optional[Dict[str, int]]): Якщо задано, отримує "settled" - кількість оброблених вершин.
+
+    Returns:
+        Tuple[float, List[str]]: Довжина шляху та вершини від source до target;
+        (inf, []) якщо target недосяжна.
+
+    Raises:
+        KeyError: Якщо source або target немає в графі.
+    """
+    for vertex in (source, target):
+        if vertex not in graph:
+            raise KeyError(vertex)
+    if reverse is None:
+        reverse = reverse_graph(graph)
+
+    # Індекс 0 - прямий пошук, 1 - зворотний
+    adjacency = (graph, reverse)
+    distances: Tuple[Dict[str, float], ...] = ({source: 0}, {target: 0})
+    predecessors: Tuple[Dict[str, Optional[str]], ...] = ({source: None}, {target: None})
+    queues: Tuple[List[Tuple[float, str]], ...] = ([(0, source)], [(0, target)])
+    visited: Tuple[Set[str], ...] = (set(), set())
+    best = 0 if source == target else float("infinity")
+    meeting = source if source == target else None
+
+    while queues[0] and queues[1]:
+        if queues[0][0][0] + queues[1][0][0] >= best:
+            break
+        side = 0 if len(queues[0]) <= len(queues[1]) else 1
+        current_distance, current_vertex = heapq.heappop(queues[side])
+        if current_vertex in visited[side]:
+            continue
+        visited[side].add(current_vertex)
+
+        own, other = distances[side], distances[1 - side]
+        for neighbor, weight in adjacency[side][current_vertex].items():
+            distance = current_distance + weight
+            if distance < own.get(neighbor, float("infinity")):
+                own[neighbor] = distance
+                predecessors[side][neighbor] = current_vertex
+                heapq.heappush(queues[side], (distance, neighbor))
+                if neighbor in other and distance + other[neighbor] < best:
+                    best = distance + other[neighbor]
+                    meeting = neighbor
+
+    if stats is not None:
+        stats["settled"] = len(visited[0]) + len(visited[1])
+    if meeting is None:
+        return float("infinity"), []
+    # Прямий шлях до точки зустрічі та зворотний (вже в порядку до target) після неї
+    return best, _build_path(predecessors[0], meeting)[::-1] + _build_path(predecessors[1], meeting)[1:]
+
+
+def benchmark_shortest_path(sizes: tuple = (100, 300), queries: int = 20, seed: int = 0) -> None:
+    """
+    Порівнює повний dijkstra, shortest_path та bidirectional_shortest_path
+    на випадкових запитах у графах-решітках.
+
+    Args:
+        sizes (tuple): Сторони квадратних решіток.
+        queries (int): Кількість пар (source, target).
+        seed (int): Зерно генератора.
+    """
+    print(f"{'Решітка':>9} | {'Метод':>15} | {'Запит, мс':>10} | {'Вершин оброблено':>16}")
+    rng = random.Random(seed)
+    for size in sizes:
+        graph = grid_graph(size, size, seed=seed)
+        reverse = reverse_graph(graph)
+        vertices = list(graph)
+        pairs = [(rng.choice(vertices), rng.choice(vertices)) for _ in range(queries)]
+        methods = (
+            ("dijkstra", lambda s, t, stats: dijkstra(graph, s, stats=stats)),
+            ("shortest_path", lambda s, t, stats: shortest_path(graph, s, t, stats)),
+            ("bidirectional", lambda s, t, stats: bidirectional_shortest_path(graph, s, t, reverse, stats)),
+        )
+        for name, method in methods:
+            settled = 0
+            elapsed = 0.0
+            for source, target in pairs:
+                stats: Dict[str, int] = {}
+                elapsed += timeit.timeit(lambda: method(source, target, stats), number=1)
+                settled += stats["settled"]
+            print(f"{size}x{size:<5} | {name:>15} | {1000 * elapsed / queries:>10.2f} | {settled // queries:>16}")
+
+
+# Евристика A*: нижня оцінка відстані від вершини до цілі, h(vertex, target)
+Heuristic = Callable[[str, str], float]
+
+
+def _zero_heuristic(vertex: str, target: str) -> float:
+    """Нульова евристика: A* зводиться до алгоритму Дейкстри."""
+    return 0
+
+
+def grid_coordinates(rows: int, cols: int) -> Dict[str, Tuple[float, float]]:
+    """
+    Повертає координати (x, y) вершин графа grid_graph.
+
+    Args:
+        rows (int): Кількість рядків.
+        cols (int): Кількість стовпців.
+
+    Returns:
+        Dict[str, Tuple[float, float]]: Координати за іменем вершини.
+    """
+    return {f"{r},{c}": (float(c), float(r)) for r in range(rows) for c in range(cols)}
+
+
+def euclidean_heuristic(coordinates: Dict[str, Tuple[float, float]], scale: float = 1.0) -> Heuristic:
+    """
+    Евклідова евристика.
+
+    Допустима й узгоджена, якщо вага кожного ребра не менша за scale,
+    помножене на евклідову довжину ребра.
+
+    Args:
+        coordinates (Dict[str, Tuple[float, float]]): Координати вершин.
+        scale (float): Мінімальна вага одиниці довжини.
+
+    Returns:
+        Heuristic: Функція h(vertex, target).
+    """
+    def heuristic(vertex: str, target: str) -> float:
+        (x0, y0), (x1, y1) = coordinates[vertex], coordinates[target]
+        return scale * math.hypot(x1 - x0, y1 - y0)
+    return heuristic
+
+
+def manhattan_heuristic(coordinates: Dict[str, Tuple[float, float]], scale: float = 1.0) -> Heuristic:
+    """
+    Манхеттенська евристика для графів, де ребра йдуть лише вздовж осей (решітки).
+
+    Args:
+        coordinates (Dict[str, Tuple[float, float]]): Координати вершин.
+        scale (float): Мінімальна вага одиниці довжини.
+
+    Returns:
+        Heuristic: Функція h(vertex, target).
+    """
+    def heuristic(vertex: str, target: str) -> float:
+        (x0, y0), (x1, y1) = coordinates[vertex], coordinates[target]
+        return scale * (abs(x1 - x0) + abs(y1 - y0))
+    return heuristic
+
+
+class Landmarks:
+    """
+    Евристика ALT (A*, landmarks, triangle inequality).
+
+    Для кожного орієнтира L зберігаються відстані d(L, v) та d(v, L), обчислені
+    функцією dijkstra на графі та оберненому графі. З нерівності трикутника
+    d(v, t) >= max(d(L, t) - d(L, v), d(v, L) - d(t, L)) для кожного L,
+    і ця оцінка узгоджена. Таблиці можна зберегти у .npz і завантажити повторно.
+    """
+    __slots__ = ("landmarks", "names", "forward", "backward", "_rows")
+
+    def __init__(self, landmarks: Sequence[str], names: Sequence[str], forward: np.ndarray,
+                 backward: np.ndarray):
+        """
+        Args:
+            landmarks (Sequence[str]): Вершини-орієнтири.
+            names (Sequence[str]): Вершини графа у порядку стовпців таблиць.
+            forward (np.ndarray): d(L, v), форма (орієнтирів, вершин).
+            backward (np.ndarray): d(v, L), форма (орієнтирів, вершин).
+        """
+        self.landmarks: List[str] = list(landmarks)
+        self.names: List[str] = list(names)
+        self.forward = np.asarray(forward, dtype=np.float64)
+        self.backward = np.asarray(backward, dtype=np.float64)
+        shape = (len(self.landmarks), len(self.names))
+        if self.forward.shape != shape or self.backward.shape != shape:
+            raise ValueError(f"Таблиці відстаней мають мати форму {shape}")
+        # Пари (d(L, v), d(v, L)) для кожної вершини: у циклі Python списки швидші за NumPy
+        self._rows: Dict[str, List[Tuple[float, float]]] = {
+            name: list(zip(column_forward, column_backward))
+            for name, column_forward, column_backward in zip(self.names, self.forward.T.tolist(),
+                                                              self.backward.T.tolist())}
+
+    @classmethod
+    def build(cls, graph: Dict[str, Dict[str, int]], count: int = 8,
+              reverse: Optional[Dict[str, Dict[str, int]]] = None, seed: Optional[int] = None) -> 'Landmarks':
+        """
+        Обирає орієнтири жадібним пошуком найвіддаленіших вершин і рахує їх відстані.
+
+        Перший орієнтир - найвіддаленіша вершина від випадкової, кожен наступний -
+        вершина з найбільшою відстанню до найближчого вже обраного орієнтира.
+
+        Args:
+            graph (Dict[str, Dict[str, int]]): Граф у вигляді словника суміжності.
+            count (int): Кількість орієнтирів.
+            reverse (Optional[Dict[str, Dict[str, int]]]): Обернений граф (reverse_graph).
+            seed (Optional[int]): Зерно вибору початкової вершини.
+
+        Returns:
+            Landmarks: Таблиці відстаней для обраних орієнтирів.
+        """
+        if reverse is None:
+            reverse = reverse_graph(graph)
+        names = list(graph)
+        index = {name: i for i, name in enumerate(names)}
+        count = min(count, len(names))
+
+        def distances_from(search_graph: Dict[str, Dict[str, int]], vertex: str) -> np.ndarray:
+            row = np.full(len(names), np.inf)
+            for name, distance in dijkstra(search_graph, vertex).items():
+                row[index[name]] = distance
+            return row
+
+        landmarks: List[str] = []
+        forward: List[np.ndarray] = []
+        backward: List[np.ndarray] = []
+        # Відстань кожної вершини до найближчого обраного орієнтира
+        nearest = distances_from(graph, random.Random(seed).choice(names))
+        while len(landmarks) < count:
+            # Недосяжні вершини обираються лише після досяжних, обрані - ніколи
+            candidates = np.where(np.isfinite(nearest), nearest, -1.0)
+            candidates[[index[name] for name in landmarks]] = -np.inf
+            landmark = names[int(np.argmax(candidates))]
+            landmarks.append(landmark)
+            forward.append(distances_from(graph, landmark))
+            backward.append(distances_from(reverse, landmark))
+            nearest = forward[-1] if len(landmarks) == 1 else np.minimum(nearest, forward[-1])
+        return cls(landmarks, names, np.array(forward).reshape(count, len(names)),
+                   np.array(backward).reshape(count, len(names)))
+
+    def save(self, filename: str) -> None:
+        """Зберігає орієнтири та таблиці відстаней у файл .npz."""
+        np.savez(filename, landmarks=np.array(self.landmarks, dtype=str), names=np.array(self.names, dtype=str),
+                 forward=self.forward, backward=self.backward)
+
+    @classmethod
+    def load(cls, filename: str) -> 'Landmarks':
+        """Завантажує орієнтири, збережені методом save."""
+        with np.load(filename) as data:
+            return cls(data["landmarks"].tolist(), data["names"].tolist(), data["forward"], data["backward"])
+
+    def __call__(self, vertex: str, target: str) -> float:
+        """Нижня оцінка d(vertex, target) за всіма орієнтирами."""
+        bound = 0.0
+        for (from_vertex, to_vertex), (from_target, to_target) in zip(self._rows[vertex], self._rows[target]):
+            # Нескінченні відстані: орієнтир недосяжний з цього боку і оцінки не дає,
+            # або ж досяжність target з vertex неможлива і оцінка коректно нескінченна
+            if from_vertex != math.inf and from_target - from_vertex > bound:
+                bound = from_target - from_vertex
+            if to_target != math.inf and to_vertex - to_target > bound:
+                bound = to_vertex - to_target
+        return bound
+
+
+def astar(graph: Dict[str, Dict[str, int]], source: str, target: str, heuristic: Optional[Heuristic] = None,
+          queue: str = "lazy", arity: int = 4, stats: Optional[Dict[str, int]] = None) -> Tuple[float, List[str]]:
+    """
+    Пошук A*: Дейкстра з пріоритетом g(v) + h(v, target).
+
+    Евристика має бути узгодженою (h(u) <= w(u, v) + h(v)), як усі евристики цього модуля;
+    тоді кожна вершина розширюється не більше одного разу і шлях оптимальний.
+    Без евристики пошук збігається з shortest_path.
+
+    Args:
+        graph (Dict[str, Dict[str, int]]): Граф у вигляді словника суміжності.
+        source (str): Початкова вершина.
+        target (str): Кінцева вершина.
+        heuristic (Optional[Heuristic]): Функція h(vertex, target).
+        queue (str): Черга пріоритетів з QUEUES.
+        arity (int): Арність IndexedHeap для queue="indexed".
+        stats (Optional[Dict[str, int]]): Якщо задано, отримує "expanded" - кількість розширених вершин.
+
+    Returns:
+        Tuple[float, List[str]]: Довжина шляху та вершини від source до target;
+        (inf, []) якщо target недосяжна.
+
+    Raises:
+        KeyError: Якщо source або target немає в графі.
+        ValueError: Якщо queue невідома.
+    """
+    if queue not in QUEUES:
+        raise ValueError(f"queue має бути одним з {QUEUES}")
+    for vertex in (source, target):
+        if vertex not in graph:
+            raise KeyError(vertex)
+    if heuristic is None:
+        heuristic = _zero_heuristic
+    distances: Dict[str, float] = {source: 0}
+    predecessors: Dict[str, Optional[str]] = {source: None}
+    visited: Set[str] = set()
+    # Обидві черги надають однаковий інтерфейс push(vertex, priority) / pop()
+    if queue == "indexed":
+        heap = IndexedHeap(arity)
+        push, pop = heap.push, heap.pop
+    else:
+        heap = []
+
+        def push(vertex: str, priority: float) -> None:
+            heapq.heappush(heap, (priority, vertex))
+
+        def pop() -> Tuple[float, str]:
+            return heapq.heappop(heap)
+    push(source, heuristic(source, target))
+
+    while heap:
+        _, current_vertex = pop()
+        if current_vertex in visited:
+            continue
+        visited.add(current_vertex)
+        if current_vertex == target:
+            break
+
+        current_distance = distances[current_vertex]
+        for neighbor, weight in graph[current_vertex].items():
+            distance = current_distance + weight
+            if distance < distances.get(neighbor, float("infinity")) and neighbor not in visited:
+                distances[neighbor] = distance
+                predecessors[neighbor] = current_vertex
+                push(neighbor, distance + heuristic(neighbor, target))
+
+    if stats is not None:
+        stats["expanded"] = len(visited)
+    if target not in visited:
+        return float("infinity"), []
+    return distances[target], _build_path(predecessors, target)[::-1]
+
+
+def benchmark_astar(size: int = 200, queries: int = 20, landmarks: int = 8, seed: int = 0) -> None:
+    """
+    Порівнює евристики A* на решітці з ребрами вагою від 1: час запиту та розширені вершини.
+
+    Args:
+        size (int): Сторона квадратної решітки.
+        queries (int): Кількість пар (source, target).
+        landmarks (int): Кількість орієнтирів ALT.
+        seed (int): Зерно генератора.
+    """
+    graph = grid_graph(size, size, seed=seed)
+    coordinates = grid_coordinates(size, size)
+    start = timeit.default_timer()
+    alt = Landmarks.build(graph, landmarks, seed=seed)
+    print(f"Підготовка {landmarks} орієнтирів: {timeit.default_timer() - start:.2f} с")
+    rng = random.Random(seed)
+    vertices = list(graph)
+    pairs = [(rng.choice(vertices), rng.choice(vertices)) for _ in range(queries)]
+    heuristics = (("без евристики", None), ("евклідова", euclidean_heuristic(coordinates)),
+                  ("манхеттенська", manhattan_heuristic(coordinates)), ("ALT", alt))
+    print(f"{'Евристика':>14} | {'Запит, мс':>10} | {'Розширено вершин':>16}")
+    for name, heuristic in heuristics:
+        expanded = 0
+        elapsed = 0.0
+        for source, target in pairs:
+            stats: Dict[str, int] = {}
+            elapsed += timeit.timeit(lambda: astar(graph, source, target, heuristic, stats=stats), number=1)
+            expanded += stats["expanded"]
+        print(f"{name:>14} | {1000 * elapsed / queries:>10.2f} | {expanded // queries:>16}")
+
+
+class _SuperSource:
+    """Віртуальна вершина, що не збігається з жодним іменем графа."""
+    __slots__ = ()
+
+    def __repr__(self) -> str:
+        return "<super-source>"
+
+
+def multi_source_dijkstra(graph: Dict[str, Dict[str, int]], sources: Iterable[str], queue: str = "lazy",
+                          arity: int = 4) -> Dict[str, float]:
+    """
+    Відстані від кожної вершини до найближчого з джерел за один прохід Дейкстри.
+
+    До графа додається віртуальне супер-джерело з ребрами нульової ваги до всіх
+    джерел, і з нього запускається звичайний dijkstra; сам граф не змінюється.
+
+    Args:
+        graph (Dict[str, Dict[str, int]]): Граф у вигляді словника суміжності.
+        sources (Iterable[str]): Початкові вершини.
+        queue (str): Черга пріоритетів з QUEUES.
+        arity (int): Арність IndexedHeap для queue="indexed".
+
+    Returns:
+        Dict[str, float]: Відстань до найближчого джерела для кожної вершини.
+
+    Raises:
+        KeyError: Якщо якогось джерела немає в графі.
+    """
+    super_source = _SuperSource()
+    edges = {}
+    for source in sources:
+        if source not in graph:
+            raise KeyError(source)
+        edges[source] = 0
+    # Неглибока копія: списки суміжності вершин спільні з оригінальним графом
+    augmented = dict(graph)
+    augmented[super_source] = edges
+    distances = dijkstra(augmented, super_source, queue, arity)
+    del distances[super_source]
+    return distances
+
+
+def nearest_facility(graph: Dict[str, Dict[str, int]],
+                     facilities: Iterable[str]) -> Dict[str, Tuple[float, Optional[str]]]:
+    """
+    Для кожної вершини знаходить найближчий об'єкт (склад, депо) та відстань до нього.
+
+    Черга ініціалізується всіма об'єктами з нульовою відстанню, що рівнозначно
+    розширенню віртуального супер-джерела; кожна вершина успадковує мітку
+    об'єкта від попередника на найкоротшому шляху.
+
+    Args:
+        graph (Dict[str, Dict[str, int]]): Граф у вигляді словника суміжності.
+        facilities (Iterable[str]): Вершини з об'єктами.
+
+    Returns:
+        Dict[str, Tuple[float, Optional[str]]]: (відстань, найближчий об'єкт) для кожної
+        вершини; (inf, None) для недосяжних.
+
+    Raises:
+        KeyError: Якщо якогось об'єкта немає в графі.
+    """
+    nearest: Dict[str, Tuple[float, Optional[str]]] = {vertex: (float("infinity"), None) for vertex in graph}
+    priority_queue: List[Tuple[float, str, str]] = []
+    for facility in facilities:
+        if facility not in graph:
+            raise KeyError(facility)
+        nearest[facility] = (0, facility)
+        priority_queue.append((0, facility, facility))
+    heapq.heapify(priority_queue)
+    visited: Set[str] = set()
+
+    while priority_queue:
+        current_distance, current_vertex, facility = heapq.heappop(priority_queue)
+        if current_vertex in visited:
+            continue
+        visited.add(current_vertex)
+
+        for neighbor, weight in graph[current_vertex].items():
+            distance = current_distance + weight
+            if distance < nearest[neighbor][0]:
+                nearest[neighbor] = (distance, facility)
+                heapq.heappush(priority_queue, (distance, neighbor, facility))
+
+    return nearest
+
+
+def _csr_views(shm: shared_memory.SharedMemory, num_vertices: int, num_edges: int) -> Tuple[np.ndarray, ...]:
+    """
+    Розміщує масиви CSR у сегменті: offsets (int64), weights (float64), targets (int32).
+
+    Масиви з 8-байтовими елементами йдуть першими, тож усі три вирівняні.
+    Усі три - представлення одного масиву байтів, і сегмент закривається,
+    коли зникає останнє з них.
+    """
+    raw = np.ndarray(shm.size, dtype=np.uint8, buffer=shm.buf)
+    weakref.finalize(raw, shm.close)
+    weights_start = (num_vertices + 1) * 8
+    targets_start = weights_start + num_edges * 8
+    offsets = raw[:weights_start].view(np.int64)
+    weights = raw[weights_start:targets_start].view(np.float64)
+    targets = raw[targets_start:targets_start + num_edges * 4].view(np.int32)
+    return offsets, targets, weights
+
+
+def _shared_matrix(storage: str, offset: Optional[int], shape: tuple) -> np.ndarray:
+    """
+    Відкриває матрицю відстаней, у яку пишуть дочірні процеси.
+
+    Args:
+        storage (str): Ім'я сегмента спільної пам'яті або шлях до файлу numpy.memmap.
+        offset (Optional[int]): Зсув матриці у файлі; None - storage є сегментом.
+        shape (tuple): Форма матриці.
+
+    Returns:
+        np.ndarray: Матриця float64 у спільній пам'яті або у файлі.
+    """
+    if offset is not None:
+        return np.memmap(storage, dtype=np.float64, mode="r+", offset=offset, shape=shape)
+    shm = shared_memory.SharedMemory(name=storage)
+    matrix = np.ndarray(shape, dtype=np.float64, buffer=shm.buf)
+    # Сегмент закривається разом з останнім представленням матриці
+    weakref.finalize(matrix, shm.close)
+    return matrix
+
+
+def _all_pairs_shared(graph_storage: str, num_vertices: int, num_edges: int, result_storage: str,
+                      result_offset: Optional[int], shape: tuple, first_row: int, sources: List[int],
+                      engine: str, delta: float) -> None:
+    """
+    Виконується в дочірньому процесі: пише рядки відстаней безпосередньо в спільну матрицю.
+
+    Args:
+        graph_storage (str): Ім'я сегмента з масивами CSR (див. _csr_views).
+        num_vertices (int): Кількість вершин графа.
+        num_edges (int): Кількість ребер графа.
+        result_storage (str): Сегмент або файл матриці відстаней (див. _shared_matrix).
+        result_offset (Optional[int]): Зсув матриці у файлі; None для сегмента.
+        shape (tuple): Форма матриці відстаней.
+        first_row (int): Рядок матриці для першого джерела.
+        sources (List[int]): Id джерел, що обробляє цей процес.
+        engine (str): Спосіб обчислення з CSR_ENGINES.
+        delta (float): Ширина кошика для engine="delta".
+    """
+    offsets, targets, weights = _csr_views(shared_memory.SharedMemory(name=graph_storage),
+                                           num_vertices, num_edges)
+    matrix = _shared_matrix(result_storage, result_offset, shape)
+    for row, source in enumerate(sources, first_row):
+        matrix[row] = _csr_distances(offsets, targets, weights, source, engine, delta)
+
+
+def all_pairs(graph: Union[CSRGraph, Dict[str, Dict[str, int]]],
+              sources: Optional[Sequence[Union[str, int]]] = None, workers: int = 1, engine: str = "heap",
+              delta: Optional[float] = None, out: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Матриця найкоротших відстаней від кожного джерела до всіх вершин.
+
+    З workers > 1 масиви CSR копіюються в один сегмент multiprocessing.shared_memory,
+    джерела діляться на блоки (приблизно по чотири на процес), і процеси
+    ProcessPoolExecutor записують свої рядки безпосередньо в матрицю результату:
+    у numpy.memmap, переданий як out, або в новий сегмент спільної пам'яті, який
+    і повертається. Ні граф, ні відстані між процесами не серіалізуються.
+
+    Args:
+        graph (Union[CSRGraph, Dict[str, Dict[str, int]]]): Граф; словник перетворюється
+            через CSRGraph.from_dict, і стовпці йдуть у порядку його names.
+        sources (Optional[Sequence[Union[str, int]]]): Джерела (імена або id); за замовчуванням усі вершини.
+        workers (int): Кількість процесів.
+        engine (str): Спосіб обчислення з CSR_ENGINES.
+        delta (Optional[float]): Ширина кошика для engine="delta".
+        out (Optional[np.ndarray]): Готова матриця float64 форми (джерел, вершин);
+            з workers > 1 - numpy.memmap на весь файл (наприклад, з np.lib.format.open_memmap).
+
+    Returns:
+        np.ndarray: Матриця відстаней (inf для недосяжних вершин).
+
+    Raises:
+        KeyError: Якщо якогось джерела немає в графі.
+        ValueError: Якщо engine невідомий, out має іншу форму чи тип або з workers > 1
+            out не є numpy.memmap.
+    """
+    if isinstance(graph, dict):
+        graph = CSRGraph.from_dict(graph)
+    if engine not in CSR_ENGINES:
+        raise ValueError(f"engine має бути одним з {CSR_ENGINES}")
+    ids = list(range(graph.num_vertices)) if sources is None else [graph.vertex(s) for s in sources]
+    shape = (len(ids), graph.num_vertices)
+    parallel = workers > 1 and len(ids) > 1
+    if out is not None:
+        if out.shape != shape or out.dtype != np.float64:
+            raise ValueError(f"out має бути матрицею float64 форми {shape}")
+        # Процеси можуть відкрити лише весь файл memmap, а не його зріз чи приватний масив
+        if parallel and not (isinstance(out, np.memmap) and isinstance(out.base, mmap.mmap)):
+            raise ValueError("з workers > 1 out має бути numpy.memmap на весь файл")
+    if delta is None:
+        delta = _default_delta(graph.weights)
+
+    if not parallel:
+        if out is None:
+            out = np.empty(shape)
+        for row, source in enumerate(ids):
+            out[row] = _csr_distances(graph.offsets, graph.targets, graph.weights, source, engine, delta)
+        return out
+
+    graph_shm = shared_memory.SharedMemory(create=True, size=max(graph.nbytes, 1))
+    result_shm = None
+    if out is None:
+        result_shm = shared_memory.SharedMemory(create=True, size=max(len(ids) * graph.num_vertices * 8, 1))
+        out = np.ndarray(shape, dtype=np.float64, buffer=result_shm.buf)
+        # Матриця повертається без копії; сегмент закривається разом з її останнім представленням
+        weakref.finalize(out, result_shm.close)
+        result_storage, result_offset = result_shm.name, None
+    else:
+        result_storage, result_offset = out.filename, out.offset
+    try:
+        offsets, targets, weights = _csr_views(graph_shm, graph.num_vertices, graph.num_edges)
+        offsets[...], targets[...], weights[...] = graph.offsets, graph.targets, graph.weights
+        del offsets, targets, weights
+        bounds = np.linspace(0, len(ids), min(len(ids), 4 * workers) + 1).astype(int).tolist()
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(_all_pairs_shared, graph_shm.name, graph.num_vertices, graph.num_edges,
+                                   result_storage, result_offset, shape, start, ids[start:end], engine, delta)
+                       for start, end in zip(bounds, bounds[1:])]
+            for future in futures:
+                future.result()
+    finally:
+        # Імена сегментів більше не потрібні; відображена пам'ять живе до їх закриття
+        graph_shm.unlink()
+        if result_shm is not None:
+            result_shm.unlink()
+    return out
+
+
+def benchmark_csr(sizes: tuple = ((10_000, 100_000), (100_000, 1_000_000)), repeats: int = 3) -> None:
+    """
+    Порівнює dijkstra на словниках із dijkstra_csr на випадкових графах.
+
+    Args:
+        sizes (tuple): Пари (вершин, ребер).
+        repeats (int): Кількість повторів.
+    """
+    print(f"{'Вершин':>8} | {'Ребер':>9} | {'CSR, МБ':>8} | {'dict, с':>8} | "
+          + " | ".join(f"{engine + ', с':>9}" for engine in CSR_ENGINES))
+    for num_vertices, num_edges in sizes:
+        csr = random_csr_graph(num_vertices, num_edges, seed=0)
+        graph = csr.to_dict()
+        baseline = min(timeit.repeat(lambda: dijkstra(graph, "0"), number=1, repeat=repeats))
+        times = [min(timeit.repeat(lambda: dijkstra_csr(csr, 0, engine=engine), number=1, repeat=repeats))
+                 for engine in CSR_ENGINES]
+        print(f"{num_vertices:>8} | {num_edges:>9} | {csr.nbytes / 2 ** 20:>8.1f} | {baseline:>8.3f} | "
+              + " | ".join(f"{elapsed:>9.3f}" for elapsed in times))
+
+
+def benchmark_queues(graphs: tuple = (("розріджений", 100_000, 400_000), ("щільний", 1_000, 500_000)),
+                     arities: tuple = (2, 4), repeats: int = 3) -> None:
+    """
+    Порівнює ліниву купу heapq з IndexedHeap за часом і найбільшим розміром черги.
+
+    Args:
+        graphs (tuple): Трійки (назва, вершин, ребер) випадкових графів.
+        arities (tuple): Арності IndexedHeap.
+        repeats (int): Кількість повторів.
+    """
+    variants = [("lazy", 2)] + [("indexed", arity) for arity in arities]
+    print(f"{'Граф':>12} | {'Вершин':>7} | {'Ребер':>7} | {'Черга':>10} | {'Час, с':>7} | {'Пік черги':>9}")
+    for name, num_vertices, num_edges in graphs:
+        graph = random_csr_graph(num_vertices, num_edges, seed=0).to_dict()
+        edges = sum(len(neighbors) for neighbors in graph.values())
+        for queue, arity in variants:
+            stats: Dict[str, int] = {}
+            elapsed = min(timeit.repeat(lambda: dijkstra(graph, "0", queue, arity, stats),
+                                        number=1, repeat=repeats))
+            label = queue if queue == "lazy" else f"{queue}-{arity}"
+            print(f"{name:>12} | {num_vertices:>7} | {edges:>7} | {label:>10} | {elapsed:>7.3f} | "
+                  f"{stats['peak_queue']:>9}")
+
+
+def benchmark_all_pairs(num_vertices: int = 20_000, num_edges: int = 100_000, sources: int = 64,
+                        workers: tuple = (1, 2, 4, 8), engine: str = "heap") -> None:
+    """
+    Вимірює масштабування all_pairs з кількістю процесів; базова лінія -
+    послідовні виклики dijkstra на словнику для тих самих джерел.
+
+    Args:
+        num_vertices (int): Кількість вершин випадкового графа.
+        num_edges (int): Кількість ребер.
+        sources (int): Кількість джерел (рядків матриці).
+        workers (tuple): Кількості процесів.
+        engine (str): Спосіб обчислення з CSR_ENGINES.
+    """
+    csr = random_csr_graph(num_vertices, num_edges, seed=0)
+    graph = csr.to_dict()
+    names = csr.names[:sources]
+    baseline = timeit.timeit(lambda: [dijkstra(graph, name) for name in names], number=1)
+    print(f"dijkstra на словнику, {len(names)} джерел: {baseline:.2f} с")
+    print(f"Ядер: {os.cpu_count()}")
+    print(f"{'Процесів':>9} | {'Час, с':>8} | {'Прискорення':>11}")
+    for count in workers:
+        elapsed = timeit.timeit(lambda: all_pairs(csr, names, workers=count, engine=engine), number=1)
+        print(f"{count:>9} | {elapsed:>8.3f} | {baseline / elapsed:>10.1f}x")
+
+
 def test():
     """
     Головна функція для демонстрації роботи алгоритму Дейкстри.
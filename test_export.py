@@ -0,0 +1,101 @@
+import os
+import tempfile
+import unittest
+import xml.etree.ElementTree as ElementTree
+import numpy as np
+from export import (load_npy, load_npz, save_npy, save_npz, save_segments_svg, save_squares_svg,
+                    save_text)
+
+SVG = "{http://www.w3.org/2000/svg}"
+
+class TestExport(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.segments = np.array([[[0, 0], [1, 2]], [[1, 2], [-1, 3]], [[1, 2], [2.5, 3]]])
+        self.tree = np.array([[0.0, -1.0, 0.0, 1.0, 0.0],
+                              [0.0, 0.0, np.pi / 4, 0.5, 1.0],
+                              [0.5, 0.5, 0.0, 0.5, 1.0]])
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def path(self, name):
+        return os.path.join(self.tmp.name, name)
+
+    def test_segments_svg_in_chunks(self):
+        save_segments_svg(self.segments, self.path("tree.svg"), chunk_size=2, precision=1)
+        root = ElementTree.parse(self.path("tree.svg")).getroot()
+        paths = root.findall(f".//{SVG}path")
+        self.assertEqual(len(paths), 2)
+        self.assertEqual(paths[0].get("d"), "M0.0 0.0L1.0 2.0M1.0 2.0L-1.0 3.0")
+        # viewBox covers the mirrored scene: y in [-3, 0] before the margin
+        xmin, ymin, width, height = map(float, root.get("viewBox").split())
+        self.assertLess(xmin, -1)
+        self.assertLess(ymin, -3)
+        self.assertGreater(width, 3.5)
+
+    def test_segments_svg_stream_requires_bounds(self):
+        with self.assertRaises(ValueError):
+            save_segments_svg(iter([self.segments]), self.path("tree.svg"))
+        save_segments_svg(iter([self.segments[:1], self.segments[1:]]), self.path("tree.svg"),
+                          bounds=(-1, 0, 2.5, 3))
+        self.assertEqual(len(ElementTree.parse(self.path("tree.svg")).findall(f".//{SVG}path")), 2)
+
+    def test_squares_svg_groups_levels(self):
+        save_squares_svg(self.tree, self.path("tree.svg"), precision=2)
+        paths = ElementTree.parse(self.path("tree.svg")).findall(f".//{SVG}path")
+        self.assertEqual(len(paths), 2)
+        self.assertNotEqual(paths[0].get("fill"), paths[1].get("fill"))
+        self.assertEqual(paths[0].get("d"), "M0.00 -1.00L1.00 -1.00L1.00 0.00L0.00 0.00Z")
+        self.assertEqual(paths[1].get("d").count("Z"), 2)
+
+    def test_text_matches_loadtxt(self):
+        save_text(self.segments, self.path("tree.csv"), delimiter=",",
+                  header=("x0", "y0", "x1", "y1"), chunk_size=2)
+        with open(self.path("tree.csv")) as file:
+            self.assertEqual(file.readline().strip(), "x0,y0,x1,y1")
+        np.testing.assert_allclose(np.loadtxt(self.path("tree.csv"), delimiter=",", skiprows=1),
+                                   self.segments.reshape(-1, 4))
+
+    def test_text_structured_tree(self):
+        tree = np.zeros(2, dtype=[('x', 'f4'), ('y', 'f4'), ('angle', 'f4'), ('size', 'f4'),
+                                  ('level', 'u1')])
+        tree['level'] = [0, 1]
+        tree['size'] = [1.0, 0.5]
+        save_text(tree, self.path("tree.txt"))
+        np.testing.assert_allclose(np.loadtxt(self.path("tree.txt")),
+                                   [[0, 0, 0, 1, 0], [0, 0, 0, 0.5, 1]])
+
+    def test_npy_roundtrip_with_memmap(self):
+        save_npy(self.segments, self.path("tree.npy"))
+        loaded = load_npy(self.path("tree.npy"))
+        self.assertIsInstance(loaded, np.memmap)
+        np.testing.assert_array_equal(loaded, self.segments)
+        del loaded
+
+    def test_npy_stream(self):
+        chunks = iter([self.segments[:2], self.segments[2:]])
+        save_npy(chunks, self.path("tree.npy"), count=3)
+        np.testing.assert_array_equal(load_npy(self.path("tree.npy"), mmap=False), self.segments)
+        with self.assertRaises(ValueError):
+            save_npy(iter([self.segments]), self.path("other.npy"))
+        with self.assertRaises(ValueError):
+            save_npy(iter([self.segments]), self.path("other.npy"), count=2)
+
+    def test_npz_memmap_and_compressed(self):
+        save_npz(self.path("tree.npz"), segments=self.segments, tree=self.tree, level=np.array(2))
+        loaded = load_npz(self.path("tree.npz"))
+        self.assertIsInstance(loaded["segments"], np.memmap)
+        np.testing.assert_array_equal(loaded["segments"], self.segments)
+        np.testing.assert_array_equal(loaded["tree"], self.tree)
+        self.assertEqual(int(loaded["level"]), 2)
+        del loaded
+
+        save_npz(self.path("packed.npz"), compressed=True, tree=self.tree)
+        loaded = load_npz(self.path("packed.npz"))
+        self.assertNotIsInstance(loaded["tree"], np.memmap)
+        np.testing.assert_array_equal(loaded["tree"], self.tree)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,106 @@
+import os
+import tempfile
+import unittest
+import numpy as np
+from matplotlib.image import imread
+from raster import (circles_intersect_box, pixel_size, render_segments, render_squares, save_png,
+                    segments_bounds, square_corners, tree_columns)
+
+class TestRaster(unittest.TestCase):
+
+    def test_segments_bounds(self):
+        segments = np.array([[[0, 0], [1, 2]], [[-3, 1], [0, 5]]], dtype=float)
+        self.assertEqual(segments_bounds(segments), (-3.0, 0.0, 1.0, 5.0))
+
+    def test_square_corners(self):
+        # Unit square rotated by 90 degrees around its origin corner
+        corners = square_corners(np.array([[0.0, 0.0, np.pi / 2, 1.0, 0.0]]))
+        np.testing.assert_allclose(corners[0], [[0, 0], [0, 1], [-1, 1], [-1, 0]], atol=1e-12)
+
+    def test_tree_columns_structured(self):
+        matrix = np.array([[0.0, 0.0, np.pi / 2, 1.0, 0.0], [1.0, 2.0, 0.0, 0.5, 1.0]])
+        structured = np.zeros(2, dtype=[('x', 'f4'), ('y', 'f4'), ('angle', 'f4'),
+                                        ('size', 'f4'), ('level', 'u1')])
+        for column, name in zip(tree_columns(matrix), ('x', 'y', 'angle', 'size', 'level')):
+            structured[name] = column
+        for a, b in zip(tree_columns(matrix), tree_columns(structured)):
+            np.testing.assert_allclose(a, b, atol=1e-6)
+        np.testing.assert_allclose(square_corners(structured), square_corners(matrix), atol=1e-6)
+
+    def test_render_squares_max_level_colors_slices_consistently(self):
+        pt_array = np.array([[0.0, 0.0, 0.0, 1.0, 0.0], [0.0, 0.0, 0.0, 1.0, 3.0]])
+        whole = render_squares(pt_array[1:], width=8, height=8, margin=0, max_level=7)
+        alone = render_squares(pt_array[1:], width=8, height=8, margin=0)
+        self.assertFalse(np.allclose(whole, alone))
+
+    def test_render_segments_draws_line(self):
+        segments = np.array([[[0, 0], [10, 0]], [[0, 0], [0, 10]]], dtype=float)
+        image = render_segments(segments, width=20, height=20, color=(1, 0, 0), margin=0)
+        self.assertEqual(image.shape, (20, 20, 3))
+        red = np.all(image == (1, 0, 0), axis=2)
+        # Horizontal line at the bottom row and vertical line at the left column
+        self.assertTrue(red[-1].all())
+        self.assertTrue(red[:, 0].all())
+        self.assertFalse(red[5, 5])
+
+    def test_render_segments_empty(self):
+        image = render_segments(np.empty((0, 2, 2)), width=4, height=3)
+        np.testing.assert_array_equal(image, np.ones((3, 4, 3)))
+
+    def test_render_squares_fills_area(self):
+        # Square of size 1 occupying the left half of a 2x1 scene
+        pt_array = np.array([[0.0, 0.0, 0.0, 1.0, 0.0]])
+        image = render_squares(pt_array, width=20, height=10, margin=0, bounds=(0, 0, 2, 1))
+        filled = ~np.all(image == 1.0, axis=2)
+        self.assertTrue(filled[:, :10].all())
+        self.assertFalse(filled[:, 10:].any())
+
+    def test_pixel_size_and_circles(self):
+        self.assertAlmostEqual(pixel_size((0, 0, 10, 5), 100, 100, margin=0), 0.1)
+        mask = circles_intersect_box(np.array([0.5, 3.0, 2.0]), np.array([0.5, 0.5, 2.0]),
+                                     np.array([0.1, 1.5, 1.5]), (0, 0, 1, 1))
+        np.testing.assert_array_equal(mask, [True, False, True])
+
+    def test_zoomed_view_is_clipped(self):
+        # Shapes hundreds of thousands of pixels across must be clipped to the frame
+        segments = np.array([[[-1e6, 0.5], [1e6, 0.5]]])
+        image = render_segments(segments, width=16, height=16, color=(0, 0, 0),
+                                bounds=(0, 0, 1, 1), margin=0)
+        self.assertTrue((image[8] == 0).all())
+        self.assertEqual(int((image == 0).all(axis=2).sum()), 16)
+        square = np.array([[-1e5, -1e5, 0.0, 3e5, 0.0]])
+        image = render_squares(square, width=16, height=16, bounds=(0, 0, 1, 1), margin=0)
+        self.assertFalse(np.all(image == 1.0, axis=2).any())
+
+    def test_reused_canvas(self):
+        segments = np.array([[[0, 0], [10, 0]]], dtype=float)
+        canvas = np.zeros((8, 8, 3))
+        image = render_segments(segments, width=8, height=8, margin=0, out=canvas)
+        self.assertIs(image, canvas)
+        # The buffer is cleared to the background before drawing the next variant
+        again = render_squares(np.array([[0.0, 0.0, 0.0, 1.0, 0.0]]), width=8, height=8,
+                               bounds=(0, 0, 4, 4), margin=0, out=canvas)
+        self.assertTrue(np.all(again[:4] == 1.0))
+        with self.assertRaises(ValueError):
+            render_segments(segments, width=8, height=8, antialias=2, out=canvas)
+
+    def test_antialias(self):
+        segments = np.array([[[0, 0], [10, 10]]], dtype=float)
+        plain = render_segments(segments, width=16, height=16, color=(0, 0, 0))
+        smooth = render_segments(segments, width=16, height=16, color=(0, 0, 0), antialias=4)
+        self.assertEqual(smooth.shape, plain.shape)
+        # Supersampling produces intermediate grey levels
+        self.assertTrue(((smooth > 0) & (smooth < 1)).any())
+        self.assertFalse(((plain > 0) & (plain < 1)).any())
+        with self.assertRaises(ValueError):
+            render_segments(segments, antialias=0)
+
+    def test_save_png(self):
+        image = np.zeros((5, 7, 3))
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "out.png")
+            save_png(image, path)
+            self.assertEqual(imread(path).shape[:2], (5, 7))
+
+if __name__ == '__main__':
+    unittest.main()
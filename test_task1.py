@@ -1,10 +1,19 @@
 import unittest
-from task1 import LinkedList, Node
+import random
+import threading
+from unittest.mock import patch
+from task1 import ConcurrentLinkedList, DoublyLinkedList, LinkedList, Node, SortedLinkedList, merge_many
 
 class TestLinkedList(unittest.TestCase):
     def setUp(self):
         self.ll = LinkedList()
 
+    def test_node_has_no_dict(self):
+        node = Node(1)
+        self.assertFalse(hasattr(node, "__dict__"))
+        with self.assertRaises(AttributeError):
+            node.extra = 2
+
     def test_add_first(self):
         self.ll.add_first(1)
         self.assertEqual(self.ll.head.data, 1)
@@ -102,6 +111,66 @@ class TestLinkedList(unittest.TestCase):
         current = current.next
         self.assertEqual(current.data, 4)
 
+    def to_list(self, llist):
+        result = []
+        current = llist.head
+        while current:
+            result.append(current.data)
+            current = current.next
+        return result
+
+    def test_sort_methods_match_sorted(self):
+        rng = random.Random(42)
+        for method in ("merge", "insertion", "natural"):
+            for n in [0, 1, 2, 3, 7, 16, 33, 100]:
+                values = [rng.randint(0, 20) for _ in range(n)]
+                for reverse in (False, True):
+                    llist = LinkedList()
+                    for value in values:
+                        llist.add_last(value)
+                    llist.sort(reverse=reverse, method=method)
+                    self.assertEqual(self.to_list(llist), sorted(values, reverse=reverse))
+                    self.assert_tail_and_size(llist)
+
+    def test_sort_is_stable_with_key(self):
+        rng = random.Random(7)
+        records = [(rng.randint(0, 5), i) for i in range(200)]
+        for method in ("merge", "insertion", "natural"):
+            for reverse in (False, True):
+                llist = LinkedList()
+                for record in records:
+                    llist.add_last(record)
+                llist.sort(key=lambda r: r[0], reverse=reverse, method=method)
+                expected = sorted(records, key=lambda r: r[0], reverse=reverse)
+                self.assertEqual(self.to_list(llist), expected)
+
+    def test_sort_relinks_existing_nodes(self):
+        for value in [5, 3, 9, 1, 7]:
+            self.ll.add_last(value)
+        nodes = set()
+        current = self.ll.head
+        while current:
+            nodes.add(id(current))
+            current = current.next
+        self.ll.sort()
+        current = self.ll.head
+        while current:
+            self.assertIn(id(current), nodes)
+            current = current.next
+
+    def test_sort_natural_runs(self):
+        # Ascending and strictly descending runs
+        values = [1, 2, 3, 9, 8, 7, 4, 5, 6, 0]
+        for value in values:
+            self.ll.add_last(value)
+        self.ll.sort(method="natural")
+        self.assertEqual(self.to_list(self.ll), sorted(values))
+        self.assertEqual(self.ll.tail.data, 9)
+
+    def test_sort_invalid_method(self):
+        with self.assertRaises(ValueError):
+            self.ll.sort(method="bubble")
+
     def test_merge_with(self):
         list1 = LinkedList()
         list1.add_last(1)
@@ -121,5 +190,602 @@ class TestLinkedList(unittest.TestCase):
             current = current.next
         self.assertIsNone(current)
 
+    def assert_tail_and_size(self, llist):
+        """Walks the chain and checks that tail and size match it."""
+        count = 0
+        last = None
+        current = llist.head
+        while current:
+            last = current
+            count += 1
+            current = current.next
+        self.assertIs(llist.tail, last)
+        self.assertEqual(llist.size, count)
+
+    def test_tail_and_size_tracking(self):
+        self.assert_tail_and_size(self.ll)
+        self.ll.add_first(2)
+        self.assert_tail_and_size(self.ll)
+        self.ll.add_last(5)
+        self.ll.add_first(1)
+        self.assert_tail_and_size(self.ll)
+
+        self.ll.add_after(self.ll.tail, 7)
+        self.assertEqual(self.ll.tail.data, 7)
+        self.assert_tail_and_size(self.ll)
+
+        self.ll.delete_node(7)
+        self.assertEqual(self.ll.tail.data, 5)
+        self.assert_tail_and_size(self.ll)
+
+        self.ll.reverse()
+        self.assertEqual(self.ll.tail.data, 1)
+        self.assert_tail_and_size(self.ll)
+
+        self.ll.sort()
+        self.assertEqual(self.ll.tail.data, 5)
+        self.assert_tail_and_size(self.ll)
+
+        self.ll.sorted_insert(9)
+        self.assertEqual(self.ll.tail.data, 9)
+        self.assert_tail_and_size(self.ll)
+
+        for value in [9, 5, 2, 1]:
+            self.ll.delete_node(value)
+            self.assert_tail_and_size(self.ll)
+        self.assertIsNone(self.ll.head)
+
+        self.ll.sorted_insert(4)
+        self.assert_tail_and_size(self.ll)
+
+    def test_merge_with_tail_and_size(self):
+        list1 = LinkedList()
+        list2 = LinkedList()
+        merged = list1.merge_with(list2)
+        self.assert_tail_and_size(merged)
+
+        list1.add_last(1)
+        list2.add_last(2)
+        list2.add_last(3)
+        merged = list1.merge_with(list2)
+        self.assertEqual(merged.tail.data, 3)
+        self.assert_tail_and_size(merged)
+
+    def make_list(self, values):
+        llist = LinkedList()
+        for value in values:
+            llist.add_last(value)
+        return llist
+
+    def test_merge_with_in_place(self):
+        list1 = self.make_list([1, 3, 5, 7])
+        list2 = self.make_list([2, 3, 4])
+        nodes = {id(n) for l in (list1, list2) for n in self.iter_nodes(l)}
+
+        merged = list1.merge_with(list2, in_place=True)
+
+        self.assertIs(merged, list1)
+        self.assertEqual(self.to_list(merged), [1, 2, 3, 3, 4, 5, 7])
+        self.assertEqual({id(n) for n in self.iter_nodes(merged)}, nodes)
+        self.assert_tail_and_size(merged)
+        self.assertIsNone(list2.head)
+        self.assert_tail_and_size(list2)
+
+    def test_merge_with_in_place_empty(self):
+        list2 = self.make_list([1, 2])
+        self.ll.merge_with(list2, in_place=True)
+        self.assertEqual(self.to_list(self.ll), [1, 2])
+        self.assert_tail_and_size(self.ll)
+
+        self.ll.merge_with(LinkedList(), in_place=True)
+        self.assertEqual(self.to_list(self.ll), [1, 2])
+        self.assert_tail_and_size(self.ll)
+
+        with self.assertRaises(ValueError):
+            self.ll.merge_with(self.ll, in_place=True)
+
+    def iter_nodes(self, llist):
+        current = llist.head
+        while current:
+            yield current
+            current = current.next
+
+    def test_merge_many(self):
+        rng = random.Random(3)
+        sources = [sorted(rng.randint(0, 50) for _ in range(rng.randint(0, 30))) for _ in range(6)]
+        expected = sorted(v for values in sources for v in values)
+
+        lists = [self.make_list(values) for values in sources]
+        merged = merge_many(lists)
+        self.assertEqual(self.to_list(merged), expected)
+        self.assert_tail_and_size(merged)
+        # Source lists are left untouched
+        self.assertEqual([self.to_list(l) for l in lists], sources)
+
+        merged = merge_many(lists, in_place=True)
+        self.assertEqual(self.to_list(merged), expected)
+        self.assert_tail_and_size(merged)
+        for llist in lists:
+            self.assertIsNone(llist.head)
+            self.assertEqual(llist.size, 0)
+
+    def test_merge_many_stable_and_empty(self):
+        self.assertIsNone(merge_many([]).head)
+        self.assertIsNone(merge_many([LinkedList(), LinkedList()]).head)
+
+        list1 = self.make_list([1, 1])
+        list2 = self.make_list([1])
+        expected = list(self.iter_nodes(list1)) + list(self.iter_nodes(list2))
+        merged = merge_many([list1, list2], in_place=True)
+        self.assertEqual(list(self.iter_nodes(merged)), expected)
+
+    def test_merge_preserves_subclass(self):
+        for cls in (SortedLinkedList, ConcurrentLinkedList, DoublyLinkedList):
+            list1 = cls.from_iterable([1, 4, 6])
+            list2 = cls.from_iterable([2, 4, 5])
+            for merged in (list1.merge_with(list2), merge_many([list1, list2])):
+                self.assertIs(type(merged), cls)
+                self.assertEqual(merged.to_list(), [1, 2, 4, 4, 5, 6])
+                self.assertEqual(len(merged), 6)
+        # The subclass invariants hold on the result: the sorted list accepts sorted_insert
+        merged = merge_many([SortedLinkedList.from_iterable([3]), LinkedList.from_iterable([1, 5])])
+        merged.sorted_insert(2)
+        self.assertEqual(merged.to_list(), [1, 2, 3, 5])
+        self.assertIsNotNone(merged.search_element(5))
+        doubly = DoublyLinkedList.from_iterable([1]).merge_with(LinkedList.from_iterable([0, 2]))
+        self.assertIs(doubly.tail.prev.prev, doubly.head)
+
+    def test_merge_many_keeps_index_and_rejects_repeated_lists(self):
+        list1 = LinkedList.from_iterable([1, 3], indexed=True)
+        list2 = LinkedList.from_iterable([2, 3], indexed=True)
+        merged = merge_many([list1, list2])
+        self.assertTrue(merged.indexed)
+        self.assertIs(merged.search_element(2), merged.head.next)
+        self.assertEqual(merged.indexed, list1.merge_with(list2).indexed)
+        # Splicing the same list twice would lose half of its nodes
+        with self.assertRaises(ValueError):
+            merge_many([list1, list2, list1], in_place=True)
+        self.assertEqual(list1.to_list(), [1, 3])
+        self.assertEqual(list2.to_list(), [2, 3])
+
+    def assert_index_consistent(self, llist):
+        """Checks the index against a linear scan: predecessors, buckets and lookups."""
+        nodes = list(self.iter_nodes(llist))
+        for i, node in enumerate(nodes):
+            self.assertIs(llist._prev[node], nodes[i - 1] if i else None)
+            found = llist.search_element(node.data)
+            self.assertEqual(found.data, node.data)
+            self.assertTrue(any(found is n for n in nodes))
+        self.assertEqual(len(llist._prev), len(nodes))
+        # Every bucket holds exactly the nodes with its value, and lookups return its first node
+        for value, bucket in llist._index.items():
+            self.assertEqual(set(bucket), {n for n in nodes if n.data == value})
+            self.assertIs(llist.search_element(value), next(iter(bucket)))
+
+    def apply_op(self, llist, model, op, value):
+        """Applies op to llist and mirrors it on a Python list, following the nodes it picks."""
+        nodes = list(self.iter_nodes(llist))
+
+        def position(target):
+            return next(i for i, node in enumerate(nodes) if node is target)
+
+        if op == "first":
+            llist.add_first(value)
+            model.insert(0, value)
+        elif op == "last":
+            llist.add_last(value)
+            model.append(value)
+        elif op == "after":
+            target = llist.search_element(value // 2)
+            llist.add_after(target, value)
+            if target is not None:
+                model.insert(position(target) + 1, value)
+        elif op == "delete":
+            target = llist.search_element(value)
+            llist.delete_node(value)
+            if target is not None:
+                del model[position(target)]
+                # delete_node removes exactly the node search_element returned
+                self.assertFalse(any(node is target for node in self.iter_nodes(llist)))
+        elif op == "sorted":
+            llist.sorted_insert(value)
+            model.insert(next((i for i, item in enumerate(model) if item >= value), len(model)), value)
+        elif op == "reverse":
+            llist.reverse()
+            model.reverse()
+        elif op == "sort":
+            llist.sort()
+            model.sort()
+        else:
+            llist.extend([value, value + 1])
+            model.extend([value, value + 1])
+
+    def test_indexed_matches_plain_list(self):
+        rng = random.Random(11)
+        for indexed in (False, True):
+            llist = LinkedList(indexed=indexed)
+            model = []
+            for _ in range(500):
+                op = rng.choice(["first", "last", "after", "delete", "sorted", "reverse", "sort"])
+                self.apply_op(llist, model, op, rng.randint(0, 15))
+                self.assertEqual(self.to_list(llist), model)
+                self.assert_tail_and_size(llist)
+                if indexed:
+                    self.assert_index_consistent(llist)
+
+    def test_index_duplicates(self):
+        llist = LinkedList(indexed=True)
+        for value in [1, 2, 1, 3, 1]:
+            llist.add_last(value)
+        nodes = list(self.iter_nodes(llist))
+        self.assertIs(llist.search_element(1), nodes[0])
+        llist.delete_node(1)
+        self.assertIs(llist.search_element(1), nodes[2])
+        llist.delete_node(1)
+        self.assertIs(llist.search_element(1), nodes[4])
+        llist.delete_node(1)
+        self.assertIsNone(llist.search_element(1))
+        self.assertEqual(self.to_list(llist), [2, 3])
+        self.assert_tail_and_size(llist)
+
+    def test_index_duplicates_inserted_in_middle(self):
+        llist = LinkedList.from_iterable([1, 5, 1, 7, 1], indexed=True)
+        nodes = list(self.iter_nodes(llist))
+        llist.add_after(nodes[0], 1)      # next to an equal predecessor
+        llist.add_after(nodes[1], 1)      # between two other equal nodes
+        llist.add_after(nodes[3], 7)      # before nothing equal
+        self.assertIs(llist.search_element(1), nodes[0])
+        self.assertIs(llist.search_element(7), nodes[3])
+        llist.sorted_insert(1)            # lands in front of every equal node
+        self.assertIs(llist.search_element(1), llist.head)
+        self.assertEqual(self.to_list(llist), [1, 1, 1, 5, 1, 1, 7, 7, 1])
+        self.assert_index_consistent(llist)
+
+    def test_index_duplicate_added_before_equals_is_found_later(self):
+        llist = LinkedList.from_iterable([5, 6, 1], indexed=True)
+        old = llist.tail
+        # Finding out that the new node precedes every equal one would need a scan,
+        # so the index keeps returning the node it already had
+        llist.add_after(llist.head, 1)
+        self.assertIs(llist.search_element(1), old)
+        llist.delete_node(1)
+        self.assertEqual(self.to_list(llist), [5, 1, 6])
+        self.assertIs(llist.search_element(1), llist.head.next)
+        self.assert_index_consistent(llist)
+
+    def test_index_unhashable_payloads(self):
+        llist = LinkedList(indexed=True)
+        llist.add_last([1, 2])
+        llist.add_last(5)
+        llist.add_last([3])
+        self.assertEqual(llist.search_element([3]).data, [3])
+        self.assertEqual(llist.search_element(5).data, 5)
+        llist.delete_node([1, 2])
+        self.assertEqual(self.to_list(llist), [5, [3]])
+        self.assert_index_consistent(llist)
+        llist.delete_node([3])
+        self.assertIs(llist.tail, llist.head)
+        self.assert_index_consistent(llist)
+
+    def test_index_toggle(self):
+        for value in [4, 2, 4]:
+            self.ll.add_last(value)
+        self.assertFalse(self.ll.indexed)
+        self.ll.enable_index()
+        self.assertTrue(self.ll.indexed)
+        self.assert_index_consistent(self.ll)
+        self.ll.disable_index()
+        self.assertFalse(self.ll.indexed)
+        self.assertIsNone(self.ll._index)
+        self.ll.delete_node(4)
+        self.assertEqual(self.to_list(self.ll), [2, 4])
+
+    def test_index_merge(self):
+        list1 = LinkedList(indexed=True)
+        list2 = LinkedList(indexed=True)
+        for value in [1, 3]:
+            list1.add_last(value)
+        for value in [2, 3]:
+            list2.add_last(value)
+        merged = list1.merge_with(list2)
+        self.assertTrue(merged.indexed)
+        self.assert_index_consistent(merged)
+
+        list1.merge_with(list2, in_place=True)
+        self.assert_index_consistent(list1)
+        self.assert_index_consistent(list2)
+        self.assertIsNone(list2.search_element(2))
+
+    def test_from_iterable_and_iteration(self):
+        llist = LinkedList.from_iterable(x * x for x in range(5))
+        self.assertEqual(len(llist), 5)
+        self.assertEqual(list(llist), [0, 1, 4, 9, 16])
+        self.assertEqual(llist.to_list(), [0, 1, 4, 9, 16])
+        self.assertEqual([n.data for n in llist.iter_nodes()], [0, 1, 4, 9, 16])
+        self.assert_tail_and_size(llist)
+
+        empty = LinkedList.from_iterable([])
+        self.assertEqual(len(empty), 0)
+        self.assertEqual(empty.to_list(), [])
+        self.assertIsNone(empty.tail)
+
+    def test_iteration_is_lazy(self):
+        llist = LinkedList.from_iterable(range(3))
+        view = iter(llist)
+        self.assertEqual(next(view), 0)
+        llist.add_last(3)
+        self.assertEqual(list(view), [1, 2, 3])
+
+    def test_extend(self):
+        self.ll.add_last(1)
+        self.ll.extend([2, 3])
+        self.ll.extend(iter([]))
+        self.assertEqual(self.ll.to_list(), [1, 2, 3])
+        self.assert_tail_and_size(self.ll)
+
+        self.ll.extend(self.ll)
+        self.assertEqual(self.ll.to_list(), [1, 2, 3, 1, 2, 3])
+        self.assert_tail_and_size(self.ll)
+
+    def test_extend_indexed(self):
+        llist = LinkedList.from_iterable([3, 1, 3], indexed=True)
+        llist.extend([1, 2])
+        self.assert_index_consistent(llist)
+        llist.delete_node(3)
+        llist.delete_node(3)
+        self.assertEqual(llist.to_list(), [1, 1, 2])
+        self.assert_tail_and_size(llist)
+
+    def test_display(self):
+        llist = LinkedList.from_iterable([1, 2])
+        with patch('builtins.print') as mock_print:
+            llist.display()
+        mock_print.assert_called_with("1 -> 2 -> None")
+
+    def assert_skip_list_valid(self, slist):
+        """Checks ordering, tail/size and that every express lane skips forward correctly."""
+        values = slist.to_list()
+        self.assertEqual(values, sorted(values))
+        self.assert_tail_and_size(slist)
+        nodes = list(slist.iter_nodes())
+        for level in range(slist._level - 1):
+            expected = [n for n in nodes if len(n.forward) > level]
+            lane = []
+            node = slist._header.forward[level]
+            while node is not None:
+                lane.append(node)
+                node = node.forward[level]
+            self.assertEqual(lane, expected)
+
+    def test_sorted_linked_list_random_ops(self):
+        rng = random.Random(5)
+        slist = SortedLinkedList()
+        reference = []
+        for _ in range(2000):
+            value = rng.randint(0, 100)
+            if rng.random() < 0.6:
+                slist.sorted_insert(value)
+                reference.append(value)
+                reference.sort()
+            else:
+                slist.delete_node(value)
+                if value in reference:
+                    reference.remove(value)
+            self.assertEqual(len(slist), len(reference))
+        self.assertEqual(slist.to_list(), reference)
+        self.assert_skip_list_valid(slist)
+
+    def test_sorted_linked_list_search_first_duplicate(self):
+        slist = SortedLinkedList.from_iterable([5, 1, 3, 3, 9])
+        self.assertEqual(slist.to_list(), [1, 3, 3, 5, 9])
+        node = slist.search_element(3)
+        self.assertIs(node, slist.head.next)
+        self.assertIsNone(slist.search_element(4))
+        self.assertIsNone(slist.search_element(100))
+
+        slist.delete_node(9)
+        self.assertEqual(slist.tail.data, 5)
+        for value in [1, 3, 3, 5]:
+            slist.delete_node(value)
+        self.assertIsNone(slist.head)
+        self.assertIsNone(slist.tail)
+        self.assertEqual(slist._level, 1)
+
+    def test_sorted_linked_list_irange(self):
+        slist = SortedLinkedList.from_iterable(range(0, 100, 5))
+        self.assertEqual(list(slist.irange(12, 30)), [15, 20, 25, 30])
+        self.assertEqual(list(slist.irange(-10, 0)), [0])
+        self.assertEqual(list(slist.irange(96, 200)), [])
+
+    def test_sorted_linked_list_indexed(self):
+        slist = SortedLinkedList.from_iterable([4, 2, 4, 1], indexed=True)
+        self.assert_index_consistent(slist)
+        slist.delete_node(4)
+        slist.sorted_insert(0)
+        self.assert_index_consistent(slist)
+        self.assert_skip_list_valid(slist)
+
+    def test_sorted_linked_list_unsupported(self):
+        slist = SortedLinkedList.from_iterable([2, 1])
+        with self.assertRaisesRegex(TypeError, "add_first"):
+            slist.add_first(0)
+        with self.assertRaisesRegex(TypeError, "add_last"):
+            slist.add_last(0)
+        with self.assertRaisesRegex(TypeError, "add_after"):
+            slist.add_after(slist.head, 0)
+        with self.assertRaisesRegex(TypeError, "reverse"):
+            slist.reverse()
+        with self.assertRaises(TypeError):
+            slist.sort(reverse=True)
+        with self.assertRaises(TypeError):
+            slist.merge_with(LinkedList(), in_place=True)
+        # Rejected operations leave the list untouched
+        self.assertEqual(slist.to_list(), [1, 2])
+        slist.sort()
+        self.assertEqual(slist.merge_with(LinkedList.from_iterable([0])).to_list(), [0, 1, 2])
+
+    def test_concurrent_producers_consumers(self):
+        llist = ConcurrentLinkedList()
+        producers, per_producer = 4, 5000
+        received = [[] for _ in range(3)]
+        done = threading.Event()
+
+        def produce(pid):
+            for i in range(per_producer):
+                llist.add_last((pid, i))
+
+        def consume(slot):
+            while True:
+                try:
+                    received[slot].append(llist.pop_first())
+                except IndexError:
+                    if done.is_set() and len(llist) == 0:
+                        return
+
+        consumers = [threading.Thread(target=consume, args=(i,)) for i in range(3)]
+        workers = [threading.Thread(target=produce, args=(p,)) for p in range(producers)]
+        for thread in consumers + workers:
+            thread.start()
+        for thread in workers:
+            thread.join()
+        done.set()
+        for thread in consumers:
+            thread.join()
+
+        items = [item for chunk in received for item in chunk]
+        self.assertEqual(len(items), producers * per_producer)
+        self.assertEqual(set(items), {(p, i) for p in range(producers) for i in range(per_producer)})
+        # Each consumer sees every producer's items in FIFO order
+        for chunk in received:
+            for pid in range(producers):
+                seq = [i for p, i in chunk if p == pid]
+                self.assertEqual(seq, sorted(seq))
+        self.assertIsNone(llist.head)
+        self.assertIsNone(llist.tail)
+        self.assertEqual(llist.size, 0)
+
+    def test_concurrent_snapshots_are_consistent(self):
+        llist = ConcurrentLinkedList()
+        stop = threading.Event()
+
+        def produce():
+            for i in range(20000):
+                llist.add_last(i)
+            stop.set()
+
+        def consume():
+            while not stop.is_set():
+                try:
+                    llist.pop_first()
+                except IndexError:
+                    pass
+
+        threads = [threading.Thread(target=produce), threading.Thread(target=consume)]
+        for thread in threads:
+            thread.start()
+        while not stop.is_set():
+            snapshot = list(llist)
+            # A consistent snapshot is always a run of consecutive integers
+            self.assertEqual(snapshot, list(range(snapshot[0], snapshot[0] + len(snapshot))) if snapshot else [])
+        for thread in threads:
+            thread.join()
+        self.assert_tail_and_size(llist)
+
+    def test_concurrent_structural_ops_with_appends(self):
+        llist = ConcurrentLinkedList.from_iterable(range(-100, 0))
+
+        def produce():
+            for i in range(3000):
+                llist.add_last(i)
+
+        def mutate():
+            for _ in range(50):
+                llist.reverse()
+                llist.sort()
+                llist.delete_node(-50)
+
+        threads = [threading.Thread(target=produce) for _ in range(2)]
+        threads.append(threading.Thread(target=mutate))
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(len(llist.to_list()), 100 + 6000 - 1)
+        self.assertNotIn(-50, llist.to_list())
+        self.assert_tail_and_size(llist)
+
+    def test_concurrent_pop_first_empty_and_indexed(self):
+        llist = ConcurrentLinkedList(indexed=True)
+        with self.assertRaises(IndexError):
+            llist.pop_first()
+        llist.extend([1, 2, 1])
+        self.assertEqual(llist.pop_first(), 1)
+        self.assert_index_consistent(llist)
+        self.assertEqual(llist.search_element(1), llist.tail)
+        merged = llist.merge_with(ConcurrentLinkedList.from_iterable([0, 5]), in_place=True)
+        self.assertEqual(merged.to_list(), [0, 2, 1, 5])
+        self.assert_index_consistent(llist)
+
+    def assert_prev_links(self, dlist):
+        prev = None
+        for node in dlist.iter_nodes():
+            self.assertIs(node.prev, prev)
+            prev = node
+        self.assertIs(dlist.tail, prev)
+        self.assert_tail_and_size(dlist)
+
+    def test_doubly_linked_matches_plain_list(self):
+        rng = random.Random(21)
+        for indexed in (False, True):
+            dlist = DoublyLinkedList(indexed=indexed)
+            model = []
+            for _ in range(400):
+                op = rng.choice(["first", "last", "after", "delete", "sorted", "reverse", "sort", "extend"])
+                self.apply_op(dlist, model, op, rng.randint(0, 15))
+                self.assertEqual(dlist.to_list(), model)
+                self.assert_prev_links(dlist)
+                if indexed:
+                    self.assert_index_consistent(dlist)
+
+    def test_doubly_linked_pop_both_ends(self):
+        dlist = DoublyLinkedList.from_iterable([1, 2, 3])
+        self.assertEqual(dlist.pop_first(), 1)
+        self.assertEqual(dlist.pop_last(), 3)
+        self.assert_prev_links(dlist)
+        self.assertEqual(dlist.pop_last(), 2)
+        self.assertIsNone(dlist.head)
+        self.assertIsNone(dlist.tail)
+        with self.assertRaises(IndexError):
+            dlist.pop_first()
+        with self.assertRaises(IndexError):
+            dlist.pop_last()
+
+    def test_doubly_linked_remove_and_move_to_front(self):
+        dlist = DoublyLinkedList.from_iterable([1, 2, 3, 4], indexed=True)
+        nodes = list(dlist.iter_nodes())
+        dlist.remove_node(nodes[1])
+        self.assertEqual(dlist.to_list(), [1, 3, 4])
+        dlist.move_to_front(nodes[3])
+        self.assertEqual(dlist.to_list(), [4, 1, 3])
+        self.assert_prev_links(dlist)
+        self.assert_index_consistent(dlist)
+        dlist.move_to_front(nodes[3])
+        self.assertEqual(dlist.to_list(), [4, 1, 3])
+
+    def test_doubly_linked_merge(self):
+        list1 = DoublyLinkedList.from_iterable([1, 4])
+        list2 = DoublyLinkedList.from_iterable([2, 3, 5])
+        merged = list1.merge_with(list2)
+        self.assertIsInstance(merged, DoublyLinkedList)
+        self.assertEqual(merged.to_list(), [1, 2, 3, 4, 5])
+        self.assert_prev_links(merged)
+
+        list1.merge_with(list2, in_place=True)
+        self.assertEqual(list1.to_list(), [1, 2, 3, 4, 5])
+        self.assert_prev_links(list1)
+        self.assertEqual(len(list2), 0)
+        with self.assertRaises(TypeError):
+            list1.merge_with(LinkedList(), in_place=True)
+
 if __name__ == '__main__':
     unittest.main()
@@ -1,7 +1,15 @@
 import unittest
 from unittest.mock import patch, MagicMock
+import gc
 import math
-from task2a import get_tree_segments, draw_tree, main
+import os
+import tempfile
+import numpy as np
+from matplotlib.image import imread
+from task2a import (get_tree_segments, get_tree_segments_vectorized, iter_tree_segments,
+                    get_tree_segments_lod, draw_tree, draw_tree_streaming, export_tree,
+                    render_sweep, save_tree_png, save_tree_view_png, tree_bounds, main)
+import raster
 
 class TestPythagorasTree(unittest.TestCase):
     
@@ -43,6 +51,204 @@ class TestPythagorasTree(unittest.TestCase):
         self.assertEqual(root_end, left_branch_start)
         self.assertEqual(root_end, right_branch_start)
 
+    def test_vectorized_matches_recursive(self):
+        """Vectorised generator yields the same segments (level order instead of DFS)."""
+        for level in range(0, 8):
+            expected = np.array(get_tree_segments(1, 2, 80, 50, level), dtype=float).reshape(-1, 2, 2)
+            segments = get_tree_segments_vectorized(1, 2, 80, 50, level)
+            self.assertEqual(segments.shape, (2 ** level - 1, 2, 2) if level else (0, 2, 2))
+            self.assertTrue(segments.flags['C_CONTIGUOUS'])
+            # Compare as sorted sets of rows
+            key = lambda arr: arr.reshape(-1, 4)[np.lexsort(arr.reshape(-1, 4).round(6).T)]
+            np.testing.assert_allclose(key(segments), key(expected), atol=1e-9)
+
+    def test_vectorized_level_order(self):
+        segments = get_tree_segments_vectorized(0, 0, 90, 100, 2)
+        np.testing.assert_allclose(segments[0], [[0, 0], [0, 100]], atol=1e-9)
+        # Left child (angle + ANGLE) comes before the right one
+        self.assertLess(segments[1, 1, 0], segments[2, 1, 0])
+        np.testing.assert_allclose(segments[1, 0], segments[0, 1])
+
+    def test_iter_tree_segments_chunks(self):
+        """Chunks are bounded and together contain every segment exactly once."""
+        expected = get_tree_segments_vectorized(0, 0, 90, 100, 9)
+        key = lambda arr: arr.reshape(-1, 4)[np.lexsort(arr.reshape(-1, 4).round(6).T)]
+        for chunk_size in [1, 2, 7, 31, 100, 10000]:
+            chunks = list(iter_tree_segments(0, 0, 90, 100, 9, chunk_size=chunk_size))
+            self.assertTrue(all(len(chunk) <= chunk_size for chunk in chunks))
+            segments = np.concatenate(chunks)
+            self.assertEqual(len(segments), len(expected))
+            np.testing.assert_allclose(key(segments), key(expected), atol=1e-9)
+
+    def test_iter_tree_segments_edge_cases(self):
+        self.assertEqual(list(iter_tree_segments(0, 0, 90, 100, 0)), [])
+        with self.assertRaises(ValueError):
+            list(iter_tree_segments(0, 0, 90, 100, 3, chunk_size=0))
+
+    def test_engines_match_direct(self):
+        for level in (1, 2, 5, 10):
+            expected = get_tree_segments_vectorized(3, -2, 70, 50, level)
+            for engine in ("table", "template"):
+                np.testing.assert_allclose(
+                    get_tree_segments_vectorized(3, -2, 70, 50, level, engine=engine),
+                    expected, atol=1e-9)
+        self.assertEqual(get_tree_segments_vectorized(0, 0, 90, 100, 0, engine="template").shape,
+                         (0, 2, 2))
+        with self.assertRaises(ValueError):
+            get_tree_segments_vectorized(0, 0, 90, 100, 3, engine="cached")
+
+    def test_per_call_branch_parameters(self):
+        recursive = np.array(get_tree_segments(0, 0, 90, 100, 6, branch_angle=30, scale=0.6))
+        default = get_tree_segments_vectorized(0, 0, 90, 100, 6)
+        self.assertFalse(np.allclose(recursive, get_tree_segments(0, 0, 90, 100, 6)))
+        for engine in ("direct", "table", "template"):
+            segments = get_tree_segments_vectorized(0, 0, 90, 100, 6, engine=engine,
+                                                    branch_angle=30, scale=0.6)
+            # Same set of segments as the recursive version, in level order
+            np.testing.assert_allclose(np.sort(segments.reshape(-1, 4), axis=0),
+                                       np.sort(recursive.reshape(-1, 4), axis=0), atol=1e-9)
+        chunks = np.concatenate(list(iter_tree_segments(0, 0, 90, 100, 6, chunk_size=7,
+                                                        branch_angle=30, scale=0.6)))
+        np.testing.assert_allclose(np.sort(chunks.reshape(-1, 4), axis=0),
+                                   np.sort(recursive.reshape(-1, 4), axis=0), atol=1e-9)
+        # Defaults still come from the module configuration
+        np.testing.assert_array_equal(default, get_tree_segments_vectorized(
+            0, 0, 90, 100, 6, branch_angle=45, scale=0.7))
+
+    def test_module_defaults_read_at_call_time(self):
+        expected = get_tree_segments_vectorized(0, 0, 90, 100, 6, branch_angle=30, scale=0.6)
+        recursive = np.array(get_tree_segments(0, 0, 90, 100, 6, branch_angle=30, scale=0.6))
+        with patch("task2a.ANGLE", 30), patch("task2a.SCALE", 0.6):
+            np.testing.assert_array_equal(get_tree_segments_vectorized(0, 0, 90, 100, 6), expected)
+            np.testing.assert_array_equal(np.array(get_tree_segments(0, 0, 90, 100, 6)), recursive)
+            # Only the omitted parameter falls back to the module value
+            np.testing.assert_array_equal(
+                get_tree_segments_vectorized(0, 0, 90, 100, 6, scale=0.7),
+                get_tree_segments_vectorized(0, 0, 90, 100, 6, branch_angle=30, scale=0.7))
+            self.assertEqual(tree_bounds(6, exact_levels=6), tree_bounds(6, 30, 0.6, exact_levels=6))
+
+    def test_vectorized_out_buffer(self):
+        out = np.zeros((2**5 - 1, 2, 2))
+        self.assertIs(get_tree_segments_vectorized(0, 0, 90, 100, 5, out=out), out)
+        np.testing.assert_array_equal(out, get_tree_segments_vectorized(0, 0, 90, 100, 5))
+        with self.assertRaises(ValueError):
+            get_tree_segments_vectorized(0, 0, 90, 100, 4, out=out)
+        # Processes cannot write into a private array: out with workers > 1 is rejected
+        with self.assertRaises(ValueError):
+            get_tree_segments_vectorized(0, 0, 90, 100, 5, workers=2, out=out)
+        with self.assertRaises(ValueError):
+            get_tree_segments_vectorized(0, 0, 90, 100, 5, workers=2, out=np.zeros((5, 2, 2)))
+
+    def test_tree_bounds_contains_tree(self):
+        segments = get_tree_segments_vectorized(0, 0, 90, 100, 14, branch_angle=30, scale=0.8)
+        xmin, ymin, xmax, ymax = tree_bounds(14, branch_angle=30, scale=0.8, exact_levels=6)
+        points = segments.reshape(-1, 2)
+        self.assertTrue(np.all((points[:, 0] >= xmin) & (points[:, 0] <= xmax)))
+        self.assertTrue(np.all((points[:, 1] >= ymin) & (points[:, 1] <= ymax)))
+
+    def test_export_tree_formats(self):
+        expected = get_tree_segments_vectorized(0, 0, 90, 100, 8)
+        key = lambda array: np.sort(array.reshape(-1, 4), axis=0)
+        with tempfile.TemporaryDirectory() as tmp:
+            npy = os.path.join(tmp, "tree.npy")
+            export_tree(8, npy, chunk_size=16)
+            np.testing.assert_allclose(key(np.load(npy)), key(expected))
+            npz = os.path.join(tmp, "tree.npz")
+            export_tree(8, npz)
+            with np.load(npz) as archive:
+                np.testing.assert_array_equal(archive["segments"], expected)
+                self.assertEqual(float(archive["scale"]), 0.7)
+            csv = os.path.join(tmp, "tree.csv")
+            export_tree(8, csv, chunk_size=16)
+            np.testing.assert_allclose(key(np.loadtxt(csv, delimiter=",", skiprows=1)),
+                                       key(expected), atol=1e-3)
+            svg = os.path.join(tmp, "tree.svg")
+            export_tree(8, svg, chunk_size=64)
+            with open(svg) as file:
+                # Top three branches plus four 6-level subtrees, one <path> per chunk
+                self.assertEqual(file.read().count("<path"), 5)
+            with self.assertRaises(ValueError):
+                export_tree(8, os.path.join(tmp, "tree.pdf"))
+            with self.assertRaises(ValueError):
+                export_tree(0, npy)
+
+    def test_render_sweep(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            for workers in (1, 2):
+                files = render_sweep(6, [30, 45], [0.6, 0.7, 0.8], os.path.join(tmp, str(workers)),
+                                     width=40, height=30, workers=workers)
+                self.assertEqual(len(files), 6)
+                self.assertIn("a45_s0.6", files[3])
+                for path in files:
+                    self.assertEqual(imread(path).shape[:2], (30, 40))
+            # Each variant is rendered from its own parameters
+            self.assertFalse(np.array_equal(imread(files[0]), imread(files[5])))
+
+    def test_parallel_matches_sequential(self):
+        for engine in ("direct", "template"):
+            expected = get_tree_segments_vectorized(1, 2, 80, 50, 9, engine=engine)
+            parallel = get_tree_segments_vectorized(1, 2, 80, 50, 9, engine=engine, workers=2)
+            np.testing.assert_allclose(parallel, expected, atol=1e-9)
+        # The shared-memory result stays valid through its views after the array itself is gone
+        tail = parallel[-10:]
+        del parallel
+        gc.collect()
+        np.testing.assert_allclose(tail, expected[-10:], atol=1e-9)
+        # Split deeper than the tree is clamped
+        np.testing.assert_allclose(
+            get_tree_segments_vectorized(0, 0, 90, 100, 2, workers=2, split_level=5),
+            get_tree_segments_vectorized(0, 0, 90, 100, 2), atol=1e-9)
+
+    def test_lod_without_limits_matches_vectorized(self):
+        np.testing.assert_array_equal(get_tree_segments_lod(0, 0, 90, 100, 9),
+                                      get_tree_segments_vectorized(0, 0, 90, 100, 9))
+        self.assertEqual(get_tree_segments_lod(0, 0, 90, 100, 0).shape, (0, 2, 2))
+
+    def test_lod_min_length_stops_subdivision(self):
+        # Branches of level k have length 100 * 0.7^(k-1); those shorter than 40 are not split
+        segments = get_tree_segments_lod(0, 0, 90, 100, 10, min_length=40)
+        lengths = np.hypot(*(segments[:, 1] - segments[:, 0]).T)
+        self.assertEqual(len(segments), 1 + 2 + 4 + 8)
+        self.assertAlmostEqual(lengths.min(), 100 * 0.7 ** 3)
+
+    def test_lod_bounds_keeps_visible_pixels(self):
+        bounds = (-20, 230, 20, 270)
+        full = get_tree_segments_vectorized(0, 0, 90, 100, 14)
+        culled = get_tree_segments_lod(0, 0, 90, 100, 14, bounds=bounds)
+        self.assertLess(len(culled), len(full) // 4)
+        np.testing.assert_array_equal(
+            raster.render_segments(culled, 64, 64, bounds=bounds, margin=0),
+            raster.render_segments(full, 64, 64, bounds=bounds, margin=0))
+
+    def test_save_tree_view_png(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "view.png")
+            drawn = save_tree_view_png(40, path, (-20, 230, 20, 270), width=64, height=64)
+            self.assertLess(drawn, 2 ** 20)
+            image = imread(path)
+            self.assertEqual(image.shape[:2], (64, 64))
+            self.assertLess(image[..., :3].min(), 0.9)
+
+    def test_draw_tree_streaming(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "tree.png")
+            draw_tree_streaming(8, path, chunk_size=20, figsize=(3, 3), dpi=50)
+            image = imread(path)
+            self.assertEqual(image.shape[:2], (150, 150))
+            # Something other than the white background was drawn
+            self.assertLess(image[..., :3].min(), 0.9)
+            # The view is fitted to the tree, which only grows upward from the origin,
+            # so the lower quarter of the canvas is not left empty
+            self.assertLess(image[-38:, :, :3].min(), 0.9)
+
+    def test_save_tree_png(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "tree.png")
+            save_tree_png(6, path, width=64, height=48, antialias=2)
+            image = imread(path)
+            self.assertEqual(image.shape[:2], (48, 64))
+            self.assertLess(image[..., :3].min(), 0.9)
+
     @patch('task2a.plt')
     @patch('task2a.LineCollection')
     def test_draw_tree(self, mock_lc, mock_plt):
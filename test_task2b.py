@@ -2,10 +2,52 @@ import unittest
 from unittest.mock import patch, MagicMock
 import numpy as np
 import builtins
-from task2b import pythagoras_tree, pythagor_tree_plot, main
+import gc
+import os
+import tempfile
+from matplotlib.image import imread
+from task2b import (pythagoras_tree, pythagoras_tree_lod, pythagor_tree_plot, pythagor_tree_png,
+                    pythagor_tree_view_png, export_tree, render_sweep, main)
+import raster
+
+def reference_tree(ratio, nb_levels):
+    """Original per-node loop implementation, kept to check the vectorised version."""
+    from math import atan2, pi, sqrt
+    c_d = sqrt(1.0 + ratio ** 2)
+    c_1, c_2 = 1.0 / c_d, ratio / c_d
+    tr_pat = np.array([[0.0, 1.0 / (1.0 + ratio ** 2)], [1.0, 1.0 + ratio / (1.0 + ratio ** 2)]])
+    alpha1 = atan2(ratio, 1.0)
+    alpha2 = alpha1 - pi / 2.0
+    nb_elements = 2 ** (nb_levels + 1) - 1
+    pt_array = np.zeros((nb_elements, 5))
+    pt_array[0, :] = [0.0, -1.0, 0.0, 1.0, 0.0]
+    offset = 0
+    for i in range(nb_levels + 1):
+        pt_array[offset : offset + 2 ** i, 4] = i
+        offset += 2 ** i
+
+    def mat_rot(angle_rad):
+        c_a, s_a = np.cos(angle_rad), np.sin(angle_rad)
+        return np.array([[c_a, -s_a], [s_a, c_a]])
+
+    for i in range(1, nb_elements, 2):
+        j = (i + 1) // 2 - 1
+        t_m = pt_array[j, 3] * mat_rot(pt_array[j, 2]) @ tr_pat
+        t_x = t_m[0, :] + pt_array[j, 0]
+        t_y = t_m[1, :] + pt_array[j, 1]
+        pt_array[i, 0:4] = [t_x[0], t_y[0], (pt_array[j, 2] + alpha1) % (2.0 * pi), pt_array[j, 3] * c_1]
+        pt_array[i + 1, 0:4] = [t_x[1], t_y[1], (pt_array[j, 2] + alpha2) % (2.0 * pi), pt_array[j, 3] * c_2]
+    return pt_array
 
 class TestPythagorasTree(unittest.TestCase):
 
+    def test_pythagoras_tree_matches_reference(self):
+        for ratio in (1.0, 0.5, 1.7):
+            for levels in (0, 1, 2, 5, 9):
+                np.testing.assert_allclose(
+                    pythagoras_tree(ratio=ratio, nb_levels=levels),
+                    reference_tree(ratio, levels), rtol=1e-12, atol=1e-12)
+
     def test_pythagoras_tree_input_validation(self):
         with self.assertRaises(ValueError):
             pythagoras_tree(ratio=-1.0)
@@ -40,9 +82,107 @@ class TestPythagorasTree(unittest.TestCase):
             count = np.sum(tree[:, 4] == i)
             self.assertEqual(count, 2**i)
 
-    @patch('task2b.patches')
+    def test_pythagoras_tree_chunked_levels_match_reference(self):
+        with patch('task2b.LEVEL_CHUNK', 3):
+            tree = pythagoras_tree(ratio=0.7, nb_levels=6)
+        np.testing.assert_allclose(tree, reference_tree(0.7, 6), rtol=1e-12, atol=1e-12)
+
+    def test_pythagoras_tree_engines_match_direct(self):
+        for ratio in (1.0, 0.6):
+            for levels in (0, 1, 2, 5, 9):
+                expected = pythagoras_tree(ratio=ratio, nb_levels=levels)
+                for engine in ("table", "template"):
+                    tree = pythagoras_tree(ratio=ratio, nb_levels=levels, engine=engine)
+                    np.testing.assert_allclose(tree[:, [0, 1, 3, 4]], expected[:, [0, 1, 3, 4]],
+                                               atol=1e-12)
+                    np.testing.assert_allclose(np.cos(tree[:, 2]), np.cos(expected[:, 2]),
+                                               atol=1e-12)
+        with self.assertRaises(ValueError):
+            pythagoras_tree(nb_levels=3, engine="cached")
+
+    def test_pythagoras_tree_template_chunks_and_layout(self):
+        expected = pythagoras_tree(ratio=0.8, nb_levels=7, dtype=np.float32, layout="structured")
+        with patch('task2b.LEVEL_CHUNK', 4):
+            tree = pythagoras_tree(ratio=0.8, nb_levels=7, dtype=np.float32, layout="structured",
+                                   engine="template")
+        for name in ('x', 'y', 'size'):
+            np.testing.assert_allclose(tree[name], expected[name], atol=1e-5)
+        np.testing.assert_array_equal(tree['level'], expected['level'])
+
+    def test_pythagoras_tree_parallel_matches_sequential(self):
+        for engine in ("direct", "table", "template"):
+            np.testing.assert_array_equal(
+                pythagoras_tree(ratio=0.7, nb_levels=8, engine=engine, workers=2),
+                pythagoras_tree(ratio=0.7, nb_levels=8, engine=engine))
+
+    def test_pythagoras_tree_parallel_into_file(self):
+        expected = pythagoras_tree(nb_levels=7, dtype=np.float32, layout="structured")
+        with tempfile.TemporaryDirectory() as tmpdir:
+            filename = os.path.join(tmpdir, 'tree.npy')
+            tree = pythagoras_tree(nb_levels=7, dtype=np.float32, layout="structured",
+                                   out=filename, workers=2, split_level=3)
+            del tree
+            np.testing.assert_array_equal(np.load(filename), expected)
+        # Processes cannot write into a private array
+        with self.assertRaises(ValueError):
+            pythagoras_tree(nb_levels=7, out=np.zeros((2**8 - 1, 5)), workers=2)
+
+    def test_pythagoras_tree_parallel_structured_in_shared_memory(self):
+        expected = pythagoras_tree(nb_levels=7, dtype=np.float32, layout="structured")
+        tree = pythagoras_tree(nb_levels=7, dtype=np.float32, layout="structured", workers=2)
+        np.testing.assert_array_equal(tree, expected)
+        # Field views keep the shared segment alive after the array itself is gone
+        level = tree['level']
+        del tree
+        gc.collect()
+        np.testing.assert_array_equal(level, expected['level'])
+
+    def test_pythagoras_tree_float32(self):
+        tree = pythagoras_tree(nb_levels=8, dtype=np.float32)
+        self.assertEqual(tree.dtype, np.float32)
+        expected = pythagoras_tree(nb_levels=8)
+        # Angles are compared through their direction: rounding may wrap 0 to 2*pi
+        np.testing.assert_allclose(tree[:, [0, 1, 3, 4]], expected[:, [0, 1, 3, 4]],
+                                   rtol=1e-4, atol=1e-4)
+        np.testing.assert_allclose(np.cos(tree[:, 2]), np.cos(expected[:, 2]), atol=1e-4)
+        np.testing.assert_allclose(np.sin(tree[:, 2]), np.sin(expected[:, 2]), atol=1e-4)
+
+    def test_pythagoras_tree_structured_layout(self):
+        tree = pythagoras_tree(ratio=0.5, nb_levels=5, dtype=np.float32, layout="structured")
+        self.assertEqual(tree.shape, (2**6 - 1,))
+        self.assertEqual(tree.dtype['level'], np.uint8)
+        self.assertEqual(tree.dtype['x'], np.float32)
+        matrix = pythagoras_tree(ratio=0.5, nb_levels=5, dtype=np.float32)
+        for i, name in enumerate(('x', 'y', 'angle', 'size', 'level')):
+            np.testing.assert_array_equal(tree[name], matrix[:, i])
+
+    def test_pythagoras_tree_out_path_is_memmap(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            filename = os.path.join(tmpdir, 'tree.npy')
+            tree = pythagoras_tree(nb_levels=6, layout="structured", out=filename)
+            self.assertIsInstance(tree, np.memmap)
+            del tree
+            loaded = np.load(filename, mmap_mode='r')
+            np.testing.assert_allclose(loaded['x'], pythagoras_tree(nb_levels=6)[:, 0])
+            del loaded
+
+    def test_pythagoras_tree_out_array(self):
+        out = np.full((2**4 - 1, 5), np.nan)
+        tree = pythagoras_tree(nb_levels=3, out=out)
+        self.assertIs(tree, out)
+        np.testing.assert_allclose(out, reference_tree(1.0, 3), rtol=1e-12, atol=1e-12)
+
+    def test_pythagoras_tree_invalid_storage(self):
+        with self.assertRaises(ValueError):
+            pythagoras_tree(nb_levels=3, layout="columns")
+        with self.assertRaises(ValueError):
+            pythagoras_tree(nb_levels=3, out=np.zeros((10, 5)))
+        with self.assertRaises(ValueError):
+            pythagoras_tree(nb_levels=3, out=np.zeros((15, 5), dtype=np.float32))
+
+    @patch('task2b.PolyCollection')
     @patch('task2b.plt')
-    def test_pythagor_tree_plot(self, mock_plt, mock_patches):
+    def test_pythagor_tree_plot(self, mock_plt, mock_collection):
         # Configure subplots to return two values (fig, ax)
         mock_fig = MagicMock()
         mock_ax = MagicMock()
@@ -53,7 +193,97 @@ class TestPythagorasTree(unittest.TestCase):
         
         self.assertTrue(mock_plt.subplots.called)
         self.assertTrue(mock_plt.show.called)
-        self.assertTrue(mock_patches.Rectangle.called)
+        # A single collection holds every square
+        mock_collection.assert_called_once()
+        polygons = mock_collection.call_args[0][0]
+        self.assertEqual(polygons.shape, (3, 4, 2))
+        self.assertIn('facecolors', mock_collection.call_args[1])
+        mock_ax.add_collection.assert_called_once_with(mock_collection.return_value)
+
+    @patch('task2b.plt')
+    def test_pythagor_tree_plot_limits_from_data(self, mock_plt):
+        mock_plt.subplots.return_value = (MagicMock(), MagicMock())
+        tree = pythagoras_tree(nb_levels=3)
+        pythagor_tree_plot(tree)
+        xmin, xmax = mock_plt.xlim.call_args[0][0]
+        ymin, ymax = mock_plt.ylim.call_args[0][0]
+        # Trunk occupies [0, 1] x [-1, 0]
+        self.assertLess(xmin, 0)
+        self.assertGreater(xmax, 1)
+        self.assertLess(ymin, -1)
+        self.assertGreater(ymax, 0)
+
+    def test_pythagor_tree_png(self):
+        tree = pythagoras_tree(nb_levels=5)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "tree.png")
+            pythagor_tree_png(tree, path, width=80, height=60)
+            image = imread(path)
+            self.assertEqual(image.shape[:2], (60, 80))
+            self.assertLess(image[..., :3].min(), 0.9)
+
+    def test_export_tree_formats(self):
+        tree = pythagoras_tree(nb_levels=6)
+        with tempfile.TemporaryDirectory() as tmp:
+            for name in ('tree.npy', 'tree.npz', 'tree.csv', 'tree.txt', 'tree.svg'):
+                export_tree(tree, os.path.join(tmp, name))
+            np.testing.assert_array_equal(np.load(os.path.join(tmp, 'tree.npy')), tree)
+            with np.load(os.path.join(tmp, 'tree.npz')) as archive:
+                np.testing.assert_array_equal(archive['tree'], tree)
+            np.testing.assert_allclose(
+                np.loadtxt(os.path.join(tmp, 'tree.csv'), delimiter=',', skiprows=1), tree,
+                rtol=1e-5, atol=1e-6)
+            with open(os.path.join(tmp, 'tree.txt')) as file:
+                self.assertEqual(file.readline().split(), ['x', 'y', 'angle', 'size', 'level'])
+            with open(os.path.join(tmp, 'tree.svg')) as file:
+                # One filled path per level
+                self.assertEqual(file.read().count('<path fill='), 7)
+            with self.assertRaises(ValueError):
+                export_tree(tree, os.path.join(tmp, 'tree.bmp'))
+
+    def test_render_sweep(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            files = render_sweep(5, [0.5, 1.0, 1.5], tmp, width=32, height=24, workers=2)
+            self.assertEqual([os.path.basename(path) for path in files],
+                             ['tree_0000_r0.5.png', 'tree_0001_r1.png', 'tree_0002_r1.5.png'])
+            images = [imread(path) for path in files]
+            self.assertEqual(images[0].shape[:2], (24, 32))
+            self.assertFalse(np.array_equal(images[0], images[1]))
+            with self.assertRaises(ValueError):
+                render_sweep(5, [1.0, 0.0], tmp)
+
+    def test_lod_without_limits_matches_full_tree(self):
+        full = pythagoras_tree(ratio=0.7, nb_levels=8)
+        lod = pythagoras_tree_lod(ratio=0.7, nb_levels=8)
+        self.assertEqual(lod.shape, full.shape)
+        # Same squares level by level, possibly in a different order inside a level
+        np.testing.assert_allclose(np.sort(lod, axis=0), np.sort(full, axis=0), atol=1e-12)
+
+    def test_lod_min_size_stops_subdivision(self):
+        # With ratio 0.5 the right branch shrinks faster and is split less deeply
+        tree = pythagoras_tree_lod(ratio=0.5, nb_levels=20, min_size=0.1)
+        self.assertLess(len(tree), 2 ** 21 - 1)
+        # Every child comes from a parent of size >= 0.1 scaled by at least c_2
+        self.assertTrue(np.all(tree[tree[:, 4] > 0, 3] >= 0.1 * 0.5 / np.sqrt(1.25) - 1e-12))
+
+    def test_lod_bounds_keeps_visible_pixels(self):
+        bounds = (-0.6, 1.6, 0.2, 2.4)
+        full = pythagoras_tree(nb_levels=10)
+        culled = pythagoras_tree_lod(nb_levels=10, bounds=bounds)
+        self.assertLess(len(culled), len(full) // 2)
+        np.testing.assert_array_equal(
+            raster.render_squares(culled, 64, 64, bounds=bounds, margin=0, max_level=10),
+            raster.render_squares(full, 64, 64, bounds=bounds, margin=0))
+
+    def test_pythagor_tree_view_png(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "view.png")
+            drawn = pythagor_tree_view_png(path, (-0.6, 1.6, 0.2, 2.4), nb_levels=40,
+                                           width=64, height=64)
+            self.assertLess(drawn, 2 ** 16)
+            image = imread(path)
+            self.assertEqual(image.shape[:2], (64, 64))
+            self.assertLess(image[..., :3].min(), 0.9)
 
     @patch('builtins.input', side_effect=['5'])
     @patch('builtins.print')
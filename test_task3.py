@@ -1,5 +1,13 @@
+import gc
+import os
+import random
+import tempfile
 import unittest
-from task3 import dijkstra, create_graph
+import numpy as np
+from task3 import (CSR_ENGINES, QUEUES, CSRGraph, IndexedHeap, Landmarks, all_pairs, astar,
+                   bidirectional_shortest_path, create_graph, dijkstra, dijkstra_csr, euclidean_heuristic,
+                   grid_coordinates, grid_graph, manhattan_heuristic, multi_source_dijkstra, nearest_facility,
+                   random_csr_graph, reverse_graph, shortest_path)
 
 class TestDijkstra(unittest.TestCase):
 
@@ -70,5 +78,322 @@ class TestDijkstra(unittest.TestCase):
                 self.assertIsInstance(neighbor, str)
                 self.assertIsInstance(weight, int)
 
+    def test_queues_agree(self):
+        graph = random_csr_graph(500, 3000, seed=2).to_dict()
+        expected = dijkstra(graph, "0")
+        for queue in QUEUES:
+            for arity in (2, 3, 8):
+                self.assertEqual(dijkstra(graph, "0", queue=queue, arity=arity), expected)
+        with self.assertRaises(ValueError):
+            dijkstra(graph, "0", queue="fibonacci")
+
+    def test_indexed_queue_stays_bounded(self):
+        # Dense complete graph: every relaxation improves a pending vertex
+        graph = {str(u): {str(v): (v - u) ** 2 if v > u else 10000 for v in range(50) if v != u}
+                 for u in range(50)}
+        lazy, indexed = {}, {}
+        self.assertEqual(dijkstra(graph, "0", stats=lazy), dijkstra(graph, "0", queue="indexed", stats=indexed))
+        self.assertEqual(lazy["settled"], 50)
+        self.assertEqual(indexed["settled"], 50)
+        self.assertLess(indexed["peak_queue"], 50)
+        self.assertGreater(lazy["peak_queue"], indexed["peak_queue"])
+
+class TestShortestPath(unittest.TestCase):
+
+    def setUp(self):
+        self.graph = {
+            "A": {"B": 2, "C": 4},
+            "B": {"C": 1, "D": 7},
+            "C": {"E": 3},
+            "D": {},
+            "E": {"D": 1},
+            "F": {"A": 1}
+        }
+
+    def assertValidPath(self, graph, path, length):
+        self.assertEqual(sum(graph[u][v] for u, v in zip(path, path[1:])), length)
+
+    def test_path_reconstruction(self):
+        for search in (shortest_path, bidirectional_shortest_path):
+            self.assertEqual(search(self.graph, "A", "D"), (7, ["A", "B", "C", "E", "D"]))
+            self.assertEqual(search(self.graph, "A", "A"), (0, ["A"]))
+            self.assertEqual(search(self.graph, "D", "A"), (float("infinity"), []))
+            with self.assertRaises(KeyError):
+                search(self.graph, "A", "Z")
+
+    def test_early_exit_settles_fewer_vertices(self):
+        graph = grid_graph(30, 30, seed=4)
+        full, early, both = {}, {}, {}
+        dijkstra(graph, "0,0", stats=full)
+        shortest_path(graph, "0,0", "5,5", early)
+        bidirectional_shortest_path(graph, "0,0", "5,5", stats=both)
+        self.assertEqual(full["settled"], 900)
+        self.assertLess(early["settled"], full["settled"])
+        self.assertLess(both["settled"], early["settled"])
+
+    def test_matches_dijkstra_on_random_pairs(self):
+        rng = random.Random(5)
+        graph = random_csr_graph(300, 900, max_weight=20, seed=5).to_dict()
+        reverse = reverse_graph(graph)
+        for _ in range(30):
+            source, target = rng.choice(list(graph)), rng.choice(list(graph))
+            expected = dijkstra(graph, source)[target]
+            for length, path in (shortest_path(graph, source, target),
+                                 bidirectional_shortest_path(graph, source, target, reverse)):
+                self.assertEqual(length, expected)
+                if path:
+                    self.assertEqual((path[0], path[-1]), (source, target))
+                    self.assertValidPath(graph, path, length)
+
+    def test_reverse_graph(self):
+        reverse = reverse_graph(self.graph)
+        self.assertEqual(reverse["D"], {"B": 7, "E": 1})
+        self.assertEqual(reverse["F"], {})
+        self.assertEqual(reverse_graph(reverse), self.graph)
+
+class TestAStar(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.graph = grid_graph(25, 25, seed=6)
+        cls.coordinates = grid_coordinates(25, 25)
+        cls.landmarks = Landmarks.build(cls.graph, count=4, seed=6)
+        rng = random.Random(6)
+        cls.pairs = [(rng.choice(list(cls.graph)), rng.choice(list(cls.graph))) for _ in range(15)]
+
+    def heuristics(self):
+        return (None, euclidean_heuristic(self.coordinates), manhattan_heuristic(self.coordinates),
+                self.landmarks)
+
+    def test_optimal_with_every_heuristic_and_queue(self):
+        for source, target in self.pairs:
+            expected = shortest_path(self.graph, source, target)[0]
+            for heuristic in self.heuristics():
+                for queue in QUEUES:
+                    length, path = astar(self.graph, source, target, heuristic, queue=queue)
+                    self.assertEqual(length, expected)
+                    self.assertEqual((path[0], path[-1]), (source, target))
+                    self.assertEqual(sum(self.graph[u][v] for u, v in zip(path, path[1:])), length)
+
+    def test_heuristics_reduce_expansions(self):
+        source, target = "0,0", "24,24"
+        expanded = []
+        for heuristic in (None, manhattan_heuristic(self.coordinates), self.landmarks):
+            stats = {}
+            astar(self.graph, source, target, heuristic, stats=stats)
+            expanded.append(stats["expanded"])
+        self.assertEqual(expanded, sorted(expanded, reverse=True))
+        self.assertLess(expanded[-1], expanded[0])
+
+    def test_landmark_bounds_are_admissible(self):
+        for source, _ in self.pairs[:5]:
+            distances = dijkstra(self.graph, source)
+            for target, distance in distances.items():
+                self.assertLessEqual(self.landmarks(source, target), distance)
+
+    def test_landmarks_persist(self):
+        with tempfile.TemporaryDirectory() as directory:
+            filename = os.path.join(directory, "landmarks.npz")
+            self.landmarks.save(filename)
+            loaded = Landmarks.load(filename)
+        self.assertEqual(loaded.landmarks, self.landmarks.landmarks)
+        self.assertEqual(loaded.names, self.landmarks.names)
+        np.testing.assert_array_equal(loaded.forward, self.landmarks.forward)
+        for source, target in self.pairs:
+            self.assertEqual(loaded(source, target), self.landmarks(source, target))
+
+    def test_landmarks_unreachable(self):
+        graph = {"A": {"B": 1}, "B": {}, "C": {"A": 2}}
+        landmarks = Landmarks.build(graph, count=3, seed=0)
+        self.assertEqual(sorted(landmarks.landmarks), ["A", "B", "C"])
+        self.assertEqual(landmarks("B", "A"), float("infinity"))
+        self.assertEqual(astar(graph, "B", "A", landmarks), (float("infinity"), []))
+        self.assertEqual(astar(graph, "C", "B", landmarks), (3, ["C", "A", "B"]))
+
+class TestMultiSource(unittest.TestCase):
+
+    def setUp(self):
+        self.graph = random_csr_graph(200, 800, max_weight=20, seed=7).to_dict()
+        self.sources = ["3", "50", "199"]
+
+    def test_multi_source_is_minimum_over_sources(self):
+        single = [dijkstra(self.graph, source) for source in self.sources]
+        expected = {vertex: min(distances[vertex] for distances in single) for vertex in self.graph}
+        for queue in QUEUES:
+            self.assertEqual(multi_source_dijkstra(self.graph, self.sources, queue=queue), expected)
+        self.assertEqual(multi_source_dijkstra(self.graph, ["3"]), single[0])
+        # The virtual super-source is added to a copy, not to the caller's graph
+        self.assertEqual(len(self.graph), 200)
+
+    def test_nearest_facility_labels(self):
+        nearest = nearest_facility(self.graph, self.sources)
+        expected = multi_source_dijkstra(self.graph, self.sources)
+        for vertex, (distance, facility) in nearest.items():
+            self.assertEqual(distance, expected[vertex])
+            if facility is None:
+                self.assertEqual(distance, float("infinity"))
+            else:
+                self.assertEqual(dijkstra(self.graph, facility)[vertex], distance)
+        self.assertEqual(nearest["50"], (0, "50"))
+
+    def test_unknown_source(self):
+        with self.assertRaises(KeyError):
+            multi_source_dijkstra(self.graph, ["A"])
+        with self.assertRaises(KeyError):
+            nearest_facility(self.graph, ["A"])
+
+class TestAllPairs(unittest.TestCase):
+
+    def setUp(self):
+        self.csr = random_csr_graph(150, 500, seed=8)
+        self.expected = np.array([dijkstra_csr(self.csr, source) for source in range(150)])
+
+    def test_serial_matches_single_source(self):
+        np.testing.assert_array_equal(all_pairs(self.csr), self.expected)
+        graph = {"A": {"B": 1}, "B": {}, "C": {"A": 2}}
+        np.testing.assert_array_equal(all_pairs(graph, ["C", "B"]), [[2, 3, 0], [np.inf, 0, np.inf]])
+
+    def test_parallel_writes_preallocated_matrix(self):
+        sources = list(range(0, 150, 7))
+        with tempfile.TemporaryDirectory() as tmpdir:
+            for engine in CSR_ENGINES:
+                filename = os.path.join(tmpdir, f"{engine}.npy")
+                out = np.lib.format.open_memmap(filename, mode="w+", shape=(len(sources), 150))
+                result = all_pairs(self.csr, sources, workers=2, engine=engine, out=out)
+                self.assertIs(result, out)
+                np.testing.assert_array_equal(out, self.expected[sources])
+                del out, result
+                np.testing.assert_array_equal(np.load(filename), self.expected[sources])
+
+    def test_parallel_result_in_shared_memory(self):
+        result = all_pairs(self.csr, workers=2)
+        np.testing.assert_array_equal(result, self.expected)
+        # Row views keep the shared segment alive after the matrix itself is gone
+        row = result[-1]
+        del result
+        gc.collect()
+        np.testing.assert_array_equal(row, self.expected[-1])
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            all_pairs(self.csr, [0, 1], out=np.zeros((2, 149)))
+        with self.assertRaises(ValueError):
+            all_pairs(self.csr, [0, 1], out=np.zeros((2, 150), dtype=np.float32))
+        with self.assertRaises(ValueError):
+            all_pairs(self.csr, [0], engine="fast")
+        # Worker processes cannot write into a private array
+        with self.assertRaises(ValueError):
+            all_pairs(self.csr, [0, 1], workers=2, out=np.zeros((2, 150)))
+        with tempfile.TemporaryDirectory() as tmpdir:
+            whole = np.lib.format.open_memmap(os.path.join(tmpdir, "m.npy"), mode="w+", shape=(3, 150))
+            with self.assertRaises(ValueError):
+                all_pairs(self.csr, [0, 1], workers=2, out=whole[1:])
+            del whole
+        with self.assertRaises(KeyError):
+            all_pairs(self.csr, ["x"])
+
+class TestIndexedHeap(unittest.TestCase):
+
+    def test_pop_order_matches_sorted(self):
+        rng = random.Random(3)
+        for arity in (2, 4, 5):
+            heap = IndexedHeap(arity)
+            priorities = {}
+            for item in range(300):
+                priorities[item] = rng.random()
+                heap.push(item, priorities[item])
+            for item in rng.sample(range(300), 100):
+                priorities[item] /= 2
+                self.assertTrue(heap.push(item, priorities[item]))
+            popped = [heap.pop() for _ in range(len(heap))]
+            self.assertEqual(popped, sorted((p, i) for i, p in priorities.items()))
+
+    def test_decrease_key_only_decreases(self):
+        heap = IndexedHeap()
+        heap.push("A", 5)
+        heap.push("B", 3)
+        self.assertFalse(heap.push("A", 7))
+        self.assertEqual(heap.priority("A"), 5)
+        self.assertTrue(heap.push("A", 1))
+        self.assertEqual(len(heap), 2)
+        self.assertIn("B", heap)
+        self.assertEqual(heap.peek(), (1, "A"))
+        self.assertEqual(heap.pop(), (1, "A"))
+        self.assertNotIn("A", heap)
+        self.assertEqual(heap.pop(), (3, "B"))
+        with self.assertRaises(IndexError):
+            heap.pop()
+        with self.assertRaises(ValueError):
+            IndexedHeap(1)
+
+class TestCSRGraph(unittest.TestCase):
+
+    def setUp(self):
+        self.graph = {
+            "A": {"B": 2, "C": 4},
+            "B": {"C": 1, "D": 7},
+            "C": {"E": 3},
+            "D": {},
+            "E": {"D": 1},
+            "F": {"A": 1}
+        }
+
+    def test_from_dict_layout(self):
+        csr = CSRGraph.from_dict(self.graph)
+        self.assertEqual(csr.names, ["A", "B", "C", "D", "E", "F"])
+        self.assertEqual(csr.offsets.tolist(), [0, 2, 4, 5, 5, 6, 7])
+        self.assertEqual(csr.num_edges, 7)
+        targets, weights = csr.neighbors("B")
+        self.assertEqual(targets.tolist(), [2, 3])
+        self.assertEqual(weights.tolist(), [1, 7])
+        self.assertEqual(csr.to_dict(), self.graph)
+
+    def test_neighbor_only_vertices_are_interned(self):
+        csr = CSRGraph.from_dict({"A": {"B": 1}})
+        self.assertEqual(csr.names, ["A", "B"])
+        self.assertEqual(csr.as_dict(dijkstra_csr(csr, "A")), {"A": 0, "B": 1})
+
+    def test_engines_match_dict_dijkstra(self):
+        csr = CSRGraph.from_dict(self.graph)
+        for engine in CSR_ENGINES:
+            for start in self.graph:
+                self.assertEqual(csr.as_dict(dijkstra_csr(csr, start, engine=engine)),
+                                 dijkstra(self.graph, start))
+
+    def test_random_graph_matches_dict_dijkstra(self):
+        graph = create_graph()
+        csr = CSRGraph.from_dict(graph)
+        for engine in CSR_ENGINES:
+            self.assertEqual(csr.as_dict(dijkstra_csr(csr, "A", engine=engine)), dijkstra(graph, "A"))
+
+    def test_large_random_graph_engines_agree(self):
+        csr = random_csr_graph(2000, 8000, seed=1)
+        expected = dijkstra(csr.to_dict(), "0")
+        for engine in CSR_ENGINES:
+            np.testing.assert_array_equal(dijkstra_csr(csr, "0", engine=engine),
+                                          [expected[name] for name in csr.names])
+        for delta in (0, 1, 1e9):
+            np.testing.assert_array_equal(dijkstra_csr(csr, 0, engine="delta", delta=delta),
+                                          dijkstra_csr(csr, 0))
+
+    def test_from_edges_groups_by_source(self):
+        csr = CSRGraph.from_edges(3, [2, 0, 2, 1], [0, 1, 1, 2], [5, 1, 2, 3])
+        self.assertEqual(csr.offsets.tolist(), [0, 1, 2, 4])
+        self.assertEqual(csr.targets.tolist(), [1, 2, 0, 1])
+        self.assertEqual(csr.to_dict(), {"0": {"1": 1}, "1": {"2": 3}, "2": {"0": 5, "1": 2}})
+
+    def test_invalid_input(self):
+        csr = CSRGraph.from_dict(self.graph)
+        with self.assertRaises(KeyError):
+            dijkstra_csr(csr, "Z")
+        with self.assertRaises(KeyError):
+            dijkstra_csr(csr, 6)
+        with self.assertRaises(ValueError):
+            dijkstra_csr(csr, "A", engine="fast")
+        with self.assertRaises(ValueError):
+            CSRGraph.from_dict({"A": {"B": -1}})
+        with self.assertRaises(ValueError):
+            CSRGraph.from_edges(2, [0, 2], [1, 0], [1, 1])
+
 if __name__ == '__main__':
     unittest.main()